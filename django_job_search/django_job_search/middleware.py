@@ -0,0 +1,36 @@
+"""
+Middleware of the project which isn't part of an app.
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import underscoreize
+
+
+class CamelCaseQueryParamsMiddleware:
+    """
+    Convert camelCase query parameters to snake_case, like the CamelCaseMiddleWare
+    of djangorestframework_camel_case. Unlike that one, it runs natively in async
+    requests, so the ASGI server doesn't switch to a thread to call it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.underscoreize_query_params(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self.underscoreize_query_params(request)
+        return await self.get_response(request)
+
+    @staticmethod
+    def underscoreize_query_params(request):
+        if request.GET:
+            request.GET = underscoreize(request.GET, **api_settings.JSON_UNDERSCOREIZE)
@@ -0,0 +1,98 @@
+"""
+This module counts the use of the Postgres and Redis connection pools.
+
+Postgres connections are persistent (CONN_MAX_AGE) and checked before reuse
+(CONN_HEALTH_CHECKS), so the counters show how many connections were opened,
+how many of them replaced a connection which expired or broke, and how many
+requests reused an open connection.
+
+Redis connections come from a bounded blocking pool shared by the cache and
+every other client of django_redis in the process. The counters show checkouts,
+checkouts which had to wait for a free connection, opened connections
+and reconnects.
+
+The counters are kept per process.
+"""
+import threading
+from collections import Counter
+
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from redis import BlockingConnectionPool, Connection
+
+
+class PoolStats:
+    """Thread-safe counters."""
+
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counts[name] += value
+
+    def snapshot(self):
+        """Return the counters as a {'pool': {'counter': value}} dict."""
+        with self._lock:
+            counts = dict(self._counts)
+
+        result = {}
+        for name, value in counts.items():
+            pool, _, counter = name.partition('.')
+            result.setdefault(pool, {})[counter] = value
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+
+stats = PoolStats()
+
+
+class CountingConnection(Connection):
+    """Redis connection which counts opened sockets."""
+    has_connected = False
+
+    def _connect(self):
+        sock = super()._connect()
+        stats.increment('redis.reconnects' if self.has_connected else 'redis.connections')
+        self.has_connected = True
+        return sock
+
+
+class CountingBlockingConnectionPool(BlockingConnectionPool):
+    """
+    Bounded Redis connection pool which waits up to `timeout` seconds
+    for a free connection, and counts checkouts and waits.
+    """
+
+    def __init__(self, connection_class=Connection, **kwargs):
+        if connection_class is Connection:
+            connection_class = CountingConnection
+        super().__init__(connection_class=connection_class, **kwargs)
+
+    def get_connection(self, *args, **kwargs):
+        stats.increment('redis.checkouts')
+        if self.pool.empty():
+            stats.increment('redis.waits')
+        return super().get_connection(*args, **kwargs)
+
+
+@receiver(connection_created)
+def count_database_connection(sender, connection, **kwargs):
+    """Count opened database connections, and the ones which replaced a closed connection."""
+    stats.increment('postgres.reconnects' if getattr(connection, 'has_connected', False) else 'postgres.connections')
+    connection.has_connected = True
+
+
+@receiver(request_started)
+def count_reused_database_connections(sender, **kwargs):
+    """Count requests which start with an open persistent connection."""
+    # Django's own receiver has already closed the connections which are too old.
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is not None:
+            stats.increment('postgres.reuses')
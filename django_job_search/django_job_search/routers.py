@@ -0,0 +1,71 @@
+"""
+This module routes database queries between the primary and its read replicas.
+
+Queries go to the primary (`default`) unless replica reads were enabled for the
+current request with use_replica_reads(), which picks one of the replicas listed
+in settings.DATABASE_REPLICAS. A write within the request switches its remaining
+reads back to the primary.
+
+pin_to_primary() keeps a user on the primary for settings.DATABASE_REPLICA_LAG
+seconds after a write, so users always read their own writes.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+PIN_KEY_PREFIX = 'db-primary-pin'
+
+# Alias of the replica which serves the reads of the current request, if any.
+_replica = ContextVar('replica', default=None)
+
+
+@contextmanager
+def use_replica_reads():
+    """Route reads within the block to a randomly chosen replica, if there are any."""
+    replicas = settings.DATABASE_REPLICAS
+    token = _replica.set(random.choice(replicas) if replicas else None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+def get_replica():
+    """Return the alias of the replica which serves the current reads, or None."""
+    return _replica.get()
+
+
+def _get_pin_key(user):
+    return f'{PIN_KEY_PREFIX}:{user.pk}'
+
+
+def pin_to_primary(user):
+    """Serve the reads of the user from the primary until replicas catch up with its writes."""
+    if settings.DATABASE_REPLICAS:
+        cache.set(_get_pin_key(user), True, timeout=settings.DATABASE_REPLICA_LAG)
+
+
+def is_pinned_to_primary(user):
+    """Check whether the user has written recently and must read from the primary."""
+    return bool(settings.DATABASE_REPLICAS) and cache.get(_get_pin_key(user), False)
+
+
+class PrimaryReplicaRouter:
+    """
+    Route reads to the replica chosen for the current request and everything else
+    to the primary. Replicas contain the same data, so relations are always allowed.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _replica.get()
+
+    def db_for_write(self, model, **hints):
+        # Read the data written by this request from the primary.
+        _replica.set(None)
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
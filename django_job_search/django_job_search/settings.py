@@ -12,9 +12,9 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = os.getenv('DJANGO_SECRET_KEY')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.getenv('DJANGO_DEBUG', '1') == '1'
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [host for host in os.getenv('DJANGO_ALLOWED_HOSTS', '').split(',') if host]
 
 # Application definition
 
@@ -25,6 +25,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # libraries
     'rest_framework',
@@ -54,7 +55,7 @@ MIDDLEWARE += [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'djangorestframework_camel_case.middleware.CamelCaseMiddleWare',
+    'django_job_search.middleware.CamelCaseQueryParamsMiddleware',
 ]
 
 ROOT_URLCONF = 'django_job_search.urls'
@@ -128,13 +129,49 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': os.getenv('POSTGRES_HOST'),
         'PORT': os.getenv('POSTGRES_PORT'),
+        # Keep connections open between requests of a worker (0 closes them after every request)
+        # and check them before reuse, so a connection broken meanwhile is replaced transparently.
+        'CONN_MAX_AGE': int(os.getenv('POSTGRES_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': os.getenv('POSTGRES_CONN_HEALTH_CHECKS', '1') == '1',
     }
 }
 
+# Read replicas of the default database, e.g. POSTGRES_REPLICA_HOSTS=replica-1:5432,replica-2
+# Reads of safe API requests are routed to them by django_job_search.routers.PrimaryReplicaRouter.
+POSTGRES_REPLICA_HOSTS = [host for host in os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',') if host]
+POSTGRES_REPLICA_NAME = os.getenv('POSTGRES_REPLICA_NAME', DATABASES['default']['NAME'])
+
+for number, replica_host in enumerate(POSTGRES_REPLICA_HOSTS, start=1):
+    host, _, port = replica_host.rpartition(':') if ':' in replica_host else (replica_host, '', '')
+    DATABASES[f'replica_{number}'] = {
+        **DATABASES['default'],
+        'NAME': POSTGRES_REPLICA_NAME,
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        # Replicas of the primary database mirror its test database in tests, and aren't read
+        # by them (see django_job_search.test_runner). Separate databases get test databases.
+        'TEST': {'MIRROR': 'default'} if POSTGRES_REPLICA_NAME == DATABASES['default']['NAME'] else {},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['django_job_search.routers.PrimaryReplicaRouter']
+
+TEST_RUNNER = 'django_job_search.test_runner.TestRunner'
+
+# Seconds for which replicas may lag behind the primary. Users read from the primary
+# for this long after their writes, and responses read from replicas aren't cached
+# if the data they contain may have changed within this window.
+DATABASE_REPLICA_LAG = float(os.getenv('POSTGRES_REPLICA_LAG', 5))
+
 # Redis settings
 REDIS_HOST = os.environ.get('REDIS_HOST', 'localhost')
 REDIS_PORT = os.environ.get('REDIS_PORT', '6379')
 REDIS_DB = os.environ.get('REDIS_DB', '0')
+# Connections of the process-wide pool, and seconds to wait for a free one before failing
+REDIS_MAX_CONNECTIONS = int(os.environ.get('REDIS_MAX_CONNECTIONS', 50))
+REDIS_POOL_TIMEOUT = float(os.environ.get('REDIS_POOL_TIMEOUT', 5))
+REDIS_SOCKET_TIMEOUT = float(os.environ.get('REDIS_SOCKET_TIMEOUT', 5))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.environ.get('REDIS_HEALTH_CHECK_INTERVAL', 30))
 
 # Caching
 
@@ -144,10 +181,32 @@ CACHES = {
         "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "CONNECTION_POOL_CLASS": "django_job_search.pools.CountingBlockingConnectionPool",
+            "CONNECTION_POOL_KWARGS": {
+                "max_connections": REDIS_MAX_CONNECTIONS,
+                "timeout": REDIS_POOL_TIMEOUT,
+                "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+            },
+            "SOCKET_CONNECT_TIMEOUT": REDIS_SOCKET_TIMEOUT,
+            "SOCKET_TIMEOUT": REDIS_SOCKET_TIMEOUT,
         }
     }
 }
 
+# Cached API responses are invalidated by model signals, so the timeout only bounds memory usage
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', 60 * 60 * 6))
+
+# Tag versions outlive the responses stored with them, an expired version only invalidates its tag
+CACHE_TAG_TIMEOUT = int(os.environ.get('CACHE_TAG_TIMEOUT', API_CACHE_TIMEOUT * 2))
+
+# Number of degree, organization and location name lookups cached in each process, see job_search.references
+REFERENCE_CACHE_SIZE = int(os.environ.get('REFERENCE_CACHE_SIZE', 4096))
+# Seconds a process trusts the version of the cached lookups, i.e. how late it can see renames in other processes
+REFERENCE_VERSION_TIMEOUT = float(os.environ.get('REFERENCE_VERSION_TIMEOUT', 1))
+
+# Job lists estimated at more rows than this are counted with the planner estimate, 0 always counts exactly
+API_COUNT_ESTIMATE_THRESHOLD = int(os.environ.get('API_COUNT_ESTIMATE_THRESHOLD', 10000))
+
 # Elasticsearch settings
 ELASTICSEARCH_HOST = os.environ.get('ELASTICSEARCH_HOST', 'localhost')
 ELASTICSEARCH_PORT = os.environ.get('ELASTICSEARCH_PORT', '9200')
@@ -161,10 +220,19 @@ ELASTICSEARCH_DSL = {
     },
 }
 
+# `jobs` is an alias to the latest versioned index built by the rebuild_jobs_index command
 ELASTICSEARCH_INDEX_NAMES = {
     'search.documents.JobDocument': 'jobs',
 }
 
+# Model changes are queued after commit and indexed in bulk by the sync_search_index command
+ELASTICSEARCH_DSL_SIGNAL_PROCESSOR = 'search.signals.DeferredSignalProcessor'
+ELASTICSEARCH_SYNC_INTERVAL = float(os.environ.get('ELASTICSEARCH_SYNC_INTERVAL', 1))
+ELASTICSEARCH_SYNC_BATCH_SIZE = int(os.environ.get('ELASTICSEARCH_SYNC_BATCH_SIZE', 500))
+
+# Concurrent connections of the async client of each ASGI worker, which bound its concurrent searches
+ELASTICSEARCH_ASYNC_CONNECTIONS = int(os.environ.get('ELASTICSEARCH_ASYNC_CONNECTIONS', 100))
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -242,7 +310,7 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
+        'job_search.api.renderers.CamelCaseJSONRenderer',
         'djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
@@ -0,0 +1,19 @@
+"""
+This module provides the test runner of the project.
+
+Replicas of the primary database are configured as test mirrors of `default`, so the
+tests never touch the databases of the settings. A mirror is a separate connection to
+the test database though, which doesn't see the data of the test transactions, so the
+runner reads from separate replica databases only (see job_search.tests.test_routers).
+"""
+from django.conf import settings
+from django.db import connections
+from django.test.runner import DiscoverRunner
+
+
+class TestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.DATABASE_REPLICAS = [
+            alias for alias in settings.DATABASE_REPLICAS if not connections[alias].settings_dict['TEST'].get('MIRROR')
+        ]
@@ -0,0 +1,24 @@
+"""
+Views of the project which aren't part of an app.
+"""
+from django_redis import get_redis_connection
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from django_job_search.pools import stats
+
+
+class PoolStatsAPIView(APIView):
+    """View to inspect the connection pool counters of the serving process. Only for admin users."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        pools = stats.snapshot()
+
+        redis_pool = get_redis_connection().connection_pool
+        pools.setdefault('redis', {}).update({
+            'max_connections': redis_pool.max_connections,
+            'open_connections': len(redis_pool._connections),
+        })
+        return Response(pools)
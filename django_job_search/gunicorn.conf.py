@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration of the production server.
+
+The ASGI application runs in uvicorn workers, so the async views serve many
+concurrent requests per worker:
+
+    gunicorn django_job_search.asgi:application
+
+The WSGI application can be served with the same settings for comparison:
+
+    gunicorn django_job_search.wsgi:application --worker-class gthread
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'uvicorn.workers.UvicornWorker')
+# Used by the gthread workers of the WSGI application.
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+accesslog = '-'
@@ -0,0 +1,256 @@
+"""
+This module contains the async read endpoints of the API, served by the ASGI server.
+
+They return the same data as the list and retrieve actions of the viewsets in
+job_search.api.views, but await the database through Django's async ORM, so
+a worker keeps serving other requests while a query runs instead of blocking
+a thread per request. Django Rest Framework views are synchronous, so these
+are plain Django views which reuse the authentication, throttling, filters,
+pagination settings and serializers of the API. Responses are not cached.
+Writes stay on the viewsets.
+"""
+import abc
+import math
+from contextlib import ExitStack
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound, Throttled, ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from django_job_search.routers import is_pinned_to_primary, use_replica_reads
+from job_search.api.filters import JobListingFilter
+from job_search.api.pagination import (
+    JobResultsCursorPagination,
+    JobResultsPagePagination,
+    LocationResultsPagePagination,
+)
+from job_search.api.renderers import CamelCaseJSONRenderer
+from job_search.api.serializers import JobDetailSerializer, JobListingSerializer, LocationSerializer
+from job_search.cache import get_tag
+from job_search.models import Degree, Job, JobListing, Location, Organization
+
+
+class AsyncAPIView(View, metaclass=abc.ABCMeta):
+    """
+    Abstract base view of the async read endpoints.
+
+    The request is authenticated and throttled like in the viewsets, then
+    get_data(), which subclasses implement, is awaited, reading from a replica unless the user is pinned
+    to the primary. The data or the API error is rendered as camelCase JSON.
+    """
+    http_method_names = ['get', 'head', 'options']
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+    renderer_class = CamelCaseJSONRenderer
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            api_request, use_replica = await sync_to_async(self.initial)(request)
+            with ExitStack() as database_routing:
+                if use_replica:
+                    database_routing.enter_context(use_replica_reads())
+                data = await self.get_data(api_request, *args, **kwargs)
+        except APIException as exc:
+            return self.handle_exception(exc)
+
+        return self.render(data)
+
+    def initial(self, request):
+        """
+        Authenticate and throttle the request, and check whether it can read from a replica.
+        Runs in a thread, as authentication, throttling and the primary pin use the database and cache.
+        """
+        api_request = Request(request, authenticators=[auth() for auth in self.authentication_classes])
+        user = api_request.user
+
+        waits = [
+            throttle.wait() for throttle in (throttle_class() for throttle_class in self.throttle_classes)
+            if not throttle.allow_request(api_request, self)
+        ]
+        if waits:
+            raise Throttled(max((wait for wait in waits if wait is not None), default=None))
+
+        return api_request, not (user.is_authenticated and is_pinned_to_primary(user))
+
+    @abc.abstractmethod
+    async def get_data(self, request, *args, **kwargs):
+        """Return the data of the response."""
+
+    def handle_exception(self, exc):
+        """Render an API error like the default exception handler of Django Rest Framework."""
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        response = self.render(data, status=exc.status_code)
+        if getattr(exc, 'wait', None):
+            response['Retry-After'] = str(math.ceil(exc.wait))
+        return response
+
+    def render(self, data, status=200):
+        renderer = self.renderer_class()
+        return HttpResponse(renderer.render(data), status=status, content_type=renderer.media_type)
+
+
+class AsyncListAPIView(AsyncAPIView):
+    """
+    Base view of the async list endpoints. The queryset is filtered with
+    the filterset_class, if any, then the filter_backends, and paginated by page
+    number like the pagination_class of the matching viewset, or with the
+    cursor_pagination_class, if any, when the client passes `?pagination=cursor`.
+    """
+    queryset = None
+    filterset_class = None
+    filter_backends = ()
+    pagination_class = None
+    cursor_pagination_class = None
+    pagination_mode_query_param = 'pagination'
+    serializer_class = None
+
+    async def get_data(self, request, *args, **kwargs):
+        queryset = await self.filter_queryset(request, self.get_queryset())
+        if (
+            self.cursor_pagination_class is not None
+            and request.query_params.get(self.pagination_mode_query_param) == 'cursor'
+        ):
+            return await self.get_cursor_page_data(request, queryset)
+
+        count, page = await self.paginate_queryset(request, queryset)
+        return {
+            'count': count,
+            **self.get_page_links(request, page),
+            'results': self.serializer_class(page.results, many=True).data,
+        }
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    async def filter_queryset(self, request, queryset):
+        if self.filterset_class is not None:
+            filterset = self.filterset_class(request.query_params, queryset=queryset, request=request)
+            # Validation of the filters may read from the database.
+            if not await sync_to_async(filterset.is_valid)():
+                raise ValidationError(filterset.errors)
+            queryset = filterset.qs
+
+        for backend in self.filter_backends:
+            queryset = backend().filter_queryset(request, queryset, self)
+        return queryset
+
+    async def get_cursor_page_data(self, request, queryset):
+        """Return the data of the cursor page requested by the client, like the cursor_pagination_class."""
+        paginator = self.cursor_pagination_class()
+        # The paginator fetches the keyset page through the sync ORM.
+        results = await sync_to_async(paginator.paginate_queryset)(queryset, request, self)
+        return {
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+            'results': self.serializer_class(results, many=True).data,
+        }
+
+    def get_page(self, request, count):
+        """Return the page number and size requested by the client, validated against the count."""
+        paginator = self.pagination_class()
+        page_size = paginator.get_page_size(request)
+        num_pages = max(math.ceil(count / page_size), 1)
+
+        page_number = request.query_params.get(paginator.page_query_param) or 1
+        if page_number in paginator.last_page_strings:
+            page_number = num_pages
+        try:
+            page_number = int(page_number)
+        except ValueError:
+            raise NotFound(paginator.invalid_page_message)
+        if not 1 <= page_number <= num_pages:
+            raise NotFound(paginator.invalid_page_message)
+
+        return AsyncPage(page_number, page_size, num_pages, paginator.page_query_param)
+
+    async def count_queryset(self, queryset):
+        return await queryset.acount()
+
+    async def paginate_queryset(self, request, queryset):
+        count = await self.count_queryset(queryset)
+        page = self.get_page(request, count)
+        start = (page.number - 1) * page.size
+        page.results = [instance async for instance in queryset[start:start + page.size]]
+        return count, page
+
+    def get_page_links(self, request, page):
+        url = request.build_absolute_uri()
+        next_link = previous_link = None
+        if page.number < page.num_pages:
+            next_link = replace_query_param(url, page.query_param, page.number + 1)
+        if page.number == 2:
+            previous_link = remove_query_param(url, page.query_param)
+        elif page.number > 2:
+            previous_link = replace_query_param(url, page.query_param, page.number - 1)
+        return {'next': next_link, 'previous': previous_link}
+
+
+class AsyncPage:
+    """A page of results of an async list endpoint."""
+
+    def __init__(self, number, size, num_pages, query_param):
+        self.number = number
+        self.size = size
+        self.num_pages = num_pages
+        self.query_param = query_param
+        self.results = []
+
+
+class AsyncJobListView(AsyncListAPIView):
+    """
+    List the Jobs, like the list action of JobViewSet, in the `ordering`
+    requested by the client, or from the most recently added.
+    """
+    queryset = JobListing.objects.all()
+    filterset_class = JobListingFilter
+    filter_backends = [OrderingFilter]
+    ordering = ('-date_added', '-id')
+    pagination_class = JobResultsPagePagination
+    cursor_pagination_class = JobResultsCursorPagination
+    serializer_class = JobListingSerializer
+
+    async def get_data(self, request, *args, **kwargs):
+        data = await super().get_data(request, *args, **kwargs)
+        if 'count' not in data:
+            # A cursor page, which isn't counted.
+            return data
+        return {'count': data.pop('count'), 'count_is_exact': self.count_is_exact, **data}
+
+    async def filter_queryset(self, request, queryset):
+        queryset = await super().filter_queryset(request, queryset)
+        # Ties of the ordering are broken by `id` like in cursor pagination, so the pages don't overlap.
+        return queryset.order_by(*self.cursor_pagination_class().get_ordering(request, queryset, self))
+
+    def get_validator_tags(self):
+        """The count is cached like the count of JobViewSet, see JobResultsPagePagination."""
+        return [get_tag(model) for model in (Job, Degree, Organization, Location)]
+
+    async def count_queryset(self, queryset):
+        count, self.count_is_exact = await sync_to_async(self.pagination_class().get_count)(queryset, self)
+        return count
+
+
+class AsyncJobDetailView(AsyncAPIView):
+    """Retrieve a specific Job, like the retrieve action of JobViewSet."""
+    queryset = Job.objects.select_related('degree', 'organization').prefetch_related('locations')
+    serializer_class = JobDetailSerializer
+
+    async def get_data(self, request, pk):
+        try:
+            job = await self.queryset.aget(pk=pk)
+        except ObjectDoesNotExist:
+            raise NotFound()
+        return self.serializer_class(job).data
+
+
+class AsyncLocationListView(AsyncListAPIView):
+    """List the Locations, like the list action of LocationViewSet."""
+    queryset = Location.objects.order_by('id')
+    pagination_class = LocationResultsPagePagination
+    serializer_class = LocationSerializer
@@ -0,0 +1,102 @@
+"""
+This module implements bulk creation of Jobs for the Job Search API.
+
+Instead of resolving related objects per job, the names of all degrees,
+organizations and locations of a batch are resolved at once, from the
+reference cache (see job_search.references) or with one query each,
+missing locations are created with a single INSERT, and the jobs and their
+location links are inserted with one query each. The number of queries
+does not depend on the size of the batch.
+"""
+from django.db import transaction
+
+from job_search.api.serializers import JobBulkItemSerializer
+from job_search.models import Degree, Organization, Location, Job
+from job_search.references import get_references
+from job_search.signals import jobs_bulk_created
+
+
+def bulk_create_jobs(items, user):
+    """
+    Create Jobs from a list of raw job payloads on behalf of the user.
+
+    Returns a list with one result for every item, in the input order:
+    {'id': <job id>} for created jobs and {'errors': {...}} for rejected ones.
+    """
+    results = [None] * len(items)
+
+    validated_items = {}
+    for index, item in enumerate(items):
+        serializer = JobBulkItemSerializer(data=item)
+        if serializer.is_valid():
+            validated_items[index] = serializer.validated_data
+        else:
+            results[index] = {'errors': serializer.errors}
+
+    degree_ids = {
+        name: degree.pk
+        for name, degree in get_references(Degree, {data['degree'] for data in validated_items.values()}).items()
+    }
+    organizations = {
+        name: (organization.pk, organization.creator_id)
+        for name, organization in get_references(
+            Organization, {data['organization'] for data in validated_items.values()}
+        ).items()
+    }
+
+    jobs = {}
+    for index, data in validated_items.items():
+        errors = {}
+        degree_name = data.pop('degree')
+        organization_name = data.pop('organization')
+
+        if degree_name not in degree_ids:
+            errors['degree'] = [f'Object with name={degree_name} does not exist.']
+
+        if organization_name not in organizations:
+            errors['organization'] = [f'Object with name={organization_name} does not exist.']
+        elif organizations[organization_name][1] != user.pk:
+            errors['organization'] = ['Creator of this organization is not of current user.']
+
+        if errors:
+            results[index] = {'errors': errors}
+            continue
+
+        jobs[index] = Job(
+            degree_id=degree_ids[degree_name],
+            organization_id=organizations[organization_name][0],
+            **{field: value for field, value in data.items() if field != 'locations'},
+        )
+
+    if not jobs:
+        return results
+
+    location_names = {name for index in jobs for name in validated_items[index]['locations']}
+
+    with transaction.atomic():
+        location_ids = {}
+        if location_names:
+            Location.objects.bulk_create(
+                [Location(name=name) for name in location_names],
+                ignore_conflicts=True,
+            )
+            location_ids = {
+                name: location.pk for name, location in get_references(Location, location_names).items()
+            }
+
+        Job.objects.bulk_create(jobs.values())
+
+        JobLocation = Job.locations.through
+        JobLocation.objects.bulk_create([
+            JobLocation(job_id=job.pk, location_id=location_ids[name])
+            for index, job in jobs.items()
+            for name in set(validated_items[index]['locations'])
+        ])
+
+        # bulk_create() doesn't send post_save signals.
+        jobs_bulk_created.send(sender=Job, instances=list(jobs.values()))
+
+    for index, job in jobs.items():
+        results[index] = {'id': job.pk}
+
+    return results
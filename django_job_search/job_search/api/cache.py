@@ -0,0 +1,202 @@
+"""
+This module defines response caching for the Job Search API viewsets.
+
+Responses are cached together with the tags of the objects they contain
+(see job_search.cache), and are purged by the model signals in job_search.signals
+as soon as one of those objects changes. This allows long TTLs without
+serving stale data after writes.
+
+The same tag versions validate conditional requests: responses carry an ETag
+and a Last-Modified header derived from them, and a client which sends them back
+gets a 304 Not Modified before anything is read from the database or rendered.
+"""
+import hashlib
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from django_job_search.routers import get_replica
+from job_search.cache import (
+    get_tag,
+    get_instance_tag,
+    get_tag_versions,
+    get_tag_versions_created_at,
+    tag_versions_are_current,
+    tag_versions_created_before,
+)
+
+RESPONSE_KEY_PREFIX = 'api-response'
+
+# Headers of the original response which are replayed on cache hits.
+CACHED_HEADERS = ('Content-Type', 'Vary', 'Allow')
+
+
+def get_response_cache_key(request):
+    """Return the cache key of the response for the given request."""
+    # The absolute URL, as the cached bodies contain absolute links, e.g. to the next page.
+    url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    media_type = hashlib.md5(request.accepted_media_type.encode()).hexdigest()
+    return f'{RESPONSE_KEY_PREFIX}:{url}:{media_type}'
+
+
+def cache_response(timeout=None, collection=False):
+    """
+    Cache the rendered response of a viewset action,
+    invalidated by the tags of the objects it contains.
+
+    Use collection=True for list actions, so the response is also
+    invalidated when objects are created or deleted.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            # The browsable API renders the current user into the page.
+            if getattr(request.accepted_renderer, 'format', None) == 'api':
+                return view_method(self, request, *args, **kwargs)
+
+            key = get_response_cache_key(request)
+            cached = cache.get(key)
+            if cached is not None and tag_versions_are_current(cached['tags']):
+                response = HttpResponse(cached['content'], status=cached['status'])
+                for header, value in cached['headers'].items():
+                    response[header] = value
+                return response
+
+            # Versions of the tags known upfront are taken before reading from the database,
+            # so a write which lands in the meantime invalidates this entry right away.
+            # The model of the viewset, even if an action reads from a read model of it.
+            model = self.queryset.model
+            self.cache_tags = set()
+            if collection:
+                self.cache_tags.add(get_tag(model))
+            lookup = kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+            if lookup is not None:
+                self.cache_tags.add(get_tag(model, lookup))
+            tag_versions = get_tag_versions(self.cache_tags)
+            started_at = time.time()
+
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+            tag_versions.update(get_tag_versions(self.cache_tags - tag_versions.keys()))
+
+            # A replica may not have caught up with changes of the contained objects yet,
+            # so such a response is served but isn't cached.
+            lag = settings.DATABASE_REPLICA_LAG
+            if get_replica() is not None and not tag_versions_created_before(tag_versions, started_at - lag):
+                return response
+
+            def store_response(rendered_response):
+                cache.set(key, {
+                    'content': rendered_response.content,
+                    'status': rendered_response.status_code,
+                    'headers': {
+                        header: rendered_response[header]
+                        for header in CACHED_HEADERS if rendered_response.has_header(header)
+                    },
+                    'tags': tag_versions,
+                }, timeout if timeout is not None else settings.API_CACHE_TIMEOUT)
+
+            response.add_post_render_callback(store_response)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def get_etag(tag_versions, media_type):
+    """Return a strong ETag which changes with any of the tag versions."""
+    versions = ','.join(f'{tag}={version}' for tag, version in sorted(tag_versions.items()))
+    return quote_etag(hashlib.md5(f'{media_type};{versions}'.encode()).hexdigest())
+
+
+def conditional_response(view_method):
+    """
+    Answer conditional requests (If-None-Match, If-Modified-Since) of a viewset action
+    with 304 Not Modified when none of the tags returned by get_validator_tags() of the
+    viewset changed, without reading, serializing or rendering the response.
+
+    Other responses get the ETag and Last-Modified validators of the current tag versions.
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        # The browsable API renders the current user into the page.
+        if getattr(request.accepted_renderer, 'format', None) == 'api':
+            return view_method(self, request, *args, **kwargs)
+
+        tags = self.get_validator_tags()
+        if tags is None:
+            return view_method(self, request, *args, **kwargs)
+
+        # Like for cached responses, the versions are taken before reading from the database,
+        # so a write which lands in the meantime changes the validators of the next request.
+        tag_versions = get_tag_versions(tags)
+        started_at = time.time()
+        etag = get_etag(tag_versions, request.accepted_media_type)
+        created_at = get_tag_versions_created_at(tag_versions)
+        last_modified = math.ceil(created_at) if created_at is not None else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+            # A replica may not have caught up with the changes the validators stand for yet.
+            lag = settings.DATABASE_REPLICA_LAG
+            if get_replica() is not None and not tag_versions_created_before(tag_versions, started_at - lag):
+                return response
+
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    return wrapper
+
+
+class CacheTagsMixin:
+    """
+    Viewset mixin that collects the cache tags of every serialized object
+    and of every row of a projection.
+
+    Override get_cache_tags() to also tag related objects
+    which are rendered into the response.
+    """
+    cache_tags = None
+
+    def get_cache_tags(self, instance):
+        """Return the cache tags of a serialized instance."""
+        return [get_instance_tag(instance)]
+
+    def get_validator_tags(self):
+        """
+        Return the tags whose versions change whenever the response of the current
+        request changes, for conditional_response(), or None to answer it in full.
+        """
+        return None
+
+    def add_cache_tags(self, instances):
+        """Collect the cache tags of the instances, while a response is being cached."""
+        if self.cache_tags is not None:
+            for instance in instances:
+                self.cache_tags.update(self.get_cache_tags(instance))
+
+    def get_serializer(self, *args, **kwargs):
+        if args:
+            self.add_cache_tags(args[0] if kwargs.get('many') else [args[0]])
+
+        return super().get_serializer(*args, **kwargs)
+
+    def get_projection_data(self, projection, rows):
+        # The rows of a projection (see job_search.api.projections) are tagged like instances.
+        self.add_cache_tags(rows)
+        return super().get_projection_data(projection, rows)
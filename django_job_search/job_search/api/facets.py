@@ -0,0 +1,83 @@
+"""
+This module counts the jobs per option of the filters of the job list, for the facets endpoint.
+
+The counts are aggregated from the denormalized JobListing rows with one
+GROUP BY query per facet, instead of one filtered job list request per option.
+Each facet is counted with every given filter except its own, so the counts
+of the other options of a filter tell how many jobs selecting them would list.
+"""
+from django.db.models import CharField, Count, F, Func
+from rest_framework.exceptions import ValidationError
+
+
+class Unnest(Func):
+    """Expand an array column into one row per element."""
+    function = 'unnest'
+
+
+class Facet:
+    """
+    Counts of the rows per value of `field`, for the filter `name` of a FilterSet.
+    """
+
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+
+    def get_queryset(self, queryset):
+        return queryset.order_by().values(self.field).annotate(count=Count('*')).order_by('-count', self.field)
+
+    def to_representation(self, row):
+        return {'value': row[self.field], 'count': row['count']}
+
+    def count(self, queryset):
+        """Return the value and count of every value of the facet found in the queryset."""
+        return [self.to_representation(row) for row in self.get_queryset(queryset)]
+
+
+class ArrayFacet(Facet):
+    """
+    Counts of the rows per element of the array `field`, named by
+    the element at the same position of the array `name_field`.
+    """
+
+    def __init__(self, name, field, name_field):
+        super().__init__(name, field)
+        self.name_field = name_field
+
+    def get_queryset(self, queryset):
+        # Postgres expands the two arrays of a row side by side.
+        base_field = queryset.model._meta.get_field(self.field).base_field
+        return queryset.order_by().annotate(
+            facet_value=Unnest(F(self.field), output_field=base_field.clone()),
+            facet_name=Unnest(F(self.name_field), output_field=CharField()),
+        ).values('facet_value', 'facet_name').annotate(count=Count('*')).order_by('-count', 'facet_name')
+
+    def to_representation(self, row):
+        return {'value': row['facet_value'], 'name': row['facet_name'], 'count': row['count']}
+
+
+JOB_FACETS = (
+    Facet('job_type', 'job_type'),
+    Facet('degree', 'degree_name'),
+    Facet('organization', 'organization_name'),
+    ArrayFacet('locations', 'location_ids', 'location_names'),
+)
+
+
+def count_facets(filterset, facets=JOB_FACETS):
+    """
+    Count every facet in the queryset of the filterset, filtered
+    by the data of the filterset except the filter of the facet.
+    """
+    if not filterset.is_valid():
+        raise ValidationError(filterset.errors)
+
+    counts = {}
+    for facet in facets:
+        queryset = filterset.queryset
+        for name, value in filterset.form.cleaned_data.items():
+            if name != facet.name:
+                queryset = filterset.filters[name].filter(queryset, value)
+        counts[facet.name] = facet.count(queryset)
+    return counts
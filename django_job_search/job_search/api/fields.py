@@ -1,12 +1,97 @@
+from functools import partial
+
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+from job_search.cache import get_tag, invalidate_tags
+from job_search.references import REFERENCE_FIELDS, get_references
 
 
 class SlugRelatedCreationField(serializers.SlugRelatedField):
     """Custom SlugRelatedField for creating non-existent objects."""
+    default_error_messages = {
+        'blank': 'This field may not be blank.',
+    }
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return ManySlugRelatedCreationField(**list_kwargs)
+
     def to_internal_value(self, data):
+        return self.to_internal_value_many([data])[0]
+
+    def get_instances(self, queryset, slugs):
+        """
+        Return the existing objects of the slugs by slug,
+        from the reference cache for names of the reference tables.
+        """
+        if self.slug_field == 'name' and queryset.model in REFERENCE_FIELDS:
+            return get_references(queryset.model, slugs)
+
+        return {
+            getattr(instance, self.slug_field): instance
+            for instance in queryset.filter(**{f'{self.slug_field}__in': slugs})
+        }
+
+    def validate_slug(self, data):
+        """
+        Check a slug of the input like RelatedField.run_validation() does for a single one,
+        as the slugs of a list are resolved together, without running the validation of each.
+        Returns the stripped slug, or None for an empty one which the field allows.
+        """
+        if data == '':
+            data = None
+        if data is None:
+            if not self.allow_null:
+                self.fail('null')
+            return None
+        if isinstance(data, bool) or not isinstance(data, (str, int)):
+            self.fail('invalid')
+        if isinstance(data, str):
+            data = data.strip()
+            if not data:
+                self.fail('blank')
+        return data
+
+    def to_internal_value_many(self, data):
+        """
+        Return the objects of the slugs in the given order, with one query for the existing ones
+        and a single INSERT and query for the missing ones.
+        """
         queryset = self.get_queryset()
+        slug_field = queryset.model._meta.get_field(self.slug_field)
+        slugs = [self.validate_slug(slug) for slug in data]
         try:
-            instance, _ = queryset.get_or_create(**{self.slug_field: data})
-            return instance
+            slugs = [slug if slug is None else slug_field.to_python(slug) for slug in slugs]
+            instances = self.get_instances(queryset, [slug for slug in slugs if slug is not None])
+
+            missing = [slug for slug in dict.fromkeys(slugs) if slug is not None and slug not in instances]
+            if missing:
+                # Another request may create the same objects in the meantime.
+                queryset.bulk_create(
+                    [queryset.model(**{self.slug_field: slug}) for slug in missing], ignore_conflicts=True,
+                )
+                instances.update(self.get_instances(queryset, missing))
+                # bulk_create() doesn't send post_save signals.
+                transaction.on_commit(partial(invalidate_tags, [get_tag(queryset.model)]))
         except (TypeError, ValueError):
             self.fail('invalid')
+
+        return [None if slug is None else instances[slug] for slug in slugs]
+
+
+class ManySlugRelatedCreationField(serializers.ManyRelatedField):
+    """ManyRelatedField of SlugRelatedCreationField which resolves all the slugs at once."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        return self.child_relation.to_internal_value_many(data)
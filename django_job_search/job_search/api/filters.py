@@ -1,6 +1,6 @@
 from django_filters import rest_framework as filters
 
-from job_search.models import Job
+from job_search.models import Job, JobListing, Location
 
 
 class JobFilter(filters.FilterSet):
@@ -12,3 +12,21 @@ class JobFilter(filters.FilterSet):
     class Meta:
         model = Job
         fields = ['locations', 'job_type']
+
+
+class JobListingFilter(filters.FilterSet):
+    """Filter for JobListing model, with the same parameters as JobFilter."""
+    title = filters.CharFilter(lookup_expr='icontains')
+    organization = filters.CharFilter(lookup_expr='iexact', field_name='organization_name')
+    degree = filters.CharFilter(lookup_expr='iexact', field_name='degree_name')
+    locations = filters.ModelMultipleChoiceFilter(queryset=Location.objects.all(), method='filter_locations')
+
+    def filter_locations(self, queryset, name, value):
+        """Keep jobs in any of the given locations."""
+        if not value:
+            return queryset
+        return queryset.filter(location_ids__overlap=[location.pk for location in value])
+
+    class Meta:
+        model = JobListing
+        fields = ['job_type']
@@ -1,11 +1,299 @@
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+import json
+import time
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Model, Q
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination, CursorPagination, Cursor
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from django_job_search.routers import get_replica
+from job_search.cache import get_tag_versions, tag_versions_are_current, tag_versions_created_before
+
+COUNT_KEY_PREFIX = 'api-count'
+
+
+def get_count_sql(queryset):
+    """Return the SQL and parameters which select the rows of the queryset, independently of their columns and order."""
+    queryset = queryset.order_by().values('pk')
+    return queryset.query.get_compiler(using=queryset.db).as_sql()
+
+
+def get_count_estimate(queryset):
+    """
+    Return the number of rows of the queryset estimated by the Postgres planner,
+    which derives it from the table statistics (pg_class.reltuples) without reading the rows,
+    or None on other databases.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    sql, params = get_count_sql(queryset)
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class CountedPaginator(DjangoPaginator):
+    """Django paginator with a count which is given instead of counted from the object list."""
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
 
 
 class JobResultsPagePagination(PageNumberPagination):
-    """Pagination for Job results."""
+    """
+    Pagination for Job results.
+
+    The count of a result set is cached until one of the objects returned by
+    get_validator_tags() of the view changes, keyed by the filtered count query,
+    so all its pages, and the same filters given in any order, share one COUNT(*).
+    Result sets which the Postgres planner estimates at more than
+    `count_estimate_threshold` rows get the estimate instead of an exact count.
+    `count_is_exact` in the response tells them apart. The pages after an
+    estimate which is too low are not found.
+    """
     page_size = 10
     max_page_size = 20
     page_size_query_param = "page_size"
+    django_paginator_class = CountedPaginator
+    count_estimate_threshold = settings.API_COUNT_ESTIMATE_THRESHOLD
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        count, self.count_is_exact = self.get_count(queryset, view)
+        paginator = self.django_paginator_class(queryset, page_size, count=count)
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg)
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # The browsable API should display pagination controls.
+            self.display_page_controls = True
+
+        self.request = request
+        return list(self.page)
+
+    def get_count(self, queryset, view):
+        """Return the cached, estimated or exact count of the queryset, and whether it is exact."""
+        tags = view.get_validator_tags() if hasattr(view, 'get_validator_tags') else None
+        if tags is None:
+            return self.count_queryset(queryset)
+
+        sql, params = get_count_sql(queryset)
+        key = f'{COUNT_KEY_PREFIX}:{hashlib.md5(f"{sql}{params!r}".encode()).hexdigest()}'
+        cached = cache.get(key)
+        if cached is not None and tag_versions_are_current(cached['tags']):
+            return cached['count'], cached['exact']
+
+        # Like for cached responses, the versions are taken before counting.
+        tag_versions = get_tag_versions(tags)
+        started_at = time.time()
+        count, exact = self.count_queryset(queryset)
+
+        # A replica may not have caught up with changes of the counted objects yet.
+        lag = settings.DATABASE_REPLICA_LAG
+        if get_replica() is None or tag_versions_created_before(tag_versions, started_at - lag):
+            cache.set(
+                key, {'count': count, 'exact': exact, 'tags': tag_versions}, settings.API_CACHE_TIMEOUT,
+            )
+        return count, exact
+
+    def count_queryset(self, queryset):
+        if self.count_estimate_threshold:
+            estimate = get_count_estimate(queryset)
+            if estimate is not None and estimate > self.count_estimate_threshold:
+                return estimate, False
+
+        return queryset.count(), True
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.page.paginator.count),
+            ('count_is_exact', self.count_is_exact),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties'] = {
+            'count': response_schema['properties']['count'],
+            'count_is_exact': {'type': 'boolean', 'example': True},
+            **response_schema['properties'],
+        }
+        return response_schema
+
+
+class JobResultsCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for Job results.
+
+    Instead of OFFSET scans and a COUNT(*), each page is fetched with a
+    row comparison on the ordering columns, e.g. (date_added, id) < (last, seen),
+    so every page costs the same no matter how deep the client is.
+    The ordering requested through OrderingFilter is honoured, with `id`
+    appended as a tie-breaker to keep cursors stable.
+    """
+    page_size = 10
+    max_page_size = 20
+    page_size_query_param = "page_size"
+    ordering = ('-date_added', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        if self.cursor is not None and self.cursor.reverse:
+            ordering = [self._reverse_field(field) for field in self.ordering]
+        else:
+            ordering = list(self.ordering)
+
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is not None:
+            queryset = queryset.filter(self._get_keyset_filter(ordering, self.cursor.position))
+
+        # Fetch one extra item to find out if there is a following page.
+        results = list(queryset[:self.page_size + 1])
+        has_following_page = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if self.cursor is not None and self.cursor.reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_following_page
+        else:
+            self.has_next = has_following_page
+            self.has_previous = self.cursor is not None
+
+        if self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Return the requested ordering, falling back to the default one,
+        with a unique `id` tie-breaker as the last column.
+        """
+        ordering = None
+        for filter_cls in getattr(view, 'filter_backends', []):
+            if hasattr(filter_cls, 'get_ordering'):
+                ordering = filter_cls().get_ordering(request, queryset, view)
+                break
+
+        ordering = list(ordering or self.ordering)
+
+        for index, field in enumerate(ordering):
+            if field.lstrip('-') in ('id', 'pk'):
+                return tuple(ordering[:index + 1])
+
+        ordering.append('-id' if ordering[-1].startswith('-') else 'id')
+        return tuple(ordering)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            tokens = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            position = list(tokens['p'])
+            reverse = bool(tokens.get('r', False))
+            ordering = tokens.get('o')
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        # A cursor issued for another ordering cannot be used as a keyset position.
+        if ordering != list(self.ordering) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(offset=0, reverse=reverse, position=position)
+
+    def encode_cursor(self, cursor):
+        tokens = {'o': self.ordering, 'p': cursor.position}
+        if cursor.reverse:
+            tokens['r'] = 1
+
+        querystring = json.dumps(tokens, cls=DjangoJSONEncoder, separators=(',', ':'))
+        encoded = urlsafe_b64encode(querystring.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = []
+        for field in ordering:
+            field_name = field.lstrip('-')
+            if isinstance(instance, dict):
+                value = instance[field_name]
+            else:
+                value = instance
+                for attr in field_name.split(LOOKUP_SEP):
+                    value = getattr(value, attr)
+
+            position.append(value.pk if isinstance(value, Model) else value)
+        return position
+
+    @staticmethod
+    def _reverse_field(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _get_keyset_filter(ordering, position):
+        """
+        Build the lexicographic "comes after" condition for the given position:
+        (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z) ...
+        """
+        keyset_filter = Q()
+        equal_filter = Q()
+        for field, value in zip(ordering, position):
+            field_name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            keyset_filter |= equal_filter & Q(**{f'{field_name}__{lookup}': value})
+            equal_filter &= Q(**{field_name: value})
+        return keyset_filter
 
 
 class LocationResultsPagePagination(PageNumberPagination):
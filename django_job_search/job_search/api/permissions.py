@@ -7,7 +7,8 @@ class IsCreatorOrReadOnly(BasePermission):
         if request.method in ['GET', 'HEAD', 'OPTIONS']:
             return True
 
-        return obj.creator == request.user
+        # Compare the ids, so the creator isn't fetched.
+        return obj.creator_id == request.user.pk
 
 
 class IsCreatorJobOrganizationOrReadonly(BasePermission):
@@ -19,7 +20,8 @@ class IsCreatorJobOrganizationOrReadonly(BasePermission):
         if request.method in ['GET', 'HEAD', 'OPTIONS']:
             return True
 
-        return obj.organization.creator == request.user
+        # Compare the ids, so the creator isn't fetched with the organization of the job.
+        return obj.organization.creator_id == request.user.pk
 
 
 class IsAdminUserOrReadonly(IsAdminUser):
@@ -0,0 +1,93 @@
+"""
+This module contains the projections of the API: read-only representations
+which are built from the `.values()` rows of a queryset instead of model instances.
+
+A list served through a serializer instantiates a model and walks every field of
+the serializer for each row, which dominates the time of a large page. A projection
+selects the columns of the representation and turns each row into the response
+dict directly. Every projection must render the same data as the serializer it
+replaces, which is guaranteed by the contract tests of job_search.tests.test_projections.
+"""
+import abc
+
+from rest_framework.response import Response
+
+
+class Projection(abc.ABC):
+    """
+    Abstract base class of the projections.
+    Declare the selected columns in `values` and implement to_representation().
+    """
+    values = ()
+
+    def get_queryset(self, queryset):
+        """Select the columns of the projection as dict rows."""
+        return queryset.values(*self.values)
+
+    @abc.abstractmethod
+    def to_representation(self, row):
+        """Return the representation of a row."""
+
+
+class JobListingProjection(Projection):
+    """
+    Projection of JobListing rows, with the same representation as JobSerializer.
+    The ids of the related objects are selected for the cache tags of the response.
+    """
+    values = (
+        'id',
+        'title',
+        'degree_id',
+        'degree_name',
+        'organization_id',
+        'organization_name',
+        'location_ids',
+        'location_names',
+        'minimum_qualifications',
+        'job_type',
+        'date_added',
+    )
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'degree': row['degree_name'],
+            'locations': row['location_names'],
+            'organization': row['organization_name'],
+            'minimum_qualifications': row['minimum_qualifications'],
+            'job_type': row['job_type'],
+            'date_added': row['date_added'].isoformat(),
+        }
+
+
+class ProjectionListMixin:
+    """
+    Viewset mixin that serves the list action through `list_projection_class`
+    instead of the serializer, when it is set.
+    The serializer is still used for ordering fields and schema generation.
+    """
+    list_projection_class = None
+
+    def get_list_projection(self):
+        """Return the projection of the list action, or None to use the serializer."""
+        if self.list_projection_class is None:
+            return None
+        return self.list_projection_class()
+
+    def get_projection_data(self, projection, rows):
+        """Return the representation of the rows."""
+        return [projection.to_representation(row) for row in rows]
+
+    def list(self, request, *args, **kwargs):
+        projection = self.get_list_projection()
+        if projection is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = projection.get_queryset(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_projection_data(projection, page))
+
+        return Response(self.get_projection_data(projection, queryset))
@@ -0,0 +1,95 @@
+"""
+This module defines the JSON renderer of the Job Search API.
+
+It renders the same bytes as the CamelCaseJSONRenderer of djangorestframework_camel_case.
+That renderer rewrites every key with a regular expression into a new OrderedDict,
+then encodes with the json module. This one camelizes each distinct key once,
+so the field names of the serializers are converted on the first response only,
+and encodes with orjson when it is installed. Data which orjson would encode
+differently from the json module (floats, dates, lazy strings, non-string keys,
+big integers) and indented responses are encoded with the json module instead.
+"""
+from functools import lru_cache
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.settings import api_settings as camel_case_settings
+from djangorestframework_camel_case.util import camelize, camelize_re, underscore_to_camel
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=4096)
+def camelize_key(key):
+    """Return the camelCase version of a snake_case key."""
+    if '_' not in key:
+        return key
+    return camelize_re.sub(underscore_to_camel, key)
+
+
+def _camelize_dict_key(key):
+    if type(key) is str:
+        return camelize_key(key)
+    if isinstance(key, Promise):
+        key = force_str(key)
+    return camelize_key(key) if isinstance(key, str) else key
+
+
+def camelize_data(data):
+    """
+    Return the data with camelCase keys, like camelize() of djangorestframework_camel_case,
+    and whether it only contains types which orjson encodes like the json module.
+    """
+    exact = True
+
+    def walk(value):
+        nonlocal exact
+        if value is None or isinstance(value, (str, int)):
+            return value
+        if isinstance(value, dict):
+            return {_camelize_dict_key(key): walk(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [walk(item) for item in value]
+
+        exact = False
+        return camelize(value)
+
+    return walk(data), exact
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """
+    Render data with camelCase keys as JSON,
+    byte for byte like CamelCaseJSONRenderer of djangorestframework_camel_case.
+    """
+    json_underscoreize = camel_case_settings.JSON_UNDERSCOREIZE
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = self.json_underscoreize
+        if options.get('ignore_fields') or options.get('ignore_keys'):
+            return super().render(camelize(data, **options), accepted_media_type, renderer_context)
+
+        data, exact = camelize_data(data)
+        if not exact or not self.can_use_orjson(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            content = orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            # Integers over 64 bits and non-string keys.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like the JSONRenderer, escape the line separators which aren't valid in JavaScript strings.
+        return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+    def can_use_orjson(self, accepted_media_type, renderer_context):
+        """orjson only writes compact, unindented JSON without escaping non-ASCII characters."""
+        indent = self.get_indent(accepted_media_type or '', renderer_context or {})
+        return orjson is not None and self.compact and not self.ensure_ascii and not indent
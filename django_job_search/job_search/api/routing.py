@@ -0,0 +1,37 @@
+"""
+This module routes the reads of the Job Search API viewsets to the read replicas.
+
+Safe requests (GET, HEAD, OPTIONS) read from a replica once the user is
+authenticated, unless the user has written through the API within the last
+settings.DATABASE_REPLICA_LAG seconds. Unsafe requests always use the primary.
+"""
+from contextlib import ExitStack
+
+from rest_framework.permissions import SAFE_METHODS
+
+from django_job_search.routers import use_replica_reads, is_pinned_to_primary, pin_to_primary
+
+
+class ReplicaReadsMixin:
+    """
+    Viewset mixin that serves the reads of safe requests from the read replicas,
+    with read-your-writes consistency for the users who write through the API.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        with ExitStack() as self.database_routing:
+            return super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        # Authentication reads from the primary, as the pin of the user isn't known before.
+        super().initial(request, *args, **kwargs)
+
+        user = request.user
+        if request.method in SAFE_METHODS and not (user.is_authenticated and is_pinned_to_primary(user)):
+            self.database_routing.enter_context(use_replica_reads())
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if request.method not in SAFE_METHODS and response.status_code < 400 and request.user.is_authenticated:
+            pin_to_primary(request.user)
+
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -2,7 +2,8 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError, PermissionDenied
 
 from job_search.api.fields import SlugRelatedCreationField
-from job_search.models import Organization, Degree, Location, Job, Spotlight
+from job_search.models import Organization, Degree, Location, Job, JobListing, Spotlight
+from job_search.references import get_reference
 
 
 class SpotlightSerializer(serializers.ModelSerializer):
@@ -52,22 +53,19 @@ class JobSerializer(serializers.ModelSerializer):
     organization = serializers.CharField(source='organization.name')
 
     def validate_organization(self, value):
-        try:
-            organization = Organization.objects.get(name=value)
-        except Organization.DoesNotExist:
+        organization = get_reference(Organization, value)
+        if organization is None:
             raise ValidationError(f'Object with name={value} does not exist.')
 
         request = self.context.get('request')
-        if request is not None and organization.creator != request.user:
+        if request is not None and organization.creator_id != request.user.pk:
             raise PermissionDenied('Creator of this organization is not of current user.')
 
         return value
 
     def validate_degree(self, value):
         """Validate that degree with given name exists."""
-        try:
-            Degree.objects.get(name=value)
-        except Degree.DoesNotExist:
+        if get_reference(Degree, value) is None:
             raise ValidationError(f'Object with name={value} does not exist.')
 
         return value
@@ -76,42 +74,33 @@ class JobSerializer(serializers.ModelSerializer):
         degree_name = validated_data.pop('degree')['name']
         organization_name = validated_data.pop('organization')['name']
 
-        validated_data['degree'] = Degree.objects.get(name=degree_name)
-        validated_data['organization'] = Organization.objects.get(name=organization_name)
-        location_names = validated_data.pop('locations')
+        validated_data['degree'] = get_reference(Degree, degree_name)
+        validated_data['organization'] = get_reference(Organization, organization_name)
+        # The locations were resolved, or created, by the locations field.
+        locations = validated_data.pop('locations')
 
         job = Job.objects.create(**validated_data)
-
-        for location_name in location_names:
-            location, _ = Location.objects.get_or_create(name=location_name)
-            job.locations.add(location)
+        job.locations.add(*locations)
 
         return job
 
     def update(self, instance, validated_data):
-        job = Job.objects.get(pk=instance.id)
+        job = instance
 
         degree_data = validated_data.pop('degree', None)
         organization_data = validated_data.pop('organization', None)
 
         if degree_data is not None:
             degree_name = degree_data.get('name')
-            degree = Degree.objects.get(name=degree_name)
-            validated_data['degree'] = degree
+            validated_data['degree'] = get_reference(Degree, degree_name)
 
         if organization_data is not None:
             organization_name = organization_data.get('name')
-            organization = Organization.objects.get(name=organization_name)
-            validated_data['organization'] = organization
-
-        location_names = validated_data.pop('locations', None)
+            validated_data['organization'] = get_reference(Organization, organization_name)
 
-        if location_names is not None:
-            locations = []
-            for location_name in location_names:
-                location, _ = Location.objects.get_or_create(name=location_name)
-                locations.append(location)
+        locations = validated_data.pop('locations', None)
 
+        if locations is not None:
             job.locations.set(locations)
 
         for attr, value in validated_data.items():
@@ -136,6 +125,30 @@ class JobSerializer(serializers.ModelSerializer):
         extra_kwargs = {'date_added': {'read_only': True}}
 
 
+class JobListingSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for JobListing model,
+    with the same representation as JobSerializer.
+    """
+    degree = serializers.CharField(source='degree_name')
+    locations = serializers.ListField(source='location_names', child=serializers.CharField())
+    organization = serializers.CharField(source='organization_name')
+
+    class Meta:
+        model = JobListing
+        fields = [
+            'id',
+            'title',
+            'degree',
+            'locations',
+            'organization',
+            'minimum_qualifications',
+            'job_type',
+            'date_added'
+        ]
+        read_only_fields = fields
+
+
 class JobDetailSerializer(JobSerializer):
     """Serializer for Job model in detail endpoint."""
     class Meta:
@@ -146,3 +159,25 @@ class JobDetailSerializer(JobSerializer):
             'date_updated': {'read_only': True},
         }
 
+
+class JobBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Serializer for a single item of the bulk Job creation endpoint.
+    Only validates the payload, related objects are resolved in bulk for all items.
+    """
+    degree = serializers.CharField(max_length=30)
+    organization = serializers.CharField()
+    locations = serializers.ListField(child=serializers.CharField(), default=list)
+
+    class Meta:
+        model = Job
+        fields = [
+            'title',
+            'degree',
+            'organization',
+            'locations',
+            'preferred_qualifications',
+            'minimum_qualifications',
+            'description',
+            'job_type',
+        ]
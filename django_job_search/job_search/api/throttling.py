@@ -6,11 +6,125 @@ It includes separate throttling classes for anonymous and authenticated users,
 and for sustained and burst traffic.
 
 Throttling is used to control the rate of requests that clients can make to the API.
+
+DRF's SimpleRateThrottle keeps the timestamps of the recent requests of a client
+in the cache, reading, trimming and writing the whole list back once per throttle,
+which races between workers. The throttles here implement the generic cell rate
+algorithm (GCRA) in Redis instead: a scope stores only the theoretical arrival
+time of the next request of the client, and one Lua script checks and updates
+the throttles of all scopes of a request atomically, in a single round trip.
+A request which is refused by any scope doesn't count against the others.
+"""
+import weakref
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle, UserRateThrottle
+
+# KEYS are the throttle keys of the request, ARGV the emission interval and the period
+# of each key in microseconds. Returns the wait of each key in microseconds, 0 if allowed.
+GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local arrivals = {}
+local waits = {}
+local allowed = true
+
+for index, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[index * 2 - 1])
+    local period = tonumber(ARGV[index * 2])
+    local arrival = math.max(tonumber(redis.call('GET', key)) or now, now) + interval
+    local wait = arrival - period - now
+    if wait > 0 then
+        allowed = false
+        waits[index] = wait
+    else
+        waits[index] = 0
+    end
+    arrivals[index] = arrival
+end
+
+if allowed then
+    for index, key in ipairs(KEYS) do
+        redis.call('SET', key, string.format('%d', arrivals[index]), 'PX', math.ceil((arrivals[index] - now) / 1000))
+    end
+end
+return waits
 """
-from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+# Scripts of GCRA_SCRIPT by Redis client. A script object keeps the SHA of the script,
+# so it is evaluated with EVALSHA and loaded again only if Redis has lost it.
+_scripts = weakref.WeakKeyDictionary()
+
+
+def get_gcra_script(connection):
+    """Return the script of GCRA_SCRIPT of the Redis client, registered once per client."""
+    if connection not in _scripts:
+        _scripts[connection] = connection.register_script(GCRA_SCRIPT)
+    return _scripts[connection]
+
+
+def get_view_throttles(view):
+    """Return the throttles of a viewset, or of an async view of job_search.api.async_views."""
+    if hasattr(view, 'get_throttles'):
+        return view.get_throttles()
+    return [throttle_class() for throttle_class in view.throttle_classes]
+
+
+def run_throttles(throttles, request, view):
+    """
+    Check and count the request against the GCRA throttles in one round trip.
+    Returns the wait in seconds of each throttle key, None if the request is allowed.
+    """
+    keys, args = [], []
+    for throttle in throttles:
+        if not isinstance(throttle, GCRARateThrottle) or throttle.rate is None:
+            continue
+        key = throttle.get_cache_key(request, view)
+        if key is not None:
+            keys.append(cache.make_key(key))
+            args.extend([round(throttle.duration * 1000000 / throttle.num_requests), throttle.duration * 1000000])
+
+    if not keys:
+        return {}
+    waits = get_gcra_script(get_redis_connection('default'))(keys=keys, args=args)
+    return {key: wait / 1000000 if wait else None for key, wait in zip(keys, waits)}
+
+
+class GCRARateThrottle(SimpleRateThrottle):
+    """
+    Base class of the throttles which are checked atomically in Redis, see GCRA_SCRIPT.
+    The first throttle of a request runs all of them, the others read their result.
+    Falls back to SimpleRateThrottle when the cache isn't Redis.
+    """
+    wait_seconds = None
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+
+        waits = getattr(request, '_throttle_waits', None)
+        if waits is None:
+            try:
+                waits = run_throttles(get_view_throttles(view), request, view)
+            except NotImplementedError:
+                # get_redis_connection() only supports the django_redis cache backend.
+                return super().allow_request(request, view)
+            request._throttle_waits = waits
+
+        self.wait_seconds = waits.get(cache.make_key(key))
+        return self.wait_seconds is None
+
+    def wait(self):
+        if self.wait_seconds is not None:
+            return self.wait_seconds
+        return super().wait()
 
 
-class AnonSustainedThrottle(AnonRateThrottle):
+class AnonSustainedThrottle(GCRARateThrottle, AnonRateThrottle):
     """
     Throttle class for anonymous users for sustained traffic.
 
@@ -19,7 +133,7 @@ class AnonSustainedThrottle(AnonRateThrottle):
     scope = "anon_sustained"
 
 
-class AnonBurstThrottle(AnonRateThrottle):
+class AnonBurstThrottle(GCRARateThrottle, AnonRateThrottle):
     """
     Throttle class for anonymous users for burst traffic.
 
@@ -28,7 +142,7 @@ class AnonBurstThrottle(AnonRateThrottle):
     scope = "anon_burst"
 
 
-class UserSustainedThrottle(UserRateThrottle):
+class UserSustainedThrottle(GCRARateThrottle, UserRateThrottle):
     """
     Throttle class for authenticated users for sustained traffic.
 
@@ -37,7 +151,7 @@ class UserSustainedThrottle(UserRateThrottle):
     scope = "user_sustained"
 
 
-class UserBurstThrottle(UserRateThrottle):
+class UserBurstThrottle(GCRARateThrottle, UserRateThrottle):
     """
     Throttle class for authenticated users for burst traffic.
 
@@ -13,6 +13,8 @@ from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
 # Local imports for the API views
+from django_job_search.views import PoolStatsAPIView
+from job_search.api.async_views import AsyncJobListView, AsyncJobDetailView, AsyncLocationListView
 from job_search.api.views import (
     OrganizationViewSet,
     DegreeViewSet,
@@ -51,6 +53,14 @@ urlpatterns = [
     # Include the search URLs
     path('search/', include('search.urls')),
 
+    # Async read endpoints, for the ASGI server
+    path('async/jobs/', AsyncJobListView.as_view(), name='async-job-list'),
+    path('async/jobs/<int:pk>/', AsyncJobDetailView.as_view(), name='async-job-detail'),
+    path('async/locations/', AsyncLocationListView.as_view(), name='async-location-list'),
+
+    # URL for the connection pool counters
+    path('pools/', PoolStatsAPIView.as_view(), name='pool-stats'),
+
     # URLs for the API documentation in JSON and YAML formats
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
@@ -2,49 +2,64 @@
 This module contains the views for the API.
 """
 # Required Django and Rest Framework imports
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.db import IntegrityError, transaction
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 from rest_framework.mixins import ListModelMixin
 
-# Local imports for filters, pagination, permissions and serializers
-from job_search.api.filters import JobFilter
-from job_search.api.pagination import JobResultsPagePagination, LocationResultsPagePagination
+# Local imports for bulk creation, caching, facets, filters, pagination, permissions, projections, replica routing,
+# reference lookups and serializers
+from job_search.api.bulk import bulk_create_jobs
+from job_search.api.cache import CacheTagsMixin, cache_response, conditional_response
+from job_search.api.facets import count_facets
+from job_search.api.filters import JobFilter, JobListingFilter
+from job_search.api.pagination import (
+    JobResultsPagePagination,
+    JobResultsCursorPagination,
+    LocationResultsPagePagination,
+)
 from job_search.api.permissions import (
     IsCreatorOrReadOnly,
     IsCreatorJobOrganizationOrReadonly,
     IsAdminUserOrReadonly,
 )
+from job_search.api.projections import JobListingProjection, ProjectionListMixin
+from job_search.api.routing import ReplicaReadsMixin
 from job_search.api.serializers import (
     DegreeSerializer,
     LocationSerializer,
     OrganizationSerializer,
     JobDetailSerializer,
-    JobSerializer,
+    JobListingSerializer,
     SpotlightSerializer,
 )
-from job_search.models import Degree, Location, Organization, Job, Spotlight
+from job_search.cache import get_tag
+from job_search.models import Degree, Location, Organization, Job, JobListing, Spotlight
+from job_search.references import bypass_local_references
 
 
-class SpotlightViewSet(ModelViewSet):
+class SpotlightViewSet(ReplicaReadsMixin, CacheTagsMixin, ModelViewSet):
     """
     ViewSet for Spotlight model.
     Only admin users can perform CRUD operations.
-    The results are cached for 300 seconds.
+    The results are cached until a Spotlight is changed.
     """
     queryset = Spotlight.objects.all()
     serializer_class = SpotlightSerializer
     permission_classes = [IsAdminUserOrReadonly]
 
-    @method_decorator(cache_page(300))
+    @cache_response(collection=True)
     def list(self, request, *args, **kwargs):
         """
         List all the Spotlights.
         """
         return super().list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(300))
+    @cache_response()
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve a specific Spotlight.
@@ -68,24 +83,24 @@ class SpotlightViewSet(ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
 
-class DegreeViewSet(ModelViewSet):
+class DegreeViewSet(ReplicaReadsMixin, CacheTagsMixin, ModelViewSet):
     """
     ViewSet for Degree model.
     Only admin users can perform CRUD operations.
-    The results are cached for 300 seconds.
+    The results are cached until a Degree is changed.
     """
     queryset = Degree.objects.all()
     serializer_class = DegreeSerializer
     permission_classes = [IsAdminUserOrReadonly]
 
-    @method_decorator(cache_page(300))
+    @cache_response(collection=True)
     def list(self, request, *args, **kwargs):
         """
         List all the Degrees.
         """
         return super().list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(300))
+    @cache_response()
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific Degree."""
         return super().retrieve(request, *args, **kwargs)
@@ -107,27 +122,54 @@ class DegreeViewSet(ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
 
-class LocationViewSet(ListModelMixin, GenericViewSet):
+class LocationViewSet(ReplicaReadsMixin, CacheTagsMixin, ListModelMixin, GenericViewSet):
     """
     ViewSet for Location model.
-    Only supports listing of Locations.
-    The results are paginated and cached for 120 seconds.
+    Only supports listing and autocompleting of Locations.
+    The results are paginated and cached until a Location is changed.
     """
     queryset = Location.objects.all()
     serializer_class = LocationSerializer
     pagination_class = LocationResultsPagePagination
+    autocomplete_default_size = 10
+    autocomplete_max_size = 50
 
-    @method_decorator(cache_page(120))
+    @cache_response(collection=True)
     def list(self, request, *args, **kwargs):
         """List all the Locations."""
         return super().list(request, *args, **kwargs)
 
-
-class OrganizationViewSet(ModelViewSet):
+    @action(detail=False, methods=['get'], url_path='autocomplete', url_name='autocomplete')
+    @cache_response(collection=True)
+    def autocomplete(self, request, *args, **kwargs):
+        """
+        Suggest the Locations whose names start with the `q` parameter, ignoring case,
+        with the most Jobs first. The `limit` parameter sets the number of suggestions.
+        """
+        query = request.query_params.get('q', '').strip()
+        try:
+            limit = int(request.query_params.get('limit', self.autocomplete_default_size))
+        except ValueError:
+            raise ValidationError({'limit': 'A valid integer is required.'})
+        if not 1 <= limit <= self.autocomplete_max_size:
+            raise ValidationError({'limit': f'Ensure this value is between 1 and {self.autocomplete_max_size}.'})
+
+        if not query:
+            return Response({'results': []})
+
+        # Matched by the location_name_prefix_idx index, ranked by the job counts kept up to date on write.
+        results = self.get_queryset().filter(name__istartswith=query).order_by('-job_count', 'name')
+        # The job counts change with the Jobs.
+        if self.cache_tags is not None:
+            self.cache_tags.add(get_tag(Job))
+        return Response({'results': list(results.values('id', 'name', 'job_count')[:limit])})
+
+
+class OrganizationViewSet(ReplicaReadsMixin, CacheTagsMixin, ModelViewSet):
     """
     ViewSet for Organization model.
     Only authenticated users can perform CRUD operations.
-    The results are cached for 120 seconds.
+    The results are cached until an Organization is changed.
     """
     queryset = Organization.objects.select_related('creator')
     serializer_class = OrganizationSerializer
@@ -139,12 +181,12 @@ class OrganizationViewSet(ModelViewSet):
         """
         serializer.save(creator=self.request.user)
 
-    @method_decorator(cache_page(120))
+    @cache_response(collection=True)
     def list(self, request, *args, **kwargs):
         """List all the Organizations."""
         return super().list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(120))
+    @cache_response()
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific Organization."""
         return super().retrieve(request, *args, **kwargs)
@@ -166,60 +208,187 @@ class OrganizationViewSet(ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
 
-class JobViewSet(ModelViewSet):
+class JobViewSet(ReplicaReadsMixin, CacheTagsMixin, ProjectionListMixin, ModelViewSet):
     """
     ViewSet for Job model.
     Only authenticated users can perform CRUD operations.
-    The results are paginated and cached for 120 seconds.
+    The results are paginated and cached until one of the contained
+    Jobs, Degrees, Organizations or Locations is changed.
+    Pass `?pagination=cursor` to the list endpoint to use keyset pagination
+    instead of page numbers.
+    The list is read from the denormalized JobListing rows of the jobs
+    and represented by JobListingProjection, without a serializer.
+    The facets endpoint counts the jobs per option of the list filters.
+    List and detail responses carry ETag and Last-Modified validators,
+    and conditional requests are answered with 304 Not Modified
+    without reading the jobs while nothing changed.
     """
     queryset = Job.objects.all()
-    filterset_class = JobFilter
+    listing_queryset = JobListing.objects.all()
+    list_projection_class = JobListingProjection
     pagination_class = JobResultsPagePagination
+    cursor_pagination_class = JobResultsCursorPagination
+    pagination_mode_query_param = 'pagination'
+    bulk_create_max_size = 1000
     permission_classes = [IsAuthenticatedOrReadOnly & IsCreatorJobOrganizationOrReadonly]
 
+    @property
+    def paginator(self):
+        """
+        Use cursor pagination when it is requested by the client,
+        page number pagination otherwise.
+        """
+        if not hasattr(self, '_paginator'):
+            request = getattr(self, 'request', None)
+            if request is not None and request.query_params.get(self.pagination_mode_query_param) == 'cursor':
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    @property
+    def filterset_class(self):
+        """
+        Filter JobListing rows in the list and facets views and Jobs otherwise.
+        """
+        if getattr(self, 'action', None) in ('list', 'facets'):
+            return JobListingFilter
+        return JobFilter
+
+    def get_cache_tags(self, instance):
+        """
+        Tag cached responses with the job and the related objects rendered into it.
+        """
+        if isinstance(instance, dict):
+            # A row of JobListingProjection.
+            pk, degree_id, organization_id, location_ids = (
+                instance['id'], instance['degree_id'], instance['organization_id'], instance['location_ids'],
+            )
+        elif isinstance(instance, JobListing):
+            pk, degree_id, organization_id, location_ids = (
+                instance.pk, instance.degree_id, instance.organization_id, instance.location_ids,
+            )
+        else:
+            pk, degree_id, organization_id = instance.pk, instance.degree_id, instance.organization_id
+            location_ids = [location.pk for location in instance.locations.all()]
+
+        return [
+            get_tag(Job, pk),
+            get_tag(Degree, degree_id),
+            get_tag(Organization, organization_id),
+            *(get_tag(Location, location_id) for location_id in location_ids),
+        ]
+
+    def get_validator_tags(self):
+        """
+        The list and facets change with any job and with the names of any degree, organization or location.
+        The detail changes with the tags of its response, found from the JobListing row of the job.
+        """
+        if self.action in ('list', 'facets'):
+            return [get_tag(model) for model in (Job, Degree, Organization, Location)]
+
+        if self.action == 'retrieve':
+            try:
+                listing = self.listing_queryset.only(
+                    'degree_id', 'organization_id', 'location_ids',
+                ).filter(pk=self.kwargs[self.lookup_field]).first()
+            except (TypeError, ValueError):
+                return None
+            if listing is not None:
+                return self.get_cache_tags(listing)
+
+        return None
+
     def get_serializer_class(self):
         """
         Use different serializers for list and detail views.
         """
         if self.action == 'list':
-            return JobSerializer
+            return JobListingSerializer
         return JobDetailSerializer
 
     def get_queryset(self):
         """
         Use different querysets for list and detail views.
         """
-        if self.action in ('retrieve', 'create', 'update', 'partial_update'):
-            return self.queryset.all().select_related(
-                'degree', 'organization',
-            ).prefetch_related('locations')
+        if self.action in ('list', 'facets'):
+            return self.listing_queryset.all()
 
         return self.queryset.all().select_related(
             'degree', 'organization',
-        ).prefetch_related('locations').only(
-            'title', 'degree', 'locations', 'organization', 'minimum_qualifications',
-            'job_type', 'date_added'
-        )
+        ).prefetch_related('locations')
 
-    @method_decorator(cache_page(120))
+    @conditional_response
+    @cache_response(collection=True)
     def list(self, request, *args, **kwargs):
         """List all the Jobs."""
         return super().list(request, *args, **kwargs)
 
-    @method_decorator(cache_page(120))
+    @conditional_response
+    @cache_response()
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific Job."""
         return super().retrieve(request, *args, **kwargs)
 
+    @action(detail=False, methods=['get'], url_path='facets', url_name='facets')
+    @conditional_response
+    @cache_response(collection=True)
+    def facets(self, request, *args, **kwargs):
+        """
+        Count the Jobs per job type, degree, organization and location, for the same filters as the list.
+        Each facet is counted with all the given filters except its own.
+        """
+        counts = count_facets(self.filterset_class(request.query_params, queryset=self.get_queryset(), request=request))
+        # The facets are named after the degrees, organizations and locations.
+        if self.cache_tags is not None:
+            self.cache_tags.update(get_tag(model) for model in (Degree, Organization, Location))
+        return Response(counts)
+
+    def write_with_current_references(self, write, *args, **kwargs):
+        """
+        Run the write action. The process may serve the names of degrees, organizations and locations
+        which another process deleted for a moment (see job_search.references), so a write which
+        refers to a deleted object is run once more with the references read past the process.
+        """
+        try:
+            with transaction.atomic():
+                return write(*args, **kwargs)
+        except IntegrityError:
+            with bypass_local_references():
+                return write(*args, **kwargs)
+
     def create(self, request, *args, **kwargs):
         """
         Create a new Job. You can use only organization, which you created before.
         """
-        return super().create(request, *args, **kwargs)
+        return self.write_with_current_references(super().create, request, *args, **kwargs)
+
+    @action(detail=False, methods=['post'], url_path='bulk', url_name='bulk')
+    def bulk_create(self, request, *args, **kwargs):
+        """
+        Create many Jobs at once. You can use only organizations, which you created before.
+        Returns the id or the validation errors of every submitted Job, in the same order.
+        """
+        if not isinstance(request.data, list) or not request.data:
+            raise ValidationError('Expected a non-empty list of jobs.')
+        if len(request.data) > self.bulk_create_max_size:
+            raise ValidationError(f'Expected at most {self.bulk_create_max_size} jobs.')
+
+        results = self.write_with_current_references(bulk_create_jobs, request.data, request.user)
+
+        created = sum('id' in result for result in results)
+        if created == len(results):
+            response_status = status.HTTP_201_CREATED
+        elif created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response({'results': results}, status=response_status)
 
     def update(self, request, *args, **kwargs):
         """Update a specific Job."""
-        return super().update(request, *args, **kwargs)
+        return self.write_with_current_references(super().update, request, *args, **kwargs)
 
     def partial_update(self, request, *args, **kwargs):
         """Partially update a specific Job."""
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class JobSearchConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job_search'
+
+    def ready(self):
+        import job_search.signals  # noqa: F401
+        import django_job_search.pools  # noqa: F401
@@ -0,0 +1,125 @@
+"""
+This module implements tag based invalidation for cached API responses.
+
+Every cached response is stored together with the versions of the tags it
+depends on. A tag is either a single object (`job_search.job:42`) or a whole
+collection (`job_search.job`), used by list endpoints that change when objects
+are added or removed.
+
+Invalidating a tag deletes its version key, so every response that was stored
+with the old version stops matching and is rebuilt on the next request.
+This keeps invalidation O(number of tags) instead of O(number of cached pages).
+
+Versions start with the time they were created at, which tells whether
+a tag could have been invalidated within a given time window.
+
+Versions expire after CACHE_TAG_TIMEOUT, which outlives the cached responses,
+so tags of deleted objects don't pile up in Redis. Missing versions are
+created and read back in one pipeline, the values that win the SET NX races.
+"""
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+TAG_VERSION_KEY_PREFIX = 'cache-tag'
+
+
+def get_tag(model, pk=None):
+    """
+    Return the tag of a single object, or of the whole collection
+    of the model if no primary key is given.
+    """
+    tag = model._meta.label_lower
+    if pk is None:
+        return tag
+    return f'{tag}:{pk}'
+
+
+def get_instance_tag(instance):
+    """Return the tag of a model instance."""
+    return get_tag(type(instance), instance.pk)
+
+
+def _get_version_key(tag):
+    return f'{TAG_VERSION_KEY_PREFIX}:{tag}'
+
+
+def _new_version():
+    return f'{time.time():.6f}:{uuid.uuid4().hex}'
+
+
+def _create_versions(keys):
+    """Create versions for the given keys unless another process did, and return the stored ones."""
+    try:
+        connection = get_redis_connection('default')
+    except NotImplementedError:
+        # get_redis_connection() only supports the django_redis cache backend.
+        for key in keys:
+            cache.add(key, _new_version(), timeout=settings.CACHE_TAG_TIMEOUT)
+        return cache.get_many(keys)
+
+    redis_keys = [cache.make_key(key) for key in keys]
+    pipeline = connection.pipeline(transaction=False)
+    for redis_key in redis_keys:
+        pipeline.set(redis_key, cache.client.encode(_new_version()), nx=True, ex=settings.CACHE_TAG_TIMEOUT)
+    pipeline.mget(redis_keys)
+    values = pipeline.execute()[-1]
+    return {key: cache.client.decode(value) for key, value in zip(keys, values) if value is not None}
+
+
+def get_tag_versions(tags):
+    """
+    Return the current versions of the given tags,
+    creating versions for tags that were never seen (or were invalidated).
+    """
+    keys = {_get_version_key(tag): tag for tag in tags}
+    versions = cache.get_many(keys)
+
+    missing_keys = [key for key in keys if key not in versions]
+    if missing_keys:
+        # Another process may create the versions at the same time,
+        # so the stored values are the ones that win.
+        versions.update(_create_versions(missing_keys))
+
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def tag_versions_are_current(tag_versions):
+    """Check that none of the tags were invalidated since the versions were taken."""
+    keys = {_get_version_key(tag): version for tag, version in tag_versions.items()}
+    current_versions = cache.get_many(keys)
+    return all(current_versions.get(key) == version for key, version in keys.items())
+
+
+def tag_versions_created_before(tag_versions, timestamp):
+    """
+    Check that the versions of the tags were created before the timestamp,
+    i.e. that none of the tags were invalidated after it.
+    """
+    for version in tag_versions.values():
+        created_at, separator, _ = version.partition(':')
+        if separator and float(created_at) > timestamp:
+            return False
+    return True
+
+
+def get_tag_versions_created_at(tag_versions):
+    """
+    Return the time the latest of the versions was created at, i.e. a time
+    after the last change of any of the tags, or None if it isn't known.
+    """
+    timestamps = []
+    for version in tag_versions.values():
+        created_at, separator, _ = version.partition(':')
+        if not separator:
+            return None
+        timestamps.append(float(created_at))
+    return max(timestamps, default=None)
+
+
+def invalidate_tags(tags):
+    """Invalidate every cached response which depends on one of the given tags."""
+    cache.delete_many([_get_version_key(tag) for tag in tags])
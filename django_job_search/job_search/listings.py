@@ -0,0 +1,121 @@
+"""
+This module maintains the JobListing read model, and the job counts of the locations.
+
+Every write which changes what the job list shows (saving or deleting a job,
+changing its locations, renaming its degree, organization or locations)
+refreshes the affected JobListing rows in the same transaction, so the list
+never has to join the related tables.
+
+Rows are rebuilt from the jobs with one aggregating query and written back
+with one INSERT ... ON CONFLICT DO UPDATE, regardless of the number of jobs.
+
+Adding jobs to or removing them from locations changes the job counts of those
+locations by the number of added or removed links, for the ranking of the locations
+autocomplete. The counts are incremented in place, so concurrent writes don't
+overwrite each other's changes. recount_location_job_counts() recounts them from
+the links, see the reconcile_location_job_counts command.
+"""
+from collections import defaultdict
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, IntegerField, OuterRef, Q, F, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from job_search.models import Job, JobListing, Location
+
+LISTING_FIELDS = [
+    'title',
+    'degree_id',
+    'degree_name',
+    'organization_id',
+    'organization_name',
+    'location_ids',
+    'location_names',
+    'minimum_qualifications',
+    'job_type',
+    'date_added',
+]
+
+
+def get_listing_values(job_ids):
+    """Return the values of the JobListing rows of the given jobs."""
+    has_location = Q(locations__isnull=False)
+    return Job.objects.filter(pk__in=job_ids).values(
+        'id',
+        'title',
+        'degree_id',
+        'organization_id',
+        'minimum_qualifications',
+        'job_type',
+        'date_added',
+        degree_name=F('degree__name'),
+        organization_name=F('organization__name'),
+        location_ids=ArrayAgg('locations__id', filter=has_location, ordering='locations__id', default=[]),
+        location_names=ArrayAgg('locations__name', filter=has_location, ordering='locations__id', default=[]),
+    )
+
+
+def refresh_job_listings(job_ids):
+    """
+    Create or update the JobListing rows of the given jobs,
+    and delete the rows of the jobs which no longer exist.
+    """
+    job_ids = set(job_ids)
+    if not job_ids:
+        return
+
+    listings = [JobListing(**values) for values in get_listing_values(job_ids)]
+    if listings:
+        JobListing.objects.bulk_create(
+            listings,
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=LISTING_FIELDS,
+        )
+
+    missing_ids = job_ids - {listing.pk for listing in listings}
+    if missing_ids:
+        JobListing.objects.filter(pk__in=missing_ids).delete()
+
+
+def delete_job_listings(job_ids):
+    """Delete the JobListing rows of the given jobs."""
+    JobListing.objects.filter(pk__in=job_ids).delete()
+
+
+def change_location_job_counts(location_deltas):
+    """Add the given number of jobs, negative for removed jobs, to the count of each location by id."""
+    locations_by_delta = defaultdict(list)
+    for location_id, delta in location_deltas.items():
+        if delta:
+            locations_by_delta[delta].append(location_id)
+
+    for delta, location_ids in locations_by_delta.items():
+        Location.objects.filter(pk__in=location_ids).update(job_count=Greatest(F('job_count') + delta, 0))
+
+
+def add_job_location_counts(job_ids):
+    """Count the given new jobs in their locations, with one UPDATE."""
+    new_links = Job.locations.through.objects.filter(job_id__in=job_ids)
+    job_counts = new_links.filter(
+        location_id=OuterRef('pk'),
+    ).order_by().values('location_id').annotate(count=Count('*')).values('count')
+    Location.objects.filter(pk__in=new_links.values('location_id')).update(
+        job_count=F('job_count') + Subquery(job_counts, output_field=IntegerField()),
+    )
+
+
+def recount_location_job_counts(location_ids=None):
+    """
+    Recount the jobs of the given locations, or of all of them, from their links.
+    Only the counts which changed are written. Returns the number of corrected locations.
+    """
+    job_counts = Job.locations.through.objects.filter(
+        location_id=OuterRef('pk'),
+    ).order_by().values('location_id').annotate(count=Count('*')).values('count')
+    job_count = Coalesce(Subquery(job_counts, output_field=IntegerField()), 0)
+
+    locations = Location.objects.all() if location_ids is None else Location.objects.filter(pk__in=location_ids)
+    return locations.alias(actual_job_count=job_count).exclude(
+        job_count=F('actual_job_count'),
+    ).update(job_count=job_count)
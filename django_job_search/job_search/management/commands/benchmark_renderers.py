@@ -0,0 +1,82 @@
+"""
+This module defines a Django management command that benchmarks the JSON renderers of the API.
+
+It serializes jobs from the database with JobDetailSerializer, renders the payloads
+of a job detail response and of a page of jobs with the CamelCaseJSONRenderer of
+djangorestframework_camel_case and with the one of the API, checks that both
+render the same bytes, and reports the time per render.
+
+The 'handle' method is the entry point for the command.
+"""
+import timeit
+
+from django.core.management import BaseCommand, CommandError
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer
+
+from job_search.api.renderers import CamelCaseJSONRenderer, orjson
+from job_search.api.serializers import JobDetailSerializer
+from job_search.models import Job
+
+
+class Command(BaseCommand):
+    """
+    Django management command to compare the JSON renderers on JobDetailSerializer payloads.
+    """
+    help = 'Benchmark the camelCase JSON renderer of the API against the one of djangorestframework_camel_case.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=20,
+            help='Number of jobs on the rendered page.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=1000,
+            help='Number of renders per payload and renderer.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        Renders every payload `--repeat` times with each renderer and writes the mean times.
+        """
+        if options['jobs'] < 1 or options['repeat'] < 1:
+            raise CommandError('--jobs and --repeat must be positive.')
+
+        jobs = list(
+            Job.objects.select_related('degree', 'organization')
+            .prefetch_related('locations').order_by('-id')[:options['jobs']]
+        )
+        if not jobs:
+            raise CommandError('There are no jobs to serialize.')
+
+        results = JobDetailSerializer(jobs, many=True).data
+        payloads = {
+            'job detail': results[0],
+            f'page of {len(results)} jobs': {'count': len(results), 'next': None, 'previous': None, 'results': results},
+        }
+        renderers = {
+            'djangorestframework_camel_case': LibraryCamelCaseJSONRenderer(),
+            'job_search' + (' (orjson)' if orjson else ' (json)'): CamelCaseJSONRenderer(),
+        }
+
+        for payload_name, payload in payloads.items():
+            contents = {renderer.render(payload) for renderer in renderers.values()}
+            if len(contents) != 1:
+                raise CommandError(f'The renderers render the {payload_name} differently.')
+
+            self.stdout.write(f'{payload_name} ({len(contents.pop())} bytes):')
+            timings = {
+                renderer_name: timeit.timeit(lambda: renderer.render(payload), number=options['repeat'])
+                for renderer_name, renderer in renderers.items()
+            }
+            baseline = next(iter(timings.values()))
+            for renderer_name, timing in timings.items():
+                self.stdout.write(
+                    f'  {renderer_name}: {timing / options["repeat"] * 1e6:.1f}us per render, '
+                    f'{baseline / timing:.1f}x'
+                )
@@ -0,0 +1,183 @@
+"""
+This module defines a Django management command that checks the API endpoints against performance budgets.
+
+It seeds a realistic volume of data, requests every route of the API with
+job_search.performance, and fails when the number of queries or the p95 latency
+of an endpoint exceeds its budget in performance_budgets.json:
+
+    python manage.py check_performance_budgets --report performance_report.json
+
+The data is seeded into a throwaway database, created and migrated like the test runner
+does (`test_<NAME>`), unless --use-configured-database is given, e.g. by the test suite
+which already runs in one. The seeded data and the writes of the endpoints are rolled
+back either way. The cache is used under a key prefix of its own, so the measurement
+neither reads nor invalidates the cached responses, counts and lookups of the deployment.
+Elasticsearch is only searched.
+
+The 'handle' method is the entry point for the command.
+"""
+import json
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from job_search import performance
+from job_search.references import local_versions
+
+
+class Command(BaseCommand):
+    """
+    Django management command to measure the query counts and latencies of the API endpoints.
+    """
+    help = 'Check the query counts and p95 latencies of the API endpoints against their budgets.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=10000,
+            help='Number of seeded jobs.',
+        )
+        parser.add_argument(
+            '--locations',
+            type=int,
+            default=1000,
+            help='Number of seeded locations.',
+        )
+        parser.add_argument(
+            '--locations-per-job',
+            type=int,
+            default=5,
+            help='Maximum number of locations of a seeded job.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Number of measured requests per endpoint, after a warm-up request.',
+        )
+        parser.add_argument(
+            '--budgets',
+            default=settings.BASE_DIR / 'performance_budgets.json',
+            type=Path,
+            help='JSON file with the budgets of the endpoints.',
+        )
+        parser.add_argument(
+            '--report',
+            type=Path,
+            help='Write the measurements of the endpoints to this JSON file.',
+        )
+        parser.add_argument(
+            '--without-search',
+            action='store_true',
+            help='Skip the endpoints which query Elasticsearch.',
+        )
+        parser.add_argument(
+            '--use-configured-database',
+            action='store_true',
+            help='Seed the configured database instead of a throwaway one. Only for dedicated databases.',
+        )
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Keep the throwaway database, and reuse it if it exists.',
+        )
+        parser.add_argument(
+            '--noinput', '--no-input',
+            action='store_false',
+            dest='interactive',
+            help='Destroy an existing throwaway database without asking.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        Seeds the data, measures every endpoint, writes the report and fails on exceeded budgets.
+        """
+        if min(options['jobs'], options['locations'], options['locations_per_job'], options['repeat']) < 1:
+            raise CommandError('--jobs, --locations, --locations-per-job and --repeat must be positive.')
+
+        try:
+            budgets = json.loads(options['budgets'].read_text())
+        except (OSError, ValueError) as error:
+            raise CommandError(f'Cannot read the budgets: {error}')
+
+        if options['use_configured_database']:
+            results = self.measure(budgets, options)
+        else:
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(
+                verbosity=0, autoclobber=not options['interactive'], serialize=False, keepdb=options['keepdb'],
+            )
+            try:
+                results = self.measure(budgets, options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+
+        if options['report']:
+            options['report'].write_text(json.dumps({
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'jobs': options['jobs'],
+                'locations': options['locations'],
+                'locations_per_job': options['locations_per_job'],
+                'repeat': options['repeat'],
+                'endpoints': results,
+            }, indent=2))
+
+        failed = [name for name, result in results.items() if result['problems']]
+        if failed:
+            raise CommandError(f'{len(failed)} endpoints exceed their budgets: {", ".join(failed)}')
+        self.stdout.write(self.style.SUCCESS(f'All {len(results)} endpoints are within their budgets.'))
+
+    def measure(self, budgets, options):
+        """Seed the data, measure every endpoint and return the results by endpoint name."""
+        caches = {
+            alias: {**cache_settings, 'KEY_PREFIX': f'performance-{uuid.uuid4().hex}'}
+            for alias, cache_settings in settings.CACHES.items()
+        }
+        # The seeded data is only visible to the primary, in the transaction which is rolled back.
+        # The requests are sent to the host of the test clients.
+        with override_settings(
+            DATABASE_REPLICAS=[], ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'], CACHES=caches,
+        ), transaction.atomic():
+            # Versions of the lookups read from the cache of the deployment don't apply.
+            local_versions.clear()
+            started_at = time.perf_counter()
+            objects = performance.seed_data(
+                jobs=options['jobs'],
+                locations=options['locations'],
+                locations_per_job=options['locations_per_job'],
+            )
+            self.stdout.write(f'Seeded {options["jobs"]} jobs in {time.perf_counter() - started_at:.1f}s.')
+
+            results = {}
+            for endpoint in performance.ENDPOINTS:
+                if options['without_search'] and endpoint.uses_search:
+                    continue
+                result = performance.measure(endpoint, objects, options['repeat'])
+                budget = budgets.get(endpoint.name)
+                result['budget'] = budget
+                result['problems'] = performance.check_budget(endpoint, result, budget)
+                results[endpoint.name] = result
+                self.stdout.write(self.format_result(endpoint.name, result))
+
+            transaction.set_rollback(True)
+
+        # Counts of job lists and lookups cached in the process under the prefix would count the seeded rows.
+        local_versions.clear()
+        return results
+
+    def format_result(self, name, result):
+        line = (
+            f'{name}: {result["queries"]} queries, p50 {result["p50_ms"]:.1f}ms, '
+            f'p95 {result["p95_ms"]:.1f}ms, status {", ".join(map(str, result["statuses"]))}'
+        )
+        if result['problems']:
+            return self.style.ERROR(f'{line} -- {"; ".join(result["problems"])}')
+        return line
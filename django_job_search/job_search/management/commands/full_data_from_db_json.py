@@ -1,71 +1,314 @@
 """
 This module defines a Django management command that populates the database from a JSON file.
 
-The command reads data from a file named 'db.json' in the same directory.
+The command reads data from a JSON file ('db.json' in the current directory by default)
+with 'degrees', 'spotlights' and 'jobs' arrays, or from an NDJSON file with one job per line.
 It creates instances of the Degree, Spotlight, Job, Organization, and Location models.
 
+The file is parsed incrementally, so it never has to fit into memory, and the rows are
+inserted in batches with bulk_create(), one transaction per batch. Already existing
+rows are skipped, so the command can be run again on the same file.
+
 The 'handle' method is the entry point for the command.
 """
 import json
+import time
 
-from django.core.management import BaseCommand
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
 
 from job_search.models import Degree, Organization, Location, Spotlight, Job
+from job_search.signals import jobs_bulk_created
+
+
+class JSONStreamReader:
+    """
+    Incremental reader of a JSON document of the form {"section": [item, ...], ...}.
+
+    Items of the top-level arrays are decoded one by one from a buffer
+    which is refilled from the file when an item isn't complete yet.
+    """
+    whitespace = ' \t\n\r'
+
+    def __init__(self, file, read_size=64 * 1024):
+        self.file = file
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.file.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def _peek(self):
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in self.whitespace:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                raise CommandError('Unexpected end of JSON file.')
+
+    def _expect(self, *chars):
+        char = self._peek()
+        if char not in chars:
+            raise CommandError(f'Invalid JSON file: expected {" or ".join(chars)}, got {char!r}.')
+        self.position += 1
+        return char
+
+    def _decode(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                value, end = None, None
+
+            # A value which ends exactly at the end of the buffer may be truncated (e.g. a number).
+            if end is not None and (end < len(self.buffer) or self.eof):
+                self.position = end
+                return value
+            if not self._fill() and end is None:
+                raise CommandError('Invalid JSON file: truncated value.')
+
+    def __iter__(self):
+        """Yield (section, item) for every item of the top-level arrays."""
+        self._expect('{')
+        if self._peek() == '}':
+            return
+
+        while True:
+            section = self._decode()
+            self._expect(':')
+
+            if self._peek() == '[':
+                self.position += 1
+                if self._peek() == ']':
+                    self.position += 1
+                else:
+                    while True:
+                        yield section, self._decode()
+                        if self._expect(',', ']') == ']':
+                            break
+            else:
+                self._decode()
+
+            if self._expect(',', '}') == '}':
+                return
 
 
 class Command(BaseCommand):
     """
     Django management command to populate the database from a JSON file.
     """
+    help = 'Populate the database from a JSON (or NDJSON) dump of degrees, spotlights and jobs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='db.json', help='Path to the JSON or NDJSON file.')
+        parser.add_argument(
+            '--format',
+            choices=['json', 'ndjson'],
+            help='Format of the file. By default it is detected from the file extension.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows inserted per query and per transaction.',
+        )
+        parser.add_argument(
+            '--creator',
+            type=int,
+            default=1,
+            help='Id of the user who becomes the creator of new organizations.',
+        )
+
     def handle(self, *args, **options):
         """
         Handle the command.
 
-        Reads data from 'db.json' and creates instances of the
-        Degree, Spotlight, Job, Organization, and Location models.
+        Streams the records from the file and creates instances of the
+        Degree, Spotlight, Job, Organization, and Location models in batches.
         """
-        with open('db.json') as file:
-            db_json = json.loads(file.read())
+        self.verbosity = options['verbosity']
+        self.batch_size = options['batch_size']
+        self.creator_id = options['creator']
+        if self.batch_size < 1:
+            raise CommandError('--batch-size must be a positive integer.')
+
+        file_format = options['format']
+        if file_format is None:
+            file_format = 'ndjson' if options['path'].endswith(('.ndjson', '.jsonl')) else 'json'
 
-        degrees = db_json.get('degrees')
-        spotlights = db_json.get('spotlights')
-        jobs = db_json.get('jobs')
+        self.counts = {'degrees': 0, 'spotlights': 0, 'jobs': 0}
+        self.started_at = time.monotonic()
 
-        # Create Degree instances
-        for degree in degrees:
-            Degree.objects.get_or_create(name=degree.get('degree', ''))
+        try:
+            with open(options['path']) as file:
+                records = self.read_ndjson(file) if file_format == 'ndjson' else JSONStreamReader(file)
+                self.load(records)
+        except OSError as error:
+            raise CommandError(f'Cannot read {options["path"]}: {error}')
 
-        # Create Spotlight instances
+        elapsed = time.monotonic() - self.started_at
+        total = sum(self.counts.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {self.counts["degrees"]} degrees, {self.counts["spotlights"]} spotlights '
+            f'and {self.counts["jobs"]} jobs in {elapsed:.1f}s ({total / max(elapsed, 1e-6):.0f} rows/s).'
+        ))
+
+    @staticmethod
+    def read_ndjson(file):
+        """Yield ('jobs', job) for every non-empty line of an NDJSON file."""
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield 'jobs', json.loads(line)
+            except json.JSONDecodeError as error:
+                raise CommandError(f'Invalid JSON on line {line_number}: {error}')
+
+    def load(self, records):
+        """Group consecutive records of the same section into batches and load them."""
+        loaders = {
+            'degrees': self.load_degrees,
+            'spotlights': self.load_spotlights,
+            'jobs': self.load_jobs,
+        }
+
+        batch, batch_section = [], None
+        for section, record in records:
+            if section not in loaders:
+                continue
+
+            if batch and (section != batch_section or len(batch) >= self.batch_size):
+                self.load_batch(loaders[batch_section], batch_section, batch)
+                batch = []
+            batch.append(record)
+            batch_section = section
+
+        if batch:
+            self.load_batch(loaders[batch_section], batch_section, batch)
+
+    def load_batch(self, loader, section, batch):
+        with transaction.atomic():
+            created = loader(batch)
+
+        self.counts[section] += created
+        if self.verbosity >= 2:
+            elapsed = time.monotonic() - self.started_at
+            self.stdout.write(
+                f'{section}: {self.counts[section]} created '
+                f'({sum(self.counts.values()) / max(elapsed, 1e-6):.0f} rows/s)'
+            )
+
+    @staticmethod
+    def get_or_create_by_name(model, names, **defaults):
+        """Return a {name: id} map of the given names, creating missing rows in one query."""
+        names = set(names)
+        ids = dict(model.objects.filter(name__in=names).values_list('name', 'id'))
+        missing = names - ids.keys()
+        if missing:
+            model.objects.bulk_create(
+                [model(name=name, **defaults) for name in missing],
+                ignore_conflicts=True,
+            )
+            ids.update(model.objects.filter(name__in=missing).values_list('name', 'id'))
+        return ids
+
+    def load_degrees(self, degrees):
+        """Create Degree instances."""
+        names = {degree.get('degree', '') for degree in degrees}
+        existing = set(Degree.objects.filter(name__in=names).values_list('name', flat=True))
+        created = Degree.objects.bulk_create(
+            [Degree(name=name) for name in names - existing],
+            ignore_conflicts=True,
+        )
+        return len(created)
+
+    def load_spotlights(self, spotlights):
+        """Create Spotlight instances, skipping the ones which already exist."""
+        existing = set(
+            Spotlight.objects.filter(
+                title__in={spotlight.get('title') for spotlight in spotlights},
+            ).values_list('title', 'img', 'description')
+        )
+
+        new_spotlights = {}
         for spotlight in spotlights:
-            Spotlight.objects.get_or_create(
-                title=spotlight.get('title'),
-                img=spotlight.get('img'),
-                description=spotlight.get('description')
+            key = (spotlight.get('title'), spotlight.get('img'), spotlight.get('description'))
+            if key not in existing:
+                new_spotlights[key] = Spotlight(title=key[0], img=key[1], description=key[2])
+
+        return len(Spotlight.objects.bulk_create(new_spotlights.values()))
+
+    def load_jobs(self, jobs):
+        """Create Job and related Organization and Location instances."""
+        degree_ids = self.get_or_create_by_name(Degree, (job.get('degree') for job in jobs))
+        organization_ids = self.get_or_create_by_name(
+            Organization, (job.get('organization') for job in jobs), creator_id=self.creator_id,
+        )
+        location_ids = self.get_or_create_by_name(
+            Location, (location for job in jobs for location in job.get('locations') or []),
+        )
+
+        def get_key(job):
+            return (
+                job.title, job.organization_id, job.degree_id, job.job_type,
+                tuple(job.minimum_qualifications or ()), tuple(job.preferred_qualifications or ()),
+                tuple(job.description or ()),
             )
 
-        # Create Job and related Organization and Location instances
-        for job in jobs:
-            degree_instance = Degree.objects.get(name=job.get('degree'))
-            organization_instance, created = Organization.objects.get_or_create(
-                name=job.get('organization'),
-                creator_id=1
+        existing = {
+            get_key(job)
+            for job in Job.objects.filter(
+                title__in={job.get('title') for job in jobs},
+                organization_id__in=set(organization_ids.values()),
+            ).only(
+                'title', 'organization_id', 'degree_id', 'job_type',
+                'minimum_qualifications', 'preferred_qualifications', 'description',
             )
+        }
 
-            job_instance, created = Job.objects.get_or_create(
+        new_jobs = {}
+        for job in jobs:
+            instance = Job(
                 title=job.get('title'),
-                organization=organization_instance,
-                degree=degree_instance,
+                organization_id=organization_ids[job.get('organization')],
+                degree_id=degree_ids[job.get('degree')],
                 job_type=job.get('jobType'),
                 minimum_qualifications=job.get('minimumQualifications'),
                 preferred_qualifications=job.get('preferredQualifications'),
                 description=job.get('description'),
             )
+            key = get_key(instance)
+            if key not in existing and key not in new_jobs:
+                new_jobs[key] = (instance, set(job.get('locations') or []))
+
+        if not new_jobs:
+            return 0
+
+        Job.objects.bulk_create([instance for instance, _ in new_jobs.values()], batch_size=self.batch_size)
 
-            # Create Location instances and associate them with the Job instance
-            for location in job.get('locations'):
-                location_instance, created = Location.objects.get_or_create(
-                    name=location
-                )
-                job_instance.locations.add(location_instance)
+        # Associate Location instances with the Job instances
+        JobLocation = Job.locations.through
+        JobLocation.objects.bulk_create(
+            [
+                JobLocation(job_id=instance.pk, location_id=location_ids[location])
+                for instance, locations in new_jobs.values()
+                for location in locations
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
 
-            job_instance.save()
+        jobs_bulk_created.send(sender=Job, instances=[instance for instance, _ in new_jobs.values()])
+        return len(new_jobs)
@@ -0,0 +1,115 @@
+"""
+This module defines a Django management command that load tests API endpoints.
+
+It sends GET requests to each given URL with a fixed number of concurrent
+clients and reports the throughput, latency percentiles and errors, e.g. to
+compare the WSGI viewsets with the async views served by the ASGI server:
+
+    python manage.py load_test http://web:8000/api/v1/jobs/ http://asgi:8000/api/v1/async/jobs/
+
+The 'handle' method is the entry point for the command.
+"""
+import asyncio
+import statistics
+import time
+from itertools import count
+
+import aiohttp
+from django.core.management import BaseCommand, CommandError
+from rest_framework.utils.urls import replace_query_param
+
+
+class Command(BaseCommand):
+    """
+    Django management command to measure the concurrent request capacity of API endpoints.
+    """
+    help = 'Load test API endpoints with concurrent GET requests.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('urls', nargs='+', help='URLs to load test, one after the other.')
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=2000,
+            help='Number of requests sent to each URL.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=100,
+            help='Number of concurrent clients.',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=30,
+            help='Seconds after which a request fails.',
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Add a unique query parameter to every request, so no cached response is served.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        Load tests the URLs in order and writes a report for each of them.
+        """
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests and --concurrency must be positive.')
+
+        for url in options['urls']:
+            result = asyncio.run(self.load_test(url, **options))
+            self.stdout.write(self.format_result(url, result, options['concurrency']))
+
+    async def load_test(self, url, requests, concurrency, timeout, no_cache, **options):
+        """Send the requests from `concurrency` clients and return the latencies and errors."""
+        numbers = count()
+        latencies = []
+        errors = []
+
+        async def client(session):
+            while (number := next(numbers)) < requests:
+                request_url = replace_query_param(url, 'load_test', number) if no_cache else url
+                started_at = time.perf_counter()
+                try:
+                    async with session.get(request_url) as response:
+                        await response.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                    errors.append(type(error).__name__)
+                    continue
+
+                if response.status == 200:
+                    latencies.append(time.perf_counter() - started_at)
+                else:
+                    errors.append(f'HTTP {response.status}')
+
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as session:
+            started_at = time.perf_counter()
+            await asyncio.gather(*(client(session) for _ in range(concurrency)))
+            duration = time.perf_counter() - started_at
+
+        return {'duration': duration, 'latencies': latencies, 'errors': errors}
+
+    @staticmethod
+    def format_result(url, result, concurrency):
+        latencies = sorted(result['latencies'])
+        lines = [
+            f'{url} with {concurrency} concurrent clients:',
+            f'  {len(latencies) / result["duration"]:.1f} successful requests/s, '
+            f'{len(latencies)} succeeded, {len(result["errors"])} failed in {result["duration"]:.1f}s',
+        ]
+        if len(latencies) > 1:
+            p50, p95, p99 = (statistics.quantiles(latencies, n=100)[index] for index in (49, 94, 98))
+            lines.append(
+                f'  latency p50 {p50 * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms, '
+                f'p99 {p99 * 1000:.0f}ms, max {latencies[-1] * 1000:.0f}ms'
+            )
+        if result['errors']:
+            lines.append('  errors: ' + ', '.join(sorted(set(result['errors']))))
+        return '\n'.join(lines)
@@ -0,0 +1,29 @@
+"""
+This module defines a Django management command that recounts the jobs of the locations.
+
+The job counts of the locations are changed in place by every write of the job
+locations (see job_search.listings). Writes which bypass the signals, like raw
+SQL, make them drift; this command recounts them from the links and corrects
+the locations whose counts differ. It is meant to run periodically.
+
+The 'handle' method is the entry point for the command.
+"""
+from django.core.management import BaseCommand
+
+from job_search.cache import get_tag, invalidate_tags
+from job_search.listings import recount_location_job_counts
+from job_search.models import Location
+
+
+class Command(BaseCommand):
+    """
+    Django management command to correct the job counts of the locations.
+    """
+    help = 'Recount the jobs of every location and correct the counts which drifted.'
+
+    def handle(self, *args, **options):
+        corrected = recount_location_job_counts()
+        if corrected:
+            # The autocomplete responses are ranked by the counts.
+            invalidate_tags([get_tag(Location)])
+        self.stdout.write(self.style.SUCCESS(f'Corrected the job counts of {corrected} locations.'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-18 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_search', '0006_alter_degree_options_alter_job_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['date_added', 'id'], name='job_date_added_id_idx'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+# Generated by Django 5.0 on 2026-10-18 10:05
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_search', '0007_job_date_added_id_idx'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ]
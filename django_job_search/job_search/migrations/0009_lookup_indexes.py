@@ -0,0 +1,34 @@
+# Generated by Django 5.0 on 2026-10-18 08:57
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently so that existing tables aren't locked against writes.
+    atomic = False
+
+    dependencies = [
+        ('job_search', '0008_trigram_extension'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='degree',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='degree_name_upper_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['job_type', 'date_added', 'id'], name='job_type_date_added_id_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='job_title_upper_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='organization',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='organization_name_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.0 on 2026-10-18 09:03
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+import django_jsonform.models.fields
+from django.db import migrations, models
+
+# Fill the listings of the existing jobs (see job_search.listings).
+FILL_JOB_LISTINGS_SQL = '''
+INSERT INTO job_search_joblisting (
+    id, title, degree_id, degree_name, organization_id, organization_name,
+    location_ids, location_names, minimum_qualifications, job_type, date_added
+)
+SELECT
+    job.id, job.title, degree.id, degree.name, organization.id, organization.name,
+    COALESCE(ARRAY_AGG(location.id ORDER BY location.id) FILTER (WHERE location.id IS NOT NULL), '{}'),
+    COALESCE(ARRAY_AGG(location.name ORDER BY location.id) FILTER (WHERE location.id IS NOT NULL), '{}'),
+    job.minimum_qualifications, job.job_type, job.date_added
+FROM job_search_job job
+JOIN job_search_degree degree ON degree.id = job.degree_id
+JOIN job_search_organization organization ON organization.id = job.organization_id
+LEFT JOIN job_search_job_locations job_location ON job_location.job_id = job.id
+LEFT JOIN job_search_location location ON location.id = job_location.location_id
+GROUP BY job.id, degree.id, organization.id
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_search', '0009_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobListing',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=100, verbose_name='job title')),
+                ('degree_id', models.BigIntegerField()),
+                ('degree_name', models.CharField(max_length=30, verbose_name='degree name')),
+                ('organization_id', models.BigIntegerField()),
+                ('organization_name', models.CharField(verbose_name='organization name')),
+                ('location_ids', django_jsonform.models.fields.ArrayField(base_field=models.BigIntegerField(), default=list, size=None)),
+                ('location_names', django_jsonform.models.fields.ArrayField(base_field=models.CharField(), default=list, size=None)),
+                ('minimum_qualifications', django_jsonform.models.fields.ArrayField(base_field=models.CharField(max_length=255), size=None)),
+                ('job_type', models.CharField(choices=[('Full-time', 'Full-time'), ('Part-time', 'Part-time'), ('Intern', 'Intern'), ('Temporary', 'Temporary')], max_length=50, verbose_name='job type')),
+                ('date_added', models.DateField()),
+            ],
+            options={
+                'verbose_name': 'job listing',
+                'verbose_name_plural': 'job listings',
+                'indexes': [models.Index(fields=['date_added', 'id'], name='listing_date_added_id_idx'), models.Index(fields=['job_type', 'date_added', 'id'], name='listing_type_date_id_idx'), django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='listing_title_upper_trgm_idx'), models.Index(django.db.models.functions.text.Upper('organization_name'), name='listing_org_name_upper_idx'), models.Index(django.db.models.functions.text.Upper('degree_name'), name='listing_degree_name_upper_idx'), django.contrib.postgres.indexes.GinIndex(fields=['location_ids'], name='listing_location_ids_idx')],
+            },
+        ),
+        migrations.RunSQL(FILL_JOB_LISTINGS_SQL, migrations.RunSQL.noop),
+    ]
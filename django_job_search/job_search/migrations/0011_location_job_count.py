@@ -0,0 +1,28 @@
+# Generated by Django 5.0 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+# Count the jobs of the existing locations (see job_search.listings).
+FILL_LOCATION_JOB_COUNTS_SQL = '''
+UPDATE job_search_location location
+SET job_count = (
+    SELECT COUNT(*) FROM job_search_job_locations job_location
+    WHERE job_location.location_id = location.id
+)
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_search', '0010_joblisting'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='location',
+            name='job_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='number of jobs'),
+        ),
+        migrations.RunSQL(FILL_LOCATION_JOB_COUNTS_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0 on 2026-10-18 10:12
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently so that existing tables aren't locked against writes.
+    atomic = False
+
+    dependencies = [
+        ('job_search', '0011_location_job_count'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='location',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'), name='location_name_prefix_idx'),
+        ),
+    ]
@@ -8,14 +8,24 @@ The models include:
 - Location: Represents a location with a unique name.
 - Job: Represents a job with a title, associated degree, organization, and locations, 
   preferred and minimum qualifications, a description, job type, and dates when the job was added and updated.
+- JobListing: Denormalized copy of a Job with the names of its related objects, read by the job list.
 """
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from django_jsonform.models.fields import ArrayField
 
+JOB_TYPE_CHOICES = [
+    ("Full-time", "Full-time"),
+    ("Part-time", "Part-time"),
+    ("Intern", "Intern"),
+    ("Temporary", "Temporary"),
+]
+
 
 class Spotlight(models.Model):
     """
@@ -44,6 +54,10 @@ class Degree(models.Model):
     class Meta:
         verbose_name = _('degree')
         verbose_name_plural = _('degrees')
+        indexes = [
+            # Case-insensitive (iexact) lookups compare UPPER(name).
+            models.Index(Upper('name'), name='degree_name_upper_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -65,6 +79,10 @@ class Organization(models.Model):
     class Meta:
         verbose_name = _('organization')
         verbose_name_plural = _('organizations')
+        indexes = [
+            # Case-insensitive (iexact) lookups compare UPPER(name).
+            models.Index(Upper('name'), name='organization_name_upper_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -76,10 +94,16 @@ class Location(models.Model):
     Represents a location with a unique name.
     """
     name = models.CharField(_("location name"), unique=True)
+    # Number of jobs in the location, kept up to date on write (see job_search.listings).
+    job_count = models.PositiveIntegerField(_("number of jobs"), default=0, editable=False)
 
     class Meta:
         verbose_name = _('location')
         verbose_name_plural = _('locations')
+        indexes = [
+            # Autocomplete matches the start of UPPER(name) with a LIKE 'PREFIX%' pattern.
+            models.Index(OpClass(Upper('name'), name='text_pattern_ops'), name='location_name_prefix_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -104,12 +128,7 @@ class Job(models.Model):
     job_type = models.CharField(
         _("job type"),
         max_length=50,
-        choices=[
-            ("Full-time", "Full-time"),
-            ("Part-time", "Part-time"),
-            ("Intern", "Intern"),
-            ("Temporary", "Temporary"),
-        ],
+        choices=JOB_TYPE_CHOICES,
     )
 
     date_added = models.DateField(auto_now_add=True)
@@ -118,6 +137,52 @@ class Job(models.Model):
     class Meta:
         verbose_name = _('job')
         verbose_name_plural = _('jobs')
+        indexes = [
+            # Keyset pagination of the job list walks (date_added, id).
+            models.Index(fields=['date_added', 'id'], name='job_date_added_id_idx'),
+            # Job type filters combined with the default ordering by date.
+            models.Index(fields=['job_type', 'date_added', 'id'], name='job_type_date_added_id_idx'),
+            # icontains lookups match UPPER(title) against a LIKE '%...%' pattern.
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='job_title_upper_trgm_idx'),
+        ]
 
     def __str__(self):
         return f'{self.title} by {self.organization.name}'
+
+
+class JobListing(models.Model):
+    """
+    JobListing model.
+    Denormalized read model of a Job for the job list: the names of the degree,
+    organization and locations are stored in the row, so a page of jobs is read
+    with a single query without joins. The row has the primary key of its Job
+    and is kept up to date on write (see job_search.listings).
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(_("job title"), max_length=100)
+
+    degree_id = models.BigIntegerField()
+    degree_name = models.CharField(_("degree name"), max_length=30)
+    organization_id = models.BigIntegerField()
+    organization_name = models.CharField(_("organization name"))
+    location_ids = ArrayField(models.BigIntegerField(), default=list)
+    location_names = ArrayField(models.CharField(), default=list)
+
+    minimum_qualifications = ArrayField(models.CharField(max_length=255))
+    job_type = models.CharField(_("job type"), max_length=50, choices=JOB_TYPE_CHOICES)
+    date_added = models.DateField()
+
+    class Meta:
+        verbose_name = _('job listing')
+        verbose_name_plural = _('job listings')
+        indexes = [
+            models.Index(fields=['date_added', 'id'], name='listing_date_added_id_idx'),
+            models.Index(fields=['job_type', 'date_added', 'id'], name='listing_type_date_id_idx'),
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='listing_title_upper_trgm_idx'),
+            models.Index(Upper('organization_name'), name='listing_org_name_upper_idx'),
+            models.Index(Upper('degree_name'), name='listing_degree_name_upper_idx'),
+            GinIndex(fields=['location_ids'], name='listing_location_ids_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.title} by {self.organization_name}'
@@ -0,0 +1,316 @@
+"""
+This module measures the API endpoints against performance budgets.
+
+It seeds a realistic volume of data, requests every route of the API in-process
+through the Django test clients, and records the number of database queries and
+the latency of each endpoint. The check_performance_budgets command compares
+the measurements with the budgets checked in as performance_budgets.json.
+
+Each request runs in a transaction which is rolled back, so the seeded data and
+the writes of the endpoints never change the database. A unique query parameter
+keeps the cached responses of the API from being served or overwritten, and each
+anonymous request comes from its own address, so it isn't throttled.
+"""
+import json
+import random
+import statistics
+import time
+import uuid
+from itertools import count
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from django.utils.http import urlencode
+from rest_framework.authtoken.models import Token
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from job_search.models import JOB_TYPE_CHOICES, Degree, Location, Organization, Job, Spotlight
+from job_search.signals import jobs_bulk_created
+
+PASSWORD = 'Performance-Budget-1'
+
+TITLE_LEVELS = ['Junior', 'Middle', 'Senior', 'Lead', 'Principal', 'Staff']
+TITLE_ROLES = [
+    'Software Engineer', 'Backend Developer', 'Frontend Developer', 'Data Engineer',
+    'DevOps Engineer', 'QA Engineer', 'Product Manager', 'Data Scientist',
+]
+QUALIFICATIONS = [
+    'Python', 'Django', 'PostgreSQL', 'Redis', 'Elasticsearch', 'Docker', 'Kubernetes',
+    'JavaScript', 'TypeScript', 'React', 'AWS', 'Linux', 'Git', 'REST APIs', 'SQL',
+]
+
+
+def seed_data(jobs=10000, locations=1000, locations_per_job=5, organizations=200, degrees=10, seed=0):
+    """
+    Create users, organizations, degrees, locations and jobs in bulk,
+    and return the objects which the endpoints are requested with.
+    Every job has between one and `locations_per_job` locations.
+    """
+    rng = random.Random(seed)
+    # Names are unique, the suffix keeps them apart from the existing rows.
+    suffix = uuid.uuid4().hex[:8]
+
+    user_model = get_user_model()
+    user = user_model.objects.create_user(email=f'performance-{suffix}@example.com', password=PASSWORD)
+    admin = user_model.objects.create_superuser(email=f'performance-admin-{suffix}@example.com', password=PASSWORD)
+
+    organization_objects = Organization.objects.bulk_create(
+        Organization(name=f'Organization {index} {suffix}', creator=user) for index in range(organizations)
+    )
+    degree_objects = Degree.objects.bulk_create(
+        Degree(name=f'Degree {index} {suffix}') for index in range(degrees)
+    )
+    location_objects = Location.objects.bulk_create(
+        Location(name=f'Location {index} {suffix}') for index in range(locations)
+    )
+
+    # The first job is published by the first organization, which the user edits.
+    job_objects = Job.objects.bulk_create(
+        (
+            Job(
+                title=f'{rng.choice(TITLE_LEVELS)} {rng.choice(TITLE_ROLES)}',
+                organization=rng.choice(organization_objects) if index else organization_objects[0],
+                degree=rng.choice(degree_objects),
+                job_type=rng.choice(JOB_TYPE_CHOICES)[0],
+                minimum_qualifications=rng.sample(QUALIFICATIONS, 3),
+                preferred_qualifications=rng.sample(QUALIFICATIONS, 2),
+                description=['Build and run the services of the team.'],
+            )
+            for index in range(jobs)
+        ),
+        batch_size=1000,
+    )
+    JobLocation = Job.locations.through
+    JobLocation.objects.bulk_create(
+        (
+            JobLocation(job_id=job.pk, location_id=location.pk)
+            for job in job_objects
+            for location in rng.sample(location_objects, rng.randint(1, min(locations_per_job, locations)))
+        ),
+        batch_size=5000,
+    )
+    jobs_bulk_created.send(sender=Job, instances=job_objects)
+
+    return {
+        'user': user,
+        'user_token': Token.objects.create(user=user).key,
+        'admin_token': Token.objects.create(user=admin).key,
+        'refresh_token': str(RefreshToken.for_user(user)),
+        'organization': organization_objects[0],
+        'degree': degree_objects[0],
+        'location': location_objects[0],
+        'job': job_objects[0],
+        'spotlight': Spotlight.objects.create(
+            title='Performance', img='https://example.com/performance.png', description='Performance budgets',
+        ),
+        'suffix': suffix,
+    }
+
+
+def job_data(objects, title='Backend Engineer'):
+    return {
+        'title': title,
+        'degree': objects['degree'].name,
+        'organization': objects['organization'].name,
+        'locations': [objects['location'].name, f'New Location {objects["suffix"]}'],
+        'minimumQualifications': ['Python'],
+        'preferredQualifications': ['Django'],
+        'description': ['Develop software'],
+        'jobType': 'Full-time',
+    }
+
+
+class Endpoint:
+    """
+    A request of the budget suite, named '<METHOD> <url name>[ <label>]'.
+    The URL kwargs, query parameters and body are built from the seeded objects.
+    """
+
+    def __init__(self, method, url_name, kwargs=None, query=None, data=None, auth=None, statuses=(200,), label=''):
+        self.method = method
+        self.url_name = url_name
+        self.kwargs = kwargs or (lambda objects: {})
+        self.query = query or {}
+        self.data = data
+        self.auth = auth
+        self.statuses = statuses
+        self.name = f'{method} {url_name}' + (f' {label}' if label else '')
+        # Endpoints of the search app query Elasticsearch.
+        self.uses_search = url_name.startswith('job_search:search:')
+
+    def get_request(self, objects):
+        """Return the path, the JSON body and the headers of the request."""
+        path = reverse(self.url_name, kwargs=self.kwargs(objects))
+        body = json.dumps(self.data(objects)) if self.data is not None else ''
+        headers = {'Authorization': f'Token {objects[self.auth]}'} if self.auth else {}
+        return path, body, headers
+
+
+def _pk(name):
+    return lambda objects: {'pk': objects[name].pk}
+
+
+ENDPOINTS = [
+    Endpoint('GET', 'job_search:api-root'),
+
+    Endpoint('GET', 'job_search:organization-list'),
+    Endpoint('GET', 'job_search:organization-detail', _pk('organization')),
+    Endpoint(
+        'POST', 'job_search:organization-list', data=lambda objects: {'name': f'New Organization {objects["suffix"]}'},
+        auth='user_token', statuses=(201,),
+    ),
+    Endpoint(
+        'PATCH', 'job_search:organization-detail', _pk('organization'),
+        data=lambda objects: {'name': f'Renamed Organization {objects["suffix"]}'}, auth='user_token',
+    ),
+
+    Endpoint('GET', 'job_search:degree-list'),
+    Endpoint('GET', 'job_search:degree-detail', _pk('degree')),
+    Endpoint('GET', 'job_search:location-list'),
+    Endpoint('GET', 'job_search:location-autocomplete', query={'q': 'location 1'}),
+    Endpoint('GET', 'job_search:spotlight-list'),
+    Endpoint('GET', 'job_search:spotlight-detail', _pk('spotlight')),
+
+    Endpoint('GET', 'job_search:job-list'),
+    Endpoint('GET', 'job_search:job-list', query={'page': 10}, label='page 10'),
+    Endpoint('GET', 'job_search:job-list', query={'pagination': 'cursor'}, label='cursor'),
+    Endpoint(
+        'GET', 'job_search:job-list', query={'jobType': 'Full-time', 'title': 'engineer', 'ordering': '-date_added'},
+        label='filtered',
+    ),
+    Endpoint('GET', 'job_search:job-detail', _pk('job')),
+    Endpoint('POST', 'job_search:job-list', data=job_data, auth='user_token', statuses=(201,)),
+    Endpoint('PATCH', 'job_search:job-detail', _pk('job'), data=lambda objects: {'title': 'Backend Engineer'},
+             auth='user_token'),
+    Endpoint('DELETE', 'job_search:job-detail', _pk('job'), auth='user_token', statuses=(204,)),
+    Endpoint(
+        'POST', 'job_search:job-bulk', data=lambda objects: [job_data(objects, f'Engineer {index}') for index in range(20)],
+        auth='user_token', statuses=(201,),
+    ),
+    Endpoint('GET', 'job_search:job-facets', query={'jobType': 'Full-time'}),
+
+    Endpoint('GET', 'job_search:async-job-list'),
+    Endpoint('GET', 'job_search:async-job-detail', _pk('job')),
+    Endpoint('GET', 'job_search:async-location-list'),
+
+    Endpoint('GET', 'job_search:search:job-list', query={'search': 'engineer'}),
+    # The seeded jobs are only indexed once committed.
+    Endpoint('GET', 'job_search:search:job-detail', _pk('job'), statuses=(200, 404)),
+    Endpoint('GET', 'job_search:search:job-suggest', query={'q': 'eng', 'jobType': 'Full-time'}),
+    Endpoint('GET', 'job_search:search:job-suggest', query={'q': 'eng', 'location': [1, 2]}, label='location'),
+    Endpoint('GET', 'job_search:search:async-job-list', query={'search': 'engineer'}),
+
+    Endpoint(
+        'POST', 'job_search:accounts:create',
+        data=lambda objects: {'email': f'new-{objects["suffix"]}@example.com', 'password': PASSWORD},
+        statuses=(201,),
+    ),
+    Endpoint('POST', 'job_search:accounts:token', data=lambda objects: {'email': objects['user'].email, 'password': PASSWORD}),
+    Endpoint(
+        'POST', 'job_search:accounts:jwt_obtain_pair',
+        data=lambda objects: {'email': objects['user'].email, 'password': PASSWORD},
+    ),
+    Endpoint('POST', 'job_search:accounts:jwt_refresh', data=lambda objects: {'refresh': objects['refresh_token']}),
+    Endpoint('GET', 'job_search:accounts:me', auth='user_token'),
+
+    Endpoint('GET', 'job_search:pool-stats', auth='admin_token'),
+    Endpoint('GET', 'job_search:schema-json', lambda objects: {'format': '.json'}),
+    Endpoint('GET', 'job_search:schema-swagger-ui'),
+    Endpoint('GET', 'job_search:schema-redoc-ui'),
+]
+
+# Coroutine functions which close the clients that the async views of an app bind to
+# the running event loop. Every async request is sent in an event loop of its own.
+_event_loop_cleanups = []
+
+
+def register_event_loop_cleanup(close):
+    """Register a coroutine function to await at the end of each async request."""
+    if close not in _event_loop_cleanups:
+        _event_loop_cleanups.append(close)
+
+
+# Anonymous requests are throttled per address.
+_addresses = count(1)
+
+
+def _get_address():
+    number = next(_addresses) % (1 << 24)
+    return f'10.{number >> 16}.{(number >> 8) & 255}.{number & 255}'
+
+
+async def _request_async(method, path, body, headers, address):
+    started_at = time.perf_counter()
+    response = await AsyncClient().generic(
+        method, path, body, content_type='application/json', headers=headers, REMOTE_ADDR=address,
+    )
+    duration = time.perf_counter() - started_at
+    # Clients bound to the event loop of this request are closed with it.
+    for close in _event_loop_cleanups:
+        await close()
+    return response, duration
+
+
+def _request(method, path, body, headers, address):
+    started_at = time.perf_counter()
+    response = Client().generic(
+        method, path, body, content_type='application/json', headers=headers, REMOTE_ADDR=address,
+    )
+    return response, time.perf_counter() - started_at
+
+
+def measure(endpoint, objects, repeat):
+    """
+    Send the request of the endpoint `repeat` times, after one warm-up request,
+    and return its status codes, numbers of queries and latencies.
+    """
+    path, body, headers = endpoint.get_request(objects)
+    request = async_to_sync(_request_async) if iscoroutinefunction(resolve(path).func) else _request
+
+    statuses, queries, latencies = set(), [], []
+    for number in range(repeat + 1):
+        # Responses cached by the API are neither served nor overwritten.
+        request_path = f'{path}?{urlencode({**endpoint.query, "performance": uuid.uuid4().hex}, doseq=True)}'
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as context:
+                response, duration = request(endpoint.method, request_path, body, headers, _get_address())
+            transaction.set_rollback(True)
+
+        if number:
+            statuses.add(response.status_code)
+            # Queries which silk runs to profile requests in DEBUG mode are not counted.
+            queries.append(len([
+                query for query in context.captured_queries
+                if 'silk_' not in query['sql'] and not query['sql'].startswith(('EXPLAIN', 'SAVEPOINT', 'RELEASE'))
+            ]))
+            latencies.append(duration * 1000)
+
+    p95 = statistics.quantiles(latencies, n=20, method='inclusive')[-1] if repeat > 1 else latencies[0]
+    return {
+        'statuses': sorted(statuses),
+        'queries': max(queries),
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(p95, 2),
+        'max_ms': round(max(latencies), 2),
+    }
+
+
+def check_budget(endpoint, result, budget):
+    """Return the reasons why the result of the endpoint exceeds its budget."""
+    if budget is None:
+        return ['no budget']
+
+    problems = []
+    unexpected = [status for status in result['statuses'] if status not in endpoint.statuses]
+    if unexpected:
+        problems.append(f'status {", ".join(map(str, unexpected))}')
+    if result['queries'] > budget['queries']:
+        problems.append(f'{result["queries"]} queries > {budget["queries"]}')
+    if result['p95_ms'] > budget['p95_ms']:
+        problems.append(f'p95 {result["p95_ms"]}ms > {budget["p95_ms"]}ms')
+    return problems
@@ -0,0 +1,171 @@
+"""
+This module caches the name lookups of the small reference tables:
+degrees, organizations and locations, which job writes resolve by name.
+
+A lookup tries an LRU dict of the process, bounded by settings.REFERENCE_CACHE_SIZE,
+then the Django cache (Redis), then Postgres. Entries of both tiers are keyed by
+the current version of the references tag of their model (see job_search.cache),
+which the signals in job_search.signals invalidate when an object of the model is
+renamed or deleted, through the API or the admin. Objects which are created don't
+change the existing entries, as names which aren't found are not cached.
+
+The versions themselves are kept in the process for REFERENCE_VERSION_TIMEOUT
+seconds, so lookups served by the LRU dict don't read Redis at all. The process
+which renames or deletes an object forgets the version at once, other processes
+can serve the old names until their copy expires. A write which refers to an object
+deleted meanwhile is retried within bypass_local_references(), which reads the
+current versions and skips the LRU dict of the process.
+
+Only committed rows are cached: entries are stored when the transaction
+which read them commits, so a rolled back insert is never served.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
+
+from django_job_search.routers import get_replica
+from job_search.cache import get_tag, get_tag_versions, invalidate_tags, tag_versions_created_before
+from job_search.models import Degree, Location, Organization
+
+REFERENCE_KEY_PREFIX = 'reference'
+
+# Columns of the cached objects, besides the primary key and the name.
+REFERENCE_FIELDS = {
+    Degree: (),
+    Location: (),
+    Organization: ('creator_id',),
+}
+
+
+class LRUCache:
+    """Thread-safe dict with a bounded number of keys, which evicts the least recently used key."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys):
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._data.move_to_end(key)
+                    found[key] = self._data[key]
+        return found
+
+    def set_many(self, data):
+        with self._lock:
+            for key, value in data.items():
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LRUCache(settings.REFERENCE_CACHE_SIZE)
+
+# Tag versions of the references of each model, with the monotonic time they were read at.
+local_versions = {}
+
+# Whether the lookups skip the tier of the process, see bypass_local_references().
+_bypass_local = ContextVar('bypass_local_references', default=False)
+
+
+@contextmanager
+def bypass_local_references():
+    """Look up the references within the block in the Django cache and Postgres only, by their current versions."""
+    token = _bypass_local.set(True)
+    try:
+        yield
+    finally:
+        _bypass_local.reset(token)
+
+
+def get_references_tag(model):
+    """Return the tag of the cached name lookups of the model."""
+    return f'{get_tag(model)}:references'
+
+
+def _get_tag_versions(model):
+    tag = get_references_tag(model)
+    tag_versions, read_at = local_versions.get(tag, (None, None))
+    now = time.monotonic()
+    if read_at is None or now - read_at >= settings.REFERENCE_VERSION_TIMEOUT or _bypass_local.get():
+        tag_versions = get_tag_versions([tag])
+        local_versions[tag] = tag_versions, now
+    return tag_versions
+
+
+def invalidate_references(model):
+    """Invalidate the cached name lookups of the model."""
+    tag = get_references_tag(model)
+    local_versions.pop(tag, None)
+    invalidate_tags([tag])
+
+
+def _get_key(model, version, name):
+    version = hashlib.md5(version.encode()).hexdigest()
+    name = hashlib.md5(name.encode()).hexdigest()
+    return f'{REFERENCE_KEY_PREFIX}:{get_tag(model)}:{version}:{name}'
+
+
+def _store(rows):
+    cache.set_many(rows, settings.API_CACHE_TIMEOUT)
+    local_cache.set_many(rows)
+
+
+def get_references(model, names):
+    """
+    Return the objects of the model with the given names, by name.
+    Names which don't exist are left out. The objects contain
+    the primary key, the name and the REFERENCE_FIELDS of the model.
+    """
+    names = set(names)
+    if not names:
+        return {}
+
+    fields = ('id', 'name', *REFERENCE_FIELDS[model])
+    tag_versions = _get_tag_versions(model)
+    started_at = time.time()
+    version, = tag_versions.values()
+    keys = {_get_key(model, version, name): name for name in names}
+
+    rows = {} if _bypass_local.get() else local_cache.get_many(keys)
+    if len(rows) < len(keys):
+        found = cache.get_many(keys.keys() - rows.keys())
+        local_cache.set_many(found)
+        rows.update(found)
+
+    if len(rows) < len(keys):
+        missing = [keys[key] for key in keys.keys() - rows.keys()]
+        loaded = {
+            _get_key(model, version, row[1]): row
+            for row in model.objects.filter(name__in=missing).values_list(*fields)
+        }
+        rows.update(loaded)
+
+        # A replica may not have caught up with a rename or a delete yet.
+        lag = settings.DATABASE_REPLICA_LAG
+        if loaded and (get_replica() is None or tag_versions_created_before(tag_versions, started_at - lag)):
+            transaction.on_commit(partial(_store, loaded))
+
+    db = router.db_for_read(model)
+    return {row[1]: model.from_db(db, fields, row) for row in rows.values()}
+
+
+def get_reference(model, name):
+    """Return the object of the model with the given name, or None."""
+    return get_references(model, [name]).get(name)
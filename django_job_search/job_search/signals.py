@@ -0,0 +1,203 @@
+"""
+This module connects the model signals which keep cached API responses fresh.
+
+Saving or deleting a Job, Organization, Degree, Location or Spotlight invalidates
+the cached responses containing that object and the list responses of its model.
+Invalidation runs after the transaction commits, so concurrent requests can't
+cache the data which is about to be replaced.
+
+Renaming or deleting a Degree, Organization or Location also invalidates
+the cached name lookups of its model (see job_search.references).
+
+It also keeps the JobListing read model in sync with the jobs and the names
+of their related objects, and the job counts of the locations, within
+the transaction of the write, and defines
+the jobs_bulk_created signal, sent by bulk operations which bypass post_save.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver, Signal
+
+from job_search.cache import get_tag, invalidate_tags
+from job_search.listings import (
+    refresh_job_listings,
+    delete_job_listings,
+    change_location_job_counts,
+    add_job_location_counts,
+)
+from job_search.models import Job, JobListing, Organization, Degree, Location, Spotlight
+from job_search.references import REFERENCE_FIELDS, invalidate_references
+
+CACHED_MODELS = (Job, Organization, Degree, Location, Spotlight)
+
+# Sent with `instances` after jobs and their locations were created with bulk_create().
+jobs_bulk_created = Signal()
+
+
+def invalidate_instance_cache(sender, instance, **kwargs):
+    """Invalidate responses containing the instance and lists of its model."""
+    tags = [get_tag(sender), get_tag(sender, instance.pk)]
+    transaction.on_commit(partial(invalidate_tags, tags))
+
+
+for model in CACHED_MODELS:
+    post_save.connect(
+        invalidate_instance_cache,
+        sender=model,
+        dispatch_uid=f'invalidate_cache_on_save_{model._meta.label_lower}',
+    )
+    post_delete.connect(
+        invalidate_instance_cache,
+        sender=model,
+        dispatch_uid=f'invalidate_cache_on_delete_{model._meta.label_lower}',
+    )
+
+
+def invalidate_model_references(sender, instance, created=False, **kwargs):
+    """Invalidate the name lookups of the model, unless the instance was created."""
+    if not created:
+        transaction.on_commit(partial(invalidate_references, sender))
+
+
+for model in REFERENCE_FIELDS:
+    post_save.connect(
+        invalidate_model_references,
+        sender=model,
+        dispatch_uid=f'invalidate_references_on_save_{model._meta.label_lower}',
+    )
+    post_delete.connect(
+        invalidate_model_references,
+        sender=model,
+        dispatch_uid=f'invalidate_references_on_delete_{model._meta.label_lower}',
+    )
+
+
+@receiver(m2m_changed, sender=Job.locations.through)
+def invalidate_job_locations_cache(sender, instance, action, reverse, **kwargs):
+    """Invalidate job responses when locations are added to or removed from a job."""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    # Job responses are also tagged with their locations,
+    # so a change from the location side is covered by the location tag.
+    tags = [get_tag(Job), get_tag(Location if reverse else Job, instance.pk)]
+    transaction.on_commit(partial(invalidate_tags, tags))
+
+
+@receiver(jobs_bulk_created, sender=Job)
+def invalidate_bulk_created_jobs_cache(sender, instances, **kwargs):
+    """Invalidate job and location lists after jobs were created in bulk."""
+    tags = [get_tag(Job), get_tag(Location)]
+    transaction.on_commit(partial(invalidate_tags, tags))
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_listing(sender, instance, **kwargs):
+    """Write the listing of a saved job."""
+    refresh_job_listings([instance.pk])
+
+
+@receiver(post_delete, sender=Job)
+def delete_job_listing(sender, instance, **kwargs):
+    """Delete the listing of a deleted job."""
+    delete_job_listings([instance.pk])
+
+
+@receiver(m2m_changed, sender=Job.locations.through)
+def refresh_job_locations_listing(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh the listings of jobs whose locations were changed."""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        job_ids = [instance.pk]
+    elif action == 'post_clear':
+        # The listings still contain the cleared location.
+        job_ids = JobListing.objects.filter(location_ids__contains=[instance.pk]).values_list('pk', flat=True)
+    else:
+        job_ids = pk_set
+    refresh_job_listings(job_ids)
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def refresh_location_listings(sender, instance, **kwargs):
+    """Refresh the listings of the jobs of a renamed or deleted location."""
+    if kwargs.get('created'):
+        return
+
+    refresh_job_listings(
+        JobListing.objects.filter(location_ids__contains=[instance.pk]).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_save, sender=Degree)
+def rename_degree_listings(sender, instance, created, **kwargs):
+    """Copy the name of a saved degree into the listings of its jobs."""
+    if not created:
+        JobListing.objects.filter(degree_id=instance.pk).update(degree_name=instance.name)
+
+
+@receiver(post_save, sender=Organization)
+def rename_organization_listings(sender, instance, created, **kwargs):
+    """Copy the name of a saved organization into the listings of its jobs."""
+    if not created:
+        JobListing.objects.filter(organization_id=instance.pk).update(organization_name=instance.name)
+
+
+@receiver(jobs_bulk_created, sender=Job)
+def create_bulk_created_job_listings(sender, instances, **kwargs):
+    """Write the listings of jobs created in bulk."""
+    refresh_job_listings([instance.pk for instance in instances])
+
+
+@receiver(m2m_changed, sender=Job.locations.through)
+def change_linked_location_job_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    """Count the jobs which were added to or removed from locations, in their locations."""
+    links = Job.locations.through.objects.filter(**{'location_id' if reverse else 'job_id': instance.pk})
+    linked_field = 'job_id' if reverse else 'location_id'
+
+    if action == 'pre_remove':
+        # pk_set also contains the objects which weren't linked.
+        instance._removed_link_ids = list(links.filter(**{f'{linked_field}__in': pk_set}).values_list(
+            linked_field, flat=True,
+        ))
+    elif action == 'pre_clear':
+        # The cleared links aren't known after the clear.
+        instance._removed_link_ids = list(links.values_list(linked_field, flat=True))
+    elif action in ('post_remove', 'post_clear'):
+        removed_ids = instance.__dict__.pop('_removed_link_ids', [])
+        if reverse:
+            change_location_job_counts({instance.pk: -len(removed_ids)})
+        else:
+            change_location_job_counts({location_id: -1 for location_id in removed_ids})
+    elif action == 'post_add':
+        # pk_set only contains the objects which were linked by the add.
+        if reverse:
+            change_location_job_counts({instance.pk: len(pk_set)})
+        else:
+            change_location_job_counts({location_id: 1 for location_id in pk_set})
+
+
+@receiver(pre_delete, sender=Job)
+def remember_deleted_job_locations(sender, instance, **kwargs):
+    """Keep the locations of a job which is deleted, with its links to them."""
+    instance._deleted_location_ids = list(
+        Job.locations.through.objects.filter(job_id=instance.pk).values_list('location_id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Job)
+def change_deleted_job_location_counts(sender, instance, **kwargs):
+    """Remove a deleted job from the job counts of its locations."""
+    change_location_job_counts({
+        location_id: -1 for location_id in instance.__dict__.pop('_deleted_location_ids', [])
+    })
+
+
+@receiver(jobs_bulk_created, sender=Job)
+def add_bulk_created_job_location_counts(sender, instances, **kwargs):
+    """Count the jobs created in bulk in their locations, with one UPDATE."""
+    add_job_location_counts([instance.pk for instance in instances])
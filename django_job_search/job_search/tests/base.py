@@ -0,0 +1,61 @@
+from functools import cache
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from elasticsearch_dsl.connections import connections
+
+from job_search.models import Degree, Organization, Job
+
+PASSWORD = 'Hjsajk141'
+
+
+@cache
+def elasticsearch_is_available():
+    """Check once whether the Elasticsearch of the settings answers."""
+    try:
+        return connections.get_connection().options(request_timeout=2, max_retries=0).ping()
+    except Exception:
+        return False
+
+
+def requires_elasticsearch(test):
+    """Skip the test (case) unless Elasticsearch is available."""
+    return skipUnless(elasticsearch_is_available(), 'Elasticsearch is not available.')(test)
+
+
+def create_user(email='test@example.com'):
+    return get_user_model().objects.create_user(email=email, password=PASSWORD)
+
+
+class JobTestCase(TestCase):
+    """
+    Base test case of the tests which need jobs. Creates a user, and the organization
+    and the degree which build_job() and create_job() use unless they are given others.
+    """
+
+    def setUp(self):
+        self.user = create_user()
+        self.organization = Organization.objects.create(name='GitHub', creator=self.user)
+        self.degree = Degree.objects.create(name='Bachelor')
+
+    def build_job(self, title='Software Engineer', **fields):
+        """Return an unsaved job, e.g. for bulk_create(), with the required fields filled in."""
+        return Job(**{
+            'title': title,
+            'organization': self.organization,
+            'degree': self.degree,
+            'job_type': 'Full-time',
+            'minimum_qualifications': ['Python'],
+            'preferred_qualifications': ['Django'],
+            'description': ['Develop software'],
+            **fields,
+        })
+
+    def create_job(self, title='Software Engineer', locations=(), **fields):
+        """Create a job with the required fields filled in, in the given locations."""
+        job = self.build_job(title, **fields)
+        job.save()
+        if locations:
+            job.locations.add(*locations)
+        return job
@@ -1,4 +1,7 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
@@ -430,6 +433,33 @@ class JobViewSetTestCase(TestCase):
         response = self.client.post(reverse('job_search:job-list'), data=data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    def test_create_job_with_invalid_locations(self):
+        self.client.force_authenticate(user=self.user1)
+        data = {
+            'title': 'Test Job 2',
+            'organization': self.organization1.name,
+            'degree': self.degree.name,
+            'minimum_qualifications': ['Test Qualification'],
+            'job_type': 'Full-time',
+            'preferred_qualifications': ['Test Qualification'],
+            'description': ['Test Description'],
+        }
+        for locations in ([None], [''], ['  '], [{'a': 1}], [['Kyiv']], [True]):
+            with self.subTest(locations=locations):
+                response = self.client.post(
+                    reverse('job_search:job-list'), data={**data, 'locations': locations}, format='json',
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('locations', response.data)
+        self.assertEqual(list(Location.objects.values_list('name', flat=True)), ['Test Location'])
+
+        # Names are stripped.
+        response = self.client.post(
+            reverse('job_search:job-list'), data={**data, 'locations': [' Test Location ']}, format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Location.objects.count(), 1)
+
     def test_create_job_as_non_creator_of_organization(self):
         self.client.force_authenticate(user=self.user2)
         data = {
@@ -547,3 +577,175 @@ class JobViewSetTestCase(TestCase):
         url = reverse('job_search:job-detail', kwargs={'pk': self.job.pk})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class JobCursorPaginationTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(email='test1@example.com', password='Hkfsfkdj!23')
+        self.organization = Organization.objects.create(name='Test Organization', creator=self.user)
+        self.degree = Degree.objects.create(name='Test Degree')
+        self.jobs = [
+            Job.objects.create(
+                title=f'Test Job {i}',
+                organization=self.organization,
+                degree=self.degree,
+                minimum_qualifications=['Test Qualification'],
+                job_type='Full-time' if i % 2 else 'Intern',
+                preferred_qualifications=['Test Qualification'],
+                description=['Test Description'],
+            )
+            for i in range(25)
+        ]
+
+    def collect_ids(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            ids += [job['id'] for job in response.data['results']]
+            url = response.data['next']
+        return ids
+
+    def test_cursor_pages_follow_date_added_and_id(self):
+        url = reverse('job_search:job-list') + '?pagination=cursor'
+        ids = self.collect_ids(url)
+        self.assertEqual(ids, sorted((job.id for job in self.jobs), reverse=True))
+
+    def test_cursor_pages_honour_filter_and_ordering(self):
+        url = reverse('job_search:job-list') + '?pagination=cursor&job_type=Intern&ordering=id&page_size=4'
+        ids = self.collect_ids(url)
+        self.assertEqual(ids, sorted(job.id for job in self.jobs if job.job_type == 'Intern'))
+
+    def test_cursor_previous_link(self):
+        response = self.client.get(reverse('job_search:job-list') + '?pagination=cursor')
+        first_page = [job['id'] for job in response.data['results']]
+        self.assertIsNone(response.data['previous'])
+
+        response = self.client.get(response.data['next'])
+        response = self.client.get(response.data['previous'])
+        self.assertEqual([job['id'] for job in response.data['results']], first_page)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('job_search:job-list') + '?pagination=cursor&cursor=invalid')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_is_default(self):
+        response = self.client.get(reverse('job_search:job-list'))
+        self.assertEqual(response.data['count'], 25)
+
+
+class JobBulkCreateTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user1 = get_user_model().objects.create_user(email='test1@example.com', password='Hkfsfkdj!23')
+        self.user2 = get_user_model().objects.create_user(email='test2@example.com', password='Hkfsfkdj!23')
+        self.organization1 = Organization.objects.create(name='Test Organization', creator=self.user1)
+        self.organization2 = Organization.objects.create(name='Test Organization 2', creator=self.user2)
+        self.degree = Degree.objects.create(name='Test Degree')
+        self.location = Location.objects.create(name='Test Location')
+        self.url = reverse('job_search:job-bulk')
+
+    def job_data(self, **kwargs):
+        data = {
+            'title': 'Test Job',
+            'organization': self.organization1.name,
+            'degree': self.degree.name,
+            'locations': [self.location.name, 'New Location'],
+            'minimum_qualifications': ['Test Qualification'],
+            'job_type': 'Full-time',
+            'preferred_qualifications': ['Test Qualification'],
+            'description': ['Test Description'],
+        }
+        data.update(kwargs)
+        return data
+
+    def test_bulk_create_jobs(self):
+        self.client.force_authenticate(user=self.user1)
+        data = [self.job_data(title=f'Test Job {i}') for i in range(3)]
+        response = self.client.post(self.url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        ids = [result['id'] for result in response.data['results']]
+        jobs = Job.objects.filter(id__in=ids).prefetch_related('locations')
+        self.assertEqual(len(jobs), 3)
+        for job in jobs:
+            self.assertEqual(
+                sorted(location.name for location in job.locations.all()),
+                ['New Location', 'Test Location'],
+            )
+        self.assertEqual(Location.objects.filter(name='New Location').count(), 1)
+
+    def test_bulk_create_reports_errors_per_item(self):
+        self.client.force_authenticate(user=self.user1)
+        data = [
+            self.job_data(),
+            self.job_data(degree='NonExistentDegree'),
+            self.job_data(organization=self.organization2.name),
+            self.job_data(job_type='Invalid'),
+        ]
+        response = self.client.post(self.url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+
+        results = response.data['results']
+        self.assertIn('id', results[0])
+        self.assertIn('degree', results[1]['errors'])
+        self.assertIn('organization', results[2]['errors'])
+        self.assertIn('job_type', results[3]['errors'])
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_bulk_create_reports_invalid_locations(self):
+        self.client.force_authenticate(user=self.user1)
+        data = [
+            self.job_data(),
+            self.job_data(locations=[None]),
+            self.job_data(locations=['', 'Kyiv']),
+            self.job_data(locations=[' ']),
+            self.job_data(locations=[{'a': 1}]),
+        ]
+        response = self.client.post(self.url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+
+        results = response.data['results']
+        self.assertIn('id', results[0])
+        for result in results[1:]:
+            self.assertIn('locations', result['errors'])
+        self.assertCountEqual(Location.objects.values_list('name', flat=True), ['Test Location', 'New Location'])
+
+    def test_bulk_create_without_valid_items(self):
+        self.client.force_authenticate(user=self.user1)
+        data = [self.job_data(degree='NonExistentDegree')]
+        response = self.client.post(self.url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Location.objects.filter(name='New Location').exists())
+
+    def test_bulk_create_requires_list(self):
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.post(self.url, data=self.job_data(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_as_unauthenticated(self):
+        response = self.client.post(self.url, data=[self.job_data()], format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_bulk_create_query_count_does_not_depend_on_batch_size(self):
+        self.client.force_authenticate(user=self.user1)
+
+        with CaptureQueriesContext(connection) as small_batch:
+            self.client.post(self.url, data=[self.job_data()], format='json')
+
+        data = [
+            self.job_data(title=f'Test Job {i}', locations=[f'Location {i}', f'Location {i + 1}'])
+            for i in range(20)
+        ]
+        with CaptureQueriesContext(connection) as large_batch:
+            response = self.client.post(self.url, data=data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # Requests are also profiled by silk in DEBUG mode, its own queries are not counted.
+        def count_queries(context):
+            return len([query for query in context.captured_queries if 'silk_' not in query['sql']])
+
+        self.assertEqual(count_queries(large_batch), count_queries(small_batch))
@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from job_search.api.async_views import AsyncAPIView, AsyncJobListView
+from job_search.models import Location
+from job_search.tests.base import JobTestCase
+
+
+class AsyncViewsTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.kyiv = Location.objects.create(name='Kyiv')
+        self.lviv = Location.objects.create(name='Lviv')
+        self.jobs = [self.create_job(f'Software Engineer {number}') for number in range(12)]
+        self.jobs[0].locations.add(self.kyiv, self.lviv)
+
+    def test_views_are_async(self):
+        self.assertTrue(AsyncJobListView.view_is_async)
+
+    def test_views_implement_get_data(self):
+        with self.assertRaises(TypeError):
+            AsyncAPIView()
+
+    async def test_job_list(self):
+        response = await self.async_client.get(reverse('job_search:async-job-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(data['count'], 12)
+        self.assertEqual(data['previous'], None)
+        self.assertTrue(data['next'].endswith('?page=2'))
+        self.assertEqual([job['id'] for job in data['results']], [job.pk for job in reversed(self.jobs[2:])])
+
+        response = await self.async_client.get(data['next'])
+        data = response.json()
+        self.assertEqual([job['id'] for job in data['results']], [self.jobs[1].pk, self.jobs[0].pk])
+        self.assertEqual(data['results'][-1]['locations'], ['Kyiv', 'Lviv'])
+        self.assertTrue(data['previous'].endswith('/async/jobs/'))
+        self.assertEqual(data['next'], None)
+
+    def test_job_list_matches_viewset(self):
+        url = f'?locations={self.kyiv.pk}&title=engineer'
+        response = APIClient().get(reverse('job_search:job-list') + url)
+        async_response = self.client.get(reverse('job_search:async-job-list') + url)
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.json()['results'], response.json()['results'])
+
+    def collect_pages(self, client, url):
+        pages = []
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.json()['results'])
+            url = response.json()['next']
+        return pages
+
+    def test_job_list_ordering_and_cursor_pagination_match_viewset(self):
+        for query in ('ordering=title', 'ordering=-id&pageSize=5', 'pagination=cursor&ordering=title&pageSize=5',
+                      'pagination=cursor&jobType=Full-time&ordering=-date_added'):
+            with self.subTest(query=query):
+                pages = self.collect_pages(APIClient(), f'{reverse("job_search:job-list")}?{query}')
+                async_pages = self.collect_pages(self.client, f'{reverse("job_search:async-job-list")}?{query}')
+                self.assertGreater(len(pages), 1)
+                self.assertEqual(async_pages, pages)
+
+        response = self.client.get(reverse('job_search:async-job-list'), {'pagination': 'cursor'})
+        self.assertNotIn('count', response.json())
+        response = self.client.get(reverse('job_search:async-job-list'), {'pagination': 'cursor', 'cursor': 'invalid'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_job_list_errors(self):
+        url = reverse('job_search:async-job-list')
+
+        response = await self.async_client.get(url, {'page': 3})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json(), {'detail': 'Invalid page.'})
+
+        response = await self.async_client.get(url, {'locations': 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('locations', response.json())
+
+        response = await self.async_client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    async def test_job_detail(self):
+        job = self.jobs[0]
+        response = await self.async_client.get(reverse('job_search:async-job-detail', args=[job.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(data['title'], job.title)
+        self.assertEqual(data['organization'], 'GitHub')
+        self.assertEqual(data['locations'], ['Kyiv', 'Lviv'])
+        self.assertEqual(data['preferredQualifications'], ['Django'])
+
+        response = await self.async_client.get(reverse('job_search:async-job-detail', args=[0]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_location_list(self):
+        response = await self.async_client.get(reverse('job_search:async-location-list'), {'pageSize': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 2)
+        self.assertEqual(response.json()['results'], ['Kyiv'])
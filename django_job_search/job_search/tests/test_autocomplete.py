@@ -0,0 +1,122 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from job_search.models import Location, Job
+from job_search.signals import jobs_bulk_created
+from job_search.tests.base import JobTestCase
+
+
+class LocationJobCountTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.kyiv = Location.objects.create(name='Kyiv')
+        self.lviv = Location.objects.create(name='Lviv')
+
+    def assertJobCounts(self, kyiv, lviv):
+        self.kyiv.refresh_from_db()
+        self.lviv.refresh_from_db()
+        self.assertEqual((self.kyiv.job_count, self.lviv.job_count), (kyiv, lviv))
+
+    def test_job_counts_follow_the_jobs(self):
+        job = self.create_job(locations=[self.kyiv, self.lviv])
+        other_job = self.create_job(locations=[self.kyiv])
+        self.assertJobCounts(2, 1)
+
+        job.locations.remove(self.lviv)
+        self.assertJobCounts(2, 0)
+
+        other_job.locations.clear()
+        self.assertJobCounts(1, 0)
+
+        self.lviv.jobs.add(job, other_job)
+        self.assertJobCounts(1, 2)
+
+        self.lviv.jobs.clear()
+        self.assertJobCounts(1, 0)
+
+        job.delete()
+        self.assertJobCounts(0, 0)
+
+    def test_unlinked_locations_are_not_counted(self):
+        job = self.create_job(locations=[self.kyiv])
+        job.locations.add(self.kyiv)
+        job.locations.remove(self.lviv)
+        self.lviv.jobs.remove(job)
+        self.assertJobCounts(1, 0)
+
+    def test_reconcile_job_counts(self):
+        self.create_job(locations=[self.kyiv, self.lviv])
+        Location.objects.filter(pk=self.kyiv.pk).update(job_count=5)
+
+        out = StringIO()
+        call_command('reconcile_location_job_counts', stdout=out)
+        self.assertIn('Corrected the job counts of 1 locations.', out.getvalue())
+        self.assertJobCounts(1, 1)
+
+    def test_job_counts_of_bulk_created_jobs(self):
+        jobs = Job.objects.bulk_create([self.build_job(f'Engineer {index}') for index in range(3)])
+        Job.locations.through.objects.bulk_create(
+            [Job.locations.through(job_id=job.pk, location_id=self.kyiv.pk) for job in jobs]
+            + [Job.locations.through(job_id=jobs[0].pk, location_id=self.lviv.pk)]
+        )
+        jobs_bulk_created.send(sender=Job, instances=jobs)
+        self.assertJobCounts(3, 1)
+
+
+class LocationAutocompleteTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('job_search:location-autocomplete')
+        self.kyiv = Location.objects.create(name='Kyiv')
+        self.kyivska = Location.objects.create(name='Kyivska Oblast')
+        self.kharkiv = Location.objects.create(name='Kharkiv')
+        self.create_job(locations=[self.kyivska])
+        self.create_job(locations=[self.kyivska, self.kharkiv])
+
+    def get_names(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [location['name'] for location in response.json()['results']]
+
+    def test_autocomplete(self):
+        response = self.client.get(self.url, {'q': 'kyi'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Locations with the most jobs come first.
+        self.assertEqual(response.json(), {'results': [
+            {'id': self.kyivska.pk, 'name': 'Kyivska Oblast', 'jobCount': 2},
+            {'id': self.kyiv.pk, 'name': 'Kyiv', 'jobCount': 0},
+        ]})
+        self.assertEqual(self.get_names(q='K', limit=2), ['Kyivska Oblast', 'Kharkiv'])
+        self.assertEqual(self.get_names(q='%'), [])
+        self.assertEqual(self.get_names(q=' '), [])
+
+    def test_invalid_limit(self):
+        for limit in ('ten', 0, 51):
+            response = self.client.get(self.url, {'q': 'k', 'limit': limit})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_job_changes_invalidate_the_cached_ranking(self):
+        self.assertEqual(self.get_names(q='k'), ['Kyivska Oblast', 'Kharkiv', 'Kyiv'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job(locations=[self.kyiv, self.kharkiv])
+            self.create_job(locations=[self.kyiv, self.kharkiv])
+        self.assertEqual(self.get_names(q='k'), ['Kharkiv', 'Kyiv', 'Kyivska Oblast'])
+
+    def test_prefix_index_is_used(self):
+        # QuerySet.explain() is not used as silk profiles (and explains) ORM queries in DEBUG mode.
+        queryset = Location.objects.filter(name__istartswith='kyi').order_by('-job_count', 'name')
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            # The test tables are tiny, so make the planner prefer any applicable index.
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {sql}', params)
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+        self.assertIn('location_name_prefix_idx', plan)
@@ -0,0 +1,198 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django_redis import get_redis_connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from job_search.api.serializers import JobDetailSerializer, JobListingSerializer
+from job_search.cache import get_tag_versions, invalidate_tags, tag_versions_are_current
+from job_search.models import Degree, Location, Job
+from job_search.tests.base import JobTestCase
+
+
+class TagVersionsTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_versions_are_created_once_and_expire(self):
+        versions = get_tag_versions(['job_search.job', 'job_search.job:1'])
+        self.assertEqual(get_tag_versions(['job_search.job:1', 'job_search.job']), versions)
+        self.assertTrue(tag_versions_are_current(versions))
+
+        ttl = get_redis_connection('default').ttl(cache.make_key('cache-tag:job_search.job'))
+        self.assertGreater(ttl, settings.API_CACHE_TIMEOUT)
+        self.assertLessEqual(ttl, settings.CACHE_TAG_TIMEOUT)
+
+        invalidate_tags(['job_search.job:1'])
+        self.assertFalse(tag_versions_are_current(versions))
+        new_versions = get_tag_versions(versions)
+        self.assertEqual(new_versions['job_search.job'], versions['job_search.job'])
+        self.assertNotEqual(new_versions['job_search.job:1'], versions['job_search.job:1'])
+
+    def test_concurrently_created_version_wins(self):
+        cache.set('cache-tag:job_search.job', 'stored')
+        with mock.patch.object(cache, 'get_many', return_value={}):
+            self.assertEqual(get_tag_versions(['job_search.job']), {'job_search.job': 'stored'})
+
+
+class CachedResponseTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.location = Location.objects.create(name='Test Location')
+        self.job = self.create_job('Test Job', locations=[self.location])
+        self.other_job = self.create_job('Other Job', degree=Degree.objects.create(name='Other Degree'))
+        self.job_url = reverse('job_search:job-detail', kwargs={'pk': self.job.pk})
+
+    def test_cached_response_is_replayed(self):
+        response = self.client.get(self.job_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Queryset updates don't send signals, so the cached response stays in place.
+        Job.objects.filter(pk=self.job.pk).update(title='Updated Job')
+
+        cached_response = self.client.get(self.job_url)
+        self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached_response.content, response.content)
+        self.assertEqual(cached_response['Content-Type'], response['Content-Type'])
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'api.example.com'])
+    def test_responses_are_cached_per_host_and_scheme(self):
+        # The links to the other pages are absolute URLs.
+        url = reverse('job_search:job-list') + '?page_size=1'
+        self.assertTrue(self.client.get(url).json()['next'].startswith('http://testserver/'))
+
+        response = self.client.get(url, HTTP_HOST='api.example.com')
+        self.assertTrue(response.json()['next'].startswith('http://api.example.com/'))
+        response = self.client.get(url, secure=True)
+        self.assertTrue(response.json()['next'].startswith('https://testserver/'))
+
+    def test_update_through_api_invalidates_detail(self):
+        self.client.get(self.job_url)
+
+        self.client.force_authenticate(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.job_url, data={'title': 'Updated Job'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.job_url)
+        self.assertEqual(response.json()['title'], 'Updated Job')
+
+    def test_related_object_change_invalidates_detail(self):
+        self.client.get(self.job_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.location.name = 'Updated Location'
+            self.location.save()
+
+        response = self.client.get(self.job_url)
+        self.assertEqual(response.json()['locations'], ['Updated Location'])
+
+    def test_unrelated_change_keeps_detail_cached(self):
+        self.client.get(self.job_url)
+
+        Job.objects.filter(pk=self.job.pk).update(title='Updated Job')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_job.title = 'Updated Other Job'
+            self.other_job.save()
+
+        response = self.client.get(self.job_url)
+        self.assertEqual(response.json()['title'], 'Test Job')
+
+    def test_created_object_invalidates_list(self):
+        url = reverse('job_search:degree-list')
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Degree.objects.create(name='New Degree')
+
+        response = self.client.get(url)
+        self.assertIn('New Degree', [degree['name'] for degree in response.json()['results']])
+
+    def test_location_change_of_job_invalidates_list(self):
+        url = reverse('job_search:job-list')
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other_job.locations.add(self.location)
+
+        response = self.client.get(url)
+        locations = {job['id']: job['locations'] for job in response.json()['results']}
+        self.assertEqual(locations[self.other_job.pk], ['Test Location'])
+
+
+class ConditionalResponseTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.location = Location.objects.create(name='Test Location')
+        self.job = self.create_job('Test Job', locations=[self.location])
+        self.job_url = reverse('job_search:job-detail', kwargs={'pk': self.job.pk})
+        self.list_url = reverse('job_search:job-list')
+
+    def assertNotModified(self, url, headers):
+        with mock.patch.object(JobDetailSerializer, 'to_representation') as to_representation, \
+                mock.patch.object(JobListingSerializer, 'to_representation') as listing_to_representation:
+            response = self.client.get(url, headers=headers)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        to_representation.assert_not_called()
+        listing_to_representation.assert_not_called()
+        return response
+
+    def test_detail_not_modified(self):
+        response = self.client.get(self.job_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"'))
+
+        not_modified = self.assertNotModified(self.job_url, {'If-None-Match': etag})
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertNotModified(self.job_url, {'If-Modified-Since': response['Last-Modified']})
+
+    def test_detail_validators_change_with_job_and_related_objects(self):
+        etag = self.client.get(self.job_url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.title = 'Updated Job'
+            self.job.save()
+        response = self.client.get(self.job_url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['title'], 'Updated Job')
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.location.jobs.clear()
+        response = self.client.get(self.job_url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['locations'], [])
+
+    def test_list_not_modified_until_a_job_changes(self):
+        response = self.client.get(self.list_url)
+        etag = response['ETag']
+        self.assertNotModified(self.list_url, {'If-None-Match': etag})
+
+        # Validators are per representation.
+        headers = {'If-None-Match': etag, 'Accept': 'application/json; indent=2'}
+        response = self.client.get(self.list_url, headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job('New Job')
+        response = self.client.get(self.list_url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 2)
+
+    def test_missing_job_is_not_found(self):
+        response = self.client.get(reverse('job_search:job-detail', kwargs={'pk': 0}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header('ETag'))
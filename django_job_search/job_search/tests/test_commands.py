@@ -0,0 +1,96 @@
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from job_search.management.commands.full_data_from_db_json import JSONStreamReader
+from job_search.models import Degree, Organization, Location, Spotlight, Job
+from job_search.tests.base import create_user
+
+
+class FullDataFromDbJsonCommandTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.jobs = [
+            {
+                'title': f'Software Engineer {i}',
+                'organization': f'Organization {i % 3}',
+                'degree': 'Bachelor' if i % 2 else 'Master',
+                'jobType': 'Full-time',
+                'locations': ['Remote', f'City {i % 4}'],
+                'minimumQualifications': ['Python'],
+                'preferredQualifications': ['Django'],
+                'description': ['Develop software'],
+            }
+            for i in range(7)
+        ]
+        self.db_json = {
+            'degrees': [{'id': 1, 'degree': 'Bachelor'}, {'id': 2, 'degree': 'PhD'}],
+            'spotlights': [{'id': 1, 'title': 'Spotlight', 'img': 'http://example.com/1.jpg', 'description': 'Text'}],
+            'jobs': self.jobs,
+        }
+
+    def write_file(self, suffix, content):
+        file = tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False)
+        with file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def call_command(self, *args):
+        call_command('full_data_from_db_json', *args, '--creator', str(self.user.pk), stdout=io.StringIO())
+
+    def assert_loaded(self):
+        self.assertEqual(Job.objects.count(), 7)
+        self.assertEqual(Organization.objects.count(), 3)
+        self.assertEqual(Location.objects.count(), 5)
+        job = Job.objects.get(title='Software Engineer 5')
+        self.assertEqual(job.degree.name, 'Bachelor')
+        self.assertEqual(job.organization.name, 'Organization 2')
+        self.assertEqual(sorted(location.name for location in job.locations.all()), ['City 1', 'Remote'])
+
+    def test_load_json(self):
+        path = self.write_file('.json', json.dumps(self.db_json, indent=2))
+        self.call_command(path, '--batch-size', '2')
+
+        self.assert_loaded()
+        self.assertEqual(set(Degree.objects.values_list('name', flat=True)), {'Bachelor', 'Master', 'PhD'})
+        self.assertEqual(Spotlight.objects.count(), 1)
+
+    def test_load_ndjson(self):
+        path = self.write_file('.ndjson', '\n'.join(json.dumps(job) for job in self.jobs) + '\n')
+        self.call_command(path, '--batch-size', '3')
+
+        self.assert_loaded()
+
+    def test_load_twice_skips_existing_rows(self):
+        path = self.write_file('.json', json.dumps(self.db_json))
+        self.call_command(path)
+        self.call_command(path, '--batch-size', '4')
+
+        self.assert_loaded()
+        self.assertEqual(Spotlight.objects.count(), 1)
+
+    def test_missing_file(self):
+        with self.assertRaises(CommandError):
+            self.call_command('/nonexistent/db.json')
+
+
+class JSONStreamReaderTests(TestCase):
+    def test_reads_items_across_buffer_boundaries(self):
+        document = {'numbers': [1, 12345, -3.5], 'skipped': {'a': [1]}, 'empty': [], 'words': ['a', 'b']}
+        reader = JSONStreamReader(io.StringIO(json.dumps(document)), read_size=3)
+
+        self.assertEqual(
+            list(reader),
+            [('numbers', 1), ('numbers', 12345), ('numbers', -3.5), ('words', 'a'), ('words', 'b')],
+        )
+
+    def test_truncated_document(self):
+        reader = JSONStreamReader(io.StringIO('{"jobs": [{"title": "Job"}, {"title"'), read_size=4)
+
+        with self.assertRaises(CommandError):
+            list(reader)
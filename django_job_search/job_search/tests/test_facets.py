@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from job_search.models import Degree, Location, Organization
+from job_search.tests.base import JobTestCase
+
+
+class JobFacetsTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('job_search:job-facets')
+        self.github, self.bachelor = self.organization, self.degree
+        self.gitlab = Organization.objects.create(name='GitLab', creator=self.user)
+        self.master = Degree.objects.create(name='Master')
+        self.kyiv = Location.objects.create(name='Kyiv')
+        self.lviv = Location.objects.create(name='Lviv')
+
+        self.create_job(locations=[self.kyiv, self.lviv])
+        self.create_job(degree=self.master, locations=[self.kyiv])
+        self.create_job(organization=self.gitlab, job_type='Part-time', locations=[self.lviv])
+        self.create_job(organization=self.gitlab)
+
+    def test_facets(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+            'jobType': [{'value': 'Full-time', 'count': 3}, {'value': 'Part-time', 'count': 1}],
+            'degree': [{'value': 'Bachelor', 'count': 3}, {'value': 'Master', 'count': 1}],
+            'organization': [{'value': 'GitHub', 'count': 2}, {'value': 'GitLab', 'count': 2}],
+            'locations': [
+                {'value': self.kyiv.pk, 'name': 'Kyiv', 'count': 2},
+                {'value': self.lviv.pk, 'name': 'Lviv', 'count': 2},
+            ],
+        })
+
+    def test_facets_are_counted_without_their_own_filter(self):
+        response = self.client.get(self.url, {'organization': 'gitlab', 'jobType': 'Full-time'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        # Every job type of GitLab, and every organization with full-time jobs.
+        self.assertEqual(data['jobType'], [{'value': 'Full-time', 'count': 1}, {'value': 'Part-time', 'count': 1}])
+        self.assertEqual(data['organization'], [{'value': 'GitHub', 'count': 2}, {'value': 'GitLab', 'count': 1}])
+        self.assertEqual(data['degree'], [{'value': 'Bachelor', 'count': 1}])
+        self.assertEqual(data['locations'], [])
+
+        response = self.client.get(self.url, {'locations': self.kyiv.pk})
+        data = response.json()
+        self.assertEqual(data['organization'], [{'value': 'GitHub', 'count': 2}])
+        self.assertEqual(len(data['locations']), 2)
+
+    def test_invalid_filter(self):
+        response = self.client.get(self.url, {'locations': 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_facets_are_invalidated(self):
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.kyiv.name = 'Kyiv City'
+            self.kyiv.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()['locations'][0]['name'], 'Kyiv City')
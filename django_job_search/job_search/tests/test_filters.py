@@ -1,8 +1,9 @@
+from django.db import connection
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 
-from job_search.models import Job, Organization, Degree
-from job_search.api.filters import JobFilter
+from job_search.models import Job, Organization, Degree, Location
+from job_search.api.filters import JobFilter, JobListingFilter
 
 
 class FilterTests(TestCase):
@@ -34,3 +35,92 @@ class FilterTests(TestCase):
     def test_job_filter_by_non_existent_degree(self):
         f = JobFilter({'degree': 'Master'}, queryset=Job.objects.all())
         self.assertEqual(len(f.qs), 0)
+
+
+class FilterIndexTests(TestCase):
+    """
+    The hot JobFilter queries must be able to use the lookup indexes: the conditions of the
+    filters match the expressions of the indexes. Plans aren't checked, as the planner may pick
+    any other usable index of the tiny test tables.
+    """
+
+    def get_sql(self, data, ordering=(), filterset_class=JobFilter):
+        queryset = filterset_class._meta.model.objects.order_by(*ordering)
+        sql, _ = filterset_class(data, queryset=queryset).qs.query.sql_with_params()
+        return sql
+
+    def assertIndex(self, index_name, definition):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT indexdef FROM pg_indexes WHERE indexname = %s', [index_name])
+            row = cursor.fetchone()
+        self.assertIsNotNone(row, f'{index_name} does not exist.')
+        self.assertIn(definition, row[0])
+
+    def assertFilterMatchesIndex(self, data, index_name, definition, *conditions, **kwargs):
+        self.assertIndex(index_name, definition)
+        sql = self.get_sql(data, **kwargs)
+        for condition in conditions:
+            self.assertIn(condition, sql)
+
+    def test_title_filter_uses_trigram_index(self):
+        self.assertFilterMatchesIndex(
+            {'title': 'engineer'}, 'job_title_upper_trgm_idx',
+            'job_search_job USING gin (upper((title)::text) gin_trgm_ops)',
+            'UPPER("job_search_job"."title"::text) LIKE UPPER(%s)',
+        )
+
+    def test_organization_filter_uses_upper_index(self):
+        self.assertFilterMatchesIndex(
+            {'organization': 'microsoft'}, 'organization_name_upper_idx',
+            'job_search_organization USING btree (upper((name)::text))',
+            'UPPER("job_search_organization"."name"::text) = UPPER(%s)',
+        )
+
+    def test_degree_filter_uses_upper_index(self):
+        self.assertFilterMatchesIndex(
+            {'degree': 'bachelor'}, 'degree_name_upper_idx',
+            'job_search_degree USING btree (upper((name)::text))',
+            'UPPER("job_search_degree"."name"::text) = UPPER(%s)',
+        )
+
+    def test_job_type_filter_uses_composite_index(self):
+        # The equality on the first column and the order of the others are served by the index.
+        self.assertFilterMatchesIndex(
+            {'job_type': 'Full-time'}, 'job_type_date_added_id_idx',
+            'job_search_job USING btree (job_type, date_added, id)',
+            '"job_search_job"."job_type" = %s',
+            'ORDER BY "job_search_job"."date_added" DESC, "job_search_job"."id" DESC',
+            ordering=('-date_added', '-id'),
+        )
+
+    def test_job_listing_filters_use_indexes(self):
+        table = 'job_search_joblisting'
+        location = Location.objects.create(name='Redmond')
+        cases = [
+            (
+                {'title': 'engineer'}, 'listing_title_upper_trgm_idx',
+                f'{table} USING gin (upper((title)::text) gin_trgm_ops)', f'UPPER("{table}"."title"::text) LIKE UPPER(%s)',
+            ),
+            (
+                {'organization': 'microsoft'}, 'listing_org_name_upper_idx',
+                f'{table} USING btree (upper((organization_name)::text))',
+                f'UPPER("{table}"."organization_name"::text) = UPPER(%s)',
+            ),
+            (
+                {'degree': 'bachelor'}, 'listing_degree_name_upper_idx',
+                f'{table} USING btree (upper((degree_name)::text))', f'UPPER("{table}"."degree_name"::text) = UPPER(%s)',
+            ),
+            (
+                {'locations': [location.pk]}, 'listing_location_ids_idx', f'{table} USING gin (location_ids)',
+                f'"{table}"."location_ids" &&',
+            ),
+        ]
+        for data, index_name, definition, condition in cases:
+            with self.subTest(data=data):
+                self.assertFilterMatchesIndex(data, index_name, definition, condition, filterset_class=JobListingFilter)
+
+        self.assertFilterMatchesIndex(
+            {'job_type': 'Full-time'}, 'listing_type_date_id_idx', f'{table} USING btree (job_type, date_added, id)',
+            f'"{table}"."job_type" = %s', f'ORDER BY "{table}"."date_added" DESC, "{table}"."id" DESC',
+            ordering=('-date_added', '-id'), filterset_class=JobListingFilter,
+        )
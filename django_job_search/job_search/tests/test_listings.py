@@ -0,0 +1,105 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from job_search.models import Location, Job, JobListing
+from job_search.signals import jobs_bulk_created
+from job_search.tests.base import JobTestCase
+
+
+class JobListingTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.kyiv = Location.objects.create(name='Kyiv')
+        self.lviv = Location.objects.create(name='Lviv')
+        self.job = self.create_job(locations=[self.kyiv, self.lviv])
+
+    def get_listing(self, job=None):
+        return JobListing.objects.get(pk=(job or self.job).pk)
+
+    def test_listing_is_written_on_save(self):
+        listing = self.get_listing()
+        self.assertEqual(listing.title, 'Software Engineer')
+        self.assertEqual(listing.degree_name, 'Bachelor')
+        self.assertEqual(listing.organization_name, 'GitHub')
+        self.assertEqual(listing.location_ids, [self.kyiv.pk, self.lviv.pk])
+        self.assertEqual(listing.location_names, ['Kyiv', 'Lviv'])
+        self.assertEqual(listing.date_added, self.job.date_added)
+
+        self.job.title = 'Backend Engineer'
+        self.job.save()
+        self.assertEqual(self.get_listing().title, 'Backend Engineer')
+
+    def test_listing_follows_location_changes(self):
+        self.job.locations.remove(self.kyiv)
+        self.assertEqual(self.get_listing().location_names, ['Lviv'])
+
+        self.lviv.jobs.clear()
+        self.assertEqual(self.get_listing().location_names, [])
+
+        self.kyiv.jobs.add(self.job)
+        self.kyiv.name = 'Kyiv City'
+        self.kyiv.save()
+        self.assertEqual(self.get_listing().location_names, ['Kyiv City'])
+
+        self.kyiv.delete()
+        self.assertEqual(self.get_listing().location_ids, [])
+
+    def test_listing_follows_renamed_related_objects(self):
+        self.degree.name = 'Master'
+        self.degree.save()
+        self.organization.name = 'GitLab'
+        self.organization.save()
+
+        listing = self.get_listing()
+        self.assertEqual(listing.degree_name, 'Master')
+        self.assertEqual(listing.organization_name, 'GitLab')
+
+    def test_listing_is_deleted_with_job(self):
+        self.job.delete()
+        self.assertFalse(JobListing.objects.exists())
+
+        self.create_job('Backend Engineer')
+        self.organization.delete()
+        self.assertFalse(JobListing.objects.exists())
+
+    def test_listings_of_bulk_created_jobs(self):
+        jobs = Job.objects.bulk_create([
+            self.build_job(f'Engineer {i}', job_type='Intern') for i in range(3)
+        ])
+        jobs_bulk_created.send(sender=Job, instances=jobs)
+
+        self.assertEqual(
+            set(JobListing.objects.filter(job_type='Intern').values_list('pk', flat=True)),
+            {job.pk for job in jobs},
+        )
+
+    def test_job_list_reads_listings(self):
+        cache.clear()
+        other_job = self.create_job('Data Scientist')
+        other_job.locations.add(self.lviv)
+        self.create_job('Product Manager')
+
+        with CaptureQueriesContext(connection) as context:
+            response = APIClient().get(
+                reverse('job_search:job-list'),
+                {'locations': [self.kyiv.pk, self.lviv.pk], 'organization': 'github', 'pagination': 'cursor'},
+            )
+
+        # Queries which silk runs to profile requests in DEBUG mode are not counted.
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if 'silk_' not in query['sql'] and not query['sql'].startswith('EXPLAIN')
+        ]
+        listing_queries = [sql for sql in queries if 'job_search_joblisting' in sql]
+        self.assertEqual(len(listing_queries), 1)
+        self.assertFalse(any('job_search_job_locations' in sql for sql in queries))
+
+        results = response.json()['results']
+        self.assertEqual({job['id'] for job in results}, {self.job.pk, other_job.pk})
+        job = next(job for job in results if job['id'] == self.job.pk)
+        self.assertEqual(job['locations'], ['Kyiv', 'Lviv'])
+        self.assertEqual(job['degree'], 'Bachelor')
+        self.assertEqual(job['organization'], 'GitHub')
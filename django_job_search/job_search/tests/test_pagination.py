@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from job_search.api.pagination import JobResultsPagePagination, get_count_estimate
+from job_search.models import Location, JobListing
+from job_search.tests.base import JobTestCase
+
+
+class JobCountTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.location = Location.objects.create(name='Kyiv')
+        self.jobs = [self.create_job(f'Software Engineer {number}') for number in range(12)]
+
+    def get_jobs(self, params):
+        # Requests with new query strings aren't served from the response cache.
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('job_search:job-list'), params)
+        self.assertEqual(response.status_code, 200)
+        counts = [query['sql'] for query in context.captured_queries if query['sql'].startswith('SELECT COUNT(*)')]
+        return response.json(), len(counts)
+
+    def test_count_is_cached(self):
+        data, counts = self.get_jobs({'organization': 'GitHub', 'degree': 'Bachelor'})
+        self.assertEqual(data['count'], 12)
+        self.assertTrue(data['countIsExact'])
+        self.assertEqual(counts, 1)
+
+        # Other pages, and the same filters in another order, share the count.
+        data, counts = self.get_jobs({'degree': 'Bachelor', 'organization': 'GitHub', 'page': 2})
+        self.assertEqual(data['count'], 12)
+        self.assertEqual(len(data['results']), 2)
+        self.assertEqual(counts, 0)
+
+        data, counts = self.get_jobs({'organization': 'GitLab'})
+        self.assertEqual(data['count'], 0)
+        self.assertEqual(counts, 1)
+
+    def test_count_is_invalidated(self):
+        self.get_jobs({'page': 2})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job('Backend Engineer')
+
+        data, counts = self.get_jobs({'page': 2, 'pageSize': 5})
+        self.assertEqual(data['count'], 13)
+        self.assertEqual(counts, 1)
+
+    @mock.patch.object(JobResultsPagePagination, 'count_estimate_threshold', 1)
+    def test_count_is_estimated(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {JobListing._meta.db_table}')
+        self.assertEqual(get_count_estimate(JobListing.objects.all()), 12)
+
+        data, counts = self.get_jobs({})
+        self.assertEqual(data['count'], 12)
+        self.assertFalse(data['countIsExact'])
+        self.assertEqual(counts, 0)
+
+        # Result sets estimated under the threshold are counted.
+        data, counts = self.get_jobs({'title': 'Software Engineer 11'})
+        self.assertEqual(data['count'], 1)
+        self.assertTrue(data['countIsExact'])
+        self.assertEqual(counts, 1)
+
+    def test_async_job_list(self):
+        response = self.client.get(reverse('job_search:async-job-list'))
+        data = response.json()
+        self.assertEqual(data['count'], 12)
+        self.assertTrue(data['countIsExact'])
+
+        # The async view shares the count with JobViewSet.
+        data, counts = self.get_jobs({'pageSize': 5})
+        self.assertEqual(data['count'], 12)
+        self.assertEqual(counts, 0)
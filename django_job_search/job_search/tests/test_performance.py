@@ -0,0 +1,82 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+from django.urls import URLResolver, get_resolver
+
+from job_search.cache import get_tag, get_tag_versions
+from job_search.models import Job
+from job_search.performance import ENDPOINTS
+from job_search.tests.base import elasticsearch_is_available
+
+
+def get_url_names(patterns, namespace=''):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            prefix = f'{namespace}{pattern.namespace}:' if pattern.namespace else namespace
+            yield from get_url_names(pattern.url_patterns, prefix)
+        elif pattern.name:
+            yield f'{namespace}{pattern.name}'
+
+
+class PerformanceBudgetsTestCase(TestCase):
+    def setUp(self):
+        self.budgets = json.loads((settings.BASE_DIR / 'performance_budgets.json').read_text())
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def check_budgets(self, budgets):
+        budgets_path = self.directory / 'budgets.json'
+        budgets_path.write_text(json.dumps(budgets))
+        report_path = self.directory / 'report.json'
+        try:
+            call_command(
+                # The tests already run in a throwaway database.
+                'check_performance_budgets', jobs=200, locations=50, repeat=1, use_configured_database=True,
+                without_search=not elasticsearch_is_available(),
+                budgets=budgets_path, report=report_path, stdout=StringIO(),
+            )
+        finally:
+            self.report = json.loads(report_path.read_text()) if report_path.exists() else None
+
+    def test_every_route_is_measured(self):
+        url_names = {name for name in get_url_names(get_resolver().url_patterns) if name.startswith('job_search:')}
+        self.assertEqual(url_names - {endpoint.url_name for endpoint in ENDPOINTS}, set())
+
+    def test_every_endpoint_has_a_budget(self):
+        self.assertEqual({endpoint.name for endpoint in ENDPOINTS}, set(self.budgets))
+
+    def test_query_budgets(self):
+        # Latencies depend on the machine, they are checked by running the command on its own.
+        self.check_budgets({name: {**budget, 'p95_ms': 10000} for name, budget in self.budgets.items()})
+
+        measured = {endpoint.name for endpoint in ENDPOINTS if elasticsearch_is_available() or not endpoint.uses_search}
+        self.assertEqual(set(self.report['endpoints']), measured)
+        self.assertEqual(self.report['jobs'], 200)
+        # The seeded data is rolled back.
+        self.assertFalse(Job.objects.exists())
+
+    def test_cache_is_left_alone(self):
+        cache.clear()
+        versions = get_tag_versions([get_tag(Job)])
+        cache.set('cached-response', 'content')
+
+        self.check_budgets({name: {**budget, 'p95_ms': 10000} for name, budget in self.budgets.items()})
+
+        self.assertEqual(get_tag_versions([get_tag(Job)]), versions)
+        self.assertEqual(cache.get('cached-response'), 'content')
+
+    def test_exceeded_budget(self):
+        budgets = {name: {**budget, 'p95_ms': 10000} for name, budget in self.budgets.items()}
+        budgets['GET job_search:job-list'] = {'queries': 0, 'p95_ms': 10000}
+        del budgets['GET job_search:api-root']
+
+        with self.assertRaisesMessage(CommandError, '2 endpoints exceed their budgets'):
+            self.check_budgets(budgets)
+
+        self.assertEqual(self.report['endpoints']['GET job_search:job-list']['problems'], ['1 queries > 0'])
+        self.assertEqual(self.report['endpoints']['GET job_search:api-root']['problems'], ['no budget'])
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from redis import ConnectionError, Redis
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from django_job_search.pools import CountingBlockingConnectionPool, count_database_connection, stats
+
+
+class PoolStatsTestCase(SimpleTestCase):
+    def setUp(self):
+        stats.reset()
+        self.addCleanup(stats.reset)
+
+    def test_redis_pool_counters(self):
+        pool = CountingBlockingConnectionPool.from_url(
+            settings.CACHES['default']['LOCATION'], max_connections=1, timeout=0.1,
+        )
+        self.addCleanup(pool.disconnect)
+
+        connection = pool.get_connection()
+        connection.send_command('PING')
+        connection.read_response()
+        with self.assertRaises(ConnectionError):
+            pool.get_connection()
+        pool.release(connection)
+
+        # The broken connection is replaced on the next command.
+        connection.disconnect()
+        Redis(connection_pool=pool).ping()
+
+        self.assertEqual(
+            stats.snapshot()['redis'],
+            {'checkouts': 3, 'waits': 1, 'connections': 1, 'reconnects': 1},
+        )
+
+    def test_database_connection_counters(self):
+        connection = SimpleNamespace()
+        count_database_connection(sender=None, connection=connection)
+        count_database_connection(sender=None, connection=connection)
+        count_database_connection(sender=None, connection=SimpleNamespace())
+
+        self.assertEqual(stats.snapshot()['postgres'], {'connections': 2, 'reconnects': 1})
+
+
+class PoolStatsAPIViewTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('job_search:pool-stats')
+
+    def test_pool_stats_for_admin(self):
+        admin = get_user_model().objects.create_superuser(email='admin@example.com', password='Hkfsfkdj!23')
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['redis']['maxConnections'], settings.REDIS_MAX_CONNECTIONS)
+
+    def test_pool_stats_forbidden_for_user(self):
+        user = get_user_model().objects.create_user(email='user@example.com', password='Hkfsfkdj!23')
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,91 @@
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Prefetch
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from djangorestframework_camel_case.util import camelize
+from rest_framework.test import APIClient
+
+from job_search.api.projections import JobListingProjection, Projection
+from job_search.api.serializers import JobListingSerializer, JobSerializer
+from job_search.models import Degree, Location, Organization, Job, JobListing
+from job_search.tests.base import JobTestCase
+
+
+class JobListingProjectionTestCase(JobTestCase):
+    """The projection must represent jobs exactly like JobSerializer."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        organizations = [self.organization, Organization.objects.create(name='Інша організація', creator=self.user)]
+        degrees = [self.degree, Degree.objects.create(name='Master')]
+        locations = [Location.objects.create(name=name) for name in ('Kyiv', 'Lviv', 'Remote')]
+
+        for index in range(5):
+            self.create_job(
+                f'Software Engineer {index}',
+                locations=locations[:index % 4],
+                organization=organizations[index % 2],
+                degree=degrees[index % 2],
+                job_type='Full-time' if index % 2 else 'Part-time',
+                minimum_qualifications=['Python', 'SQL'][:index % 3],
+            )
+
+    def get_jobs(self):
+        # The JobListing rows list the locations by id, the prefetch is ordered like them for the comparison.
+        return Job.objects.select_related('degree', 'organization').prefetch_related(
+            Prefetch('locations', queryset=Location.objects.order_by('id')),
+        ).order_by('-id')
+
+    def test_projections_implement_to_representation(self):
+        with self.assertRaises(TypeError):
+            Projection()
+
+    def test_projection_matches_job_serializer(self):
+        projection = JobListingProjection()
+        rows = {row['id']: row for row in projection.get_queryset(JobListing.objects.all())}
+
+        for job in self.get_jobs():
+            with self.subTest(job=job.title):
+                self.assertEqual(projection.to_representation(rows[job.pk]), JobSerializer(job).data)
+
+    def test_projection_matches_job_listing_serializer(self):
+        projection = JobListingProjection()
+        rows = {row['id']: row for row in projection.get_queryset(JobListing.objects.all())}
+
+        for listing in JobListing.objects.all():
+            with self.subTest(job=listing.title):
+                self.assertEqual(projection.to_representation(rows[listing.pk]), JobListingSerializer(listing).data)
+
+    def test_list_renders_job_serializer_data(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('job_search:job-list'), {'ordering': '-id'})
+        self.assertEqual(response.status_code, 200)
+
+        results = json.loads(response.content)['results']
+        self.assertEqual(results, camelize(json.loads(json.dumps(JobSerializer(self.get_jobs(), many=True).data))))
+
+        # A count and a page, both from the JobListing table.
+        # Queries which silk runs to profile requests in DEBUG mode are not counted.
+        listing_queries = [
+            query['sql'] for query in queries.captured_queries
+            if 'job_search_joblisting' in query['sql']
+            and 'silk_' not in query['sql'] and not query['sql'].startswith('EXPLAIN')
+        ]
+        self.assertEqual(len(listing_queries), 2)
+
+    def test_list_is_invalidated_by_projected_rows(self):
+        url = reverse('job_search:job-list')
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            degree = Degree.objects.get(name='Master')
+            degree.name = 'Doctorate'
+            degree.save()
+
+        results = json.loads(self.client.get(url).content)['results']
+        self.assertIn('Doctorate', {job['degree'] for job in results})
@@ -0,0 +1,205 @@
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from job_search.models import Degree, Location, Organization
+from job_search.references import get_references, local_cache, local_versions
+from job_search.tests.base import JobTestCase, create_user
+
+
+class QueryBudgetTestCase(JobTestCase):
+    """
+    Exact numbers of queries of the JobViewSet and OrganizationViewSet actions.
+    Responses are not served from the cache, which is cleared before each request.
+    Name lookups of degrees, organizations and locations are only cached when their
+    transaction commits, which test transactions don't, unless a test commits them.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.other_user = create_user('other@example.com')
+        self.other_organization = Organization.objects.create(name='GitLab', creator=self.other_user)
+        self.location = Location.objects.create(name='Kyiv')
+        self.jobs = [self.create_job(f'Software Engineer {index}', locations=[self.location]) for index in range(3)]
+
+    @contextmanager
+    def assertQueryBudget(self, budget, clear_cache=True):
+        if clear_cache:
+            cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            yield
+        # Queries which silk runs to profile requests in DEBUG mode are not counted, nor the savepoints
+        # of the atomic blocks, which are transactions outside of the tests.
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if 'silk_' not in query['sql']
+            and not query['sql'].startswith(('EXPLAIN', 'SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT'))
+        ]
+        self.assertEqual(len(queries), budget, '\n'.join(queries))
+
+    def job_data(self, **kwargs):
+        return {
+            'title': 'Backend Engineer',
+            'degree': self.degree.name,
+            'organization': self.organization.name,
+            'locations': [self.location.name],
+            'minimum_qualifications': ['Python'],
+            'preferred_qualifications': ['Django'],
+            'description': ['Develop software'],
+            'job_type': 'Full-time',
+            **kwargs,
+        }
+
+    def job_url(self, job=None):
+        return reverse('job_search:job-detail', kwargs={'pk': (job or self.jobs[0]).pk})
+
+    def organization_url(self, organization=None):
+        return reverse('job_search:organization-detail', kwargs={'pk': (organization or self.organization).pk})
+
+    def test_job_list(self):
+        # The count and the page of JobListing rows.
+        with self.assertQueryBudget(2):
+            response = self.client.get(reverse('job_search:job-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_job_retrieve(self):
+        # The JobListing row for the validators, the job with its degree and organization, its locations.
+        with self.assertQueryBudget(3):
+            response = self.client.get(self.job_url())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_job_create(self):
+        self.client.force_authenticate(self.user)
+        # The locations, degree and organization are validated, then create() reads the degree
+        # and organization again. The job, its JobListing row, its locations, their job counts and the response.
+        with self.assertQueryBudget(14):
+            response = self.client.post(reverse('job_search:job-list'), self.job_data(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_job_create_with_cached_references(self):
+        self.client.force_authenticate(self.user)
+        # Entries of the committed lookups would outlive the rows of the test.
+        self.addCleanup(cache.clear)
+        self.addCleanup(local_cache.clear)
+        self.addCleanup(local_versions.clear)
+        # Lookups are cached when their transaction commits.
+        with self.captureOnCommitCallbacks(execute=True):
+            get_references(Degree, [self.degree.name])
+            get_references(Organization, [self.organization.name])
+            get_references(Location, [self.location.name])
+        # The job, its JobListing row, its location, its job count and the response.
+        with self.assertQueryBudget(9, clear_cache=False):
+            response = self.client.post(reverse('job_search:job-list'), self.job_data(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_job_create_with_many_locations(self):
+        self.client.force_authenticate(self.user)
+        locations = [self.location.name, *(f'Location {index}' for index in range(15))]
+        # The missing locations are created with one INSERT and read back with one query.
+        with self.assertQueryBudget(16):
+            response = self.client.post(
+                reverse('job_search:job-list'), self.job_data(locations=locations), format='json',
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertCountEqual(response.json()['locations'], locations)
+
+    def test_job_create_with_organization_of_other_user(self):
+        self.client.force_authenticate(self.user)
+        # The location, degree and organization are validated, the creator isn't read.
+        with self.assertQueryBudget(3):
+            response = self.client.post(
+                reverse('job_search:job-list'), self.job_data(organization=self.other_organization.name), format='json',
+            )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_job_update(self):
+        self.client.force_authenticate(self.user)
+        # The job and its locations, the validation, the update, its JobListing row and the response.
+        with self.assertQueryBudget(12):
+            response = self.client.put(self.job_url(), self.job_data(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_job_partial_update(self):
+        self.client.force_authenticate(self.user)
+        # The job and its locations, the update, its JobListing row and the locations of the response.
+        with self.assertQueryBudget(6):
+            response = self.client.patch(self.job_url(), {'title': 'Backend Engineer'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_job_update_by_other_user(self):
+        self.client.force_authenticate(self.other_user)
+        # The job with its organization and its locations, the creator isn't read.
+        with self.assertQueryBudget(2):
+            response = self.client.patch(self.job_url(), {'title': 'Backend Engineer'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_job_destroy(self):
+        self.client.force_authenticate(self.user)
+        # The job and its locations, the deletes of its locations, the job and its JobListing row,
+        # and the job counts of its locations, read before the delete and updated after it.
+        with self.assertQueryBudget(7):
+            response = self.client.delete(self.job_url())
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_job_bulk_create(self):
+        self.client.force_authenticate(self.user)
+        data = [self.job_data(title=f'Backend Engineer {index}') for index in range(10)]
+        # The same number of queries for any number of jobs.
+        with self.assertQueryBudget(9):
+            response = self.client.post(reverse('job_search:job-bulk'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_organization_list(self):
+        # The count and the page with the creators.
+        with self.assertQueryBudget(2):
+            response = self.client.get(reverse('job_search:organization-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_organization_retrieve(self):
+        with self.assertQueryBudget(1):
+            response = self.client.get(self.organization_url())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_organization_create(self):
+        self.client.force_authenticate(self.user)
+        # The unique name check and the insert.
+        with self.assertQueryBudget(2):
+            response = self.client.post(reverse('job_search:organization-list'), {'name': 'Bitbucket'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_organization_update(self):
+        self.client.force_authenticate(self.user)
+        # The organization with its creator, the unique name check, the update and the JobListing rows.
+        with self.assertQueryBudget(4):
+            response = self.client.put(self.organization_url(), {'name': 'GitHub Inc.'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_organization_partial_update(self):
+        self.client.force_authenticate(self.user)
+        with self.assertQueryBudget(4):
+            response = self.client.patch(self.organization_url(), {'name': 'GitHub Inc.'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_organization_update_by_other_user(self):
+        self.client.force_authenticate(self.other_user)
+        with self.assertQueryBudget(1):
+            response = self.client.patch(self.organization_url(), {'name': 'GitHub Inc.'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_organization_destroy(self):
+        self.client.force_authenticate(self.user)
+        with self.assertQueryBudget(1):
+            response = self.client.delete(self.organization_url(self.other_organization))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.other_user)
+        # The organization with its creator, its jobs for the cascade and the delete.
+        with self.assertQueryBudget(3):
+            response = self.client.delete(self.organization_url(self.other_organization))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
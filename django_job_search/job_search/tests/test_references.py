@@ -0,0 +1,157 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from job_search.models import Degree, Job, Location, Organization
+from job_search.cache import invalidate_tags
+from job_search.references import (
+    LRUCache,
+    get_reference,
+    get_references,
+    get_references_tag,
+    local_cache,
+    local_versions,
+)
+from job_search.tests.base import JobTestCase, create_user
+
+
+class ReferencesTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        local_cache.clear()
+        local_versions.clear()
+        # Entries of the rows which the tests commit would outlive them.
+        self.addCleanup(cache.clear)
+        self.addCleanup(local_cache.clear)
+        self.addCleanup(local_versions.clear)
+        self.location = Location.objects.create(name='Kyiv')
+
+    def lookup(self, model, names, queries):
+        with CaptureQueriesContext(connection) as context, self.captureOnCommitCallbacks(execute=True):
+            references = get_references(model, names)
+        # Silk explains the queries of profiled requests in DEBUG mode.
+        self.assertEqual(len([query for query in context if not query['sql'].startswith('EXPLAIN')]), queries)
+        return references
+
+    def test_lookups_are_cached(self):
+        organization = self.lookup(Organization, ['GitHub', 'GitLab'], queries=1)['GitHub']
+        self.assertEqual((organization.pk, organization.name), (self.organization.pk, 'GitHub'))
+        self.assertEqual(organization.creator_id, self.user.pk)
+
+        # Names which don't exist aren't cached.
+        self.assertEqual(set(self.lookup(Organization, ['GitHub', 'GitLab'], queries=1)), {'GitHub'})
+        self.assertEqual(self.lookup(Organization, ['GitHub'], queries=0)['GitHub'].pk, self.organization.pk)
+
+        # The Redis tier serves the other processes.
+        local_cache.clear()
+        self.assertEqual(self.lookup(Organization, ['GitHub'], queries=0)['GitHub'].creator_id, self.user.pk)
+
+    def test_uncommitted_lookups_are_not_cached(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            self.assertEqual(get_reference(Location, 'Kyiv'), self.location)
+        self.lookup(Location, ['Kyiv'], queries=1)
+
+    def test_rename_and_delete_invalidate_lookups(self):
+        self.lookup(Degree, ['Bachelor'], queries=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.degree.name = 'Master'
+            self.degree.save()
+        self.assertEqual(self.lookup(Degree, ['Bachelor', 'Master'], queries=1)['Master'].pk, self.degree.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.degree.delete()
+        self.assertEqual(self.lookup(Degree, ['Master'], queries=1), {})
+
+    def test_versions_are_kept_in_the_process(self):
+        self.lookup(Location, ['Kyiv'], queries=1)
+        with mock.patch('job_search.references.get_tag_versions') as get_tag_versions:
+            self.assertEqual(self.lookup(Location, ['Kyiv'], queries=0)['Kyiv'].pk, self.location.pk)
+        get_tag_versions.assert_not_called()
+
+        # Renames in other processes are seen once the version of the process expires.
+        Location.objects.filter(pk=self.location.pk).update(name='Lviv')
+        invalidate_tags([get_references_tag(Location)])
+        self.lookup(Location, ['Kyiv'], queries=0)
+        with override_settings(REFERENCE_VERSION_TIMEOUT=0):
+            self.assertEqual(self.lookup(Location, ['Kyiv'], queries=1), {})
+        self.assertEqual(self.lookup(Location, ['Lviv'], queries=1)['Lviv'].pk, self.location.pk)
+
+    def test_created_objects_keep_lookups(self):
+        self.lookup(Location, ['Kyiv'], queries=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            Location.objects.create(name='Lviv')
+        self.assertEqual(set(self.lookup(Location, ['Kyiv', 'Lviv'], queries=1)), {'Kyiv', 'Lviv'})
+        self.lookup(Location, ['Kyiv', 'Lviv'], queries=0)
+
+    def test_lru_cache(self):
+        lru = LRUCache(2)
+        lru.set_many({'a': 1, 'b': 2})
+        self.assertEqual(lru.get_many(['a']), {'a': 1})
+        lru.set_many({'c': 3})
+        self.assertEqual(lru.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+
+
+class DeletedReferenceTestCase(TransactionTestCase):
+    """
+    Writes which refer to an object deleted by another process, while this one still serves its name.
+    A transaction test case, as Postgres checks the foreign keys when the write commits.
+    """
+
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        local_versions.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(local_cache.clear)
+        self.addCleanup(local_versions.clear)
+        self.user = create_user()
+        self.organization = Organization.objects.create(name='GitHub', creator=self.user)
+        self.degree = Degree.objects.create(name='Bachelor')
+        self.location = Location.objects.create(name='Kyiv')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def delete_in_other_process(self, instance):
+        """Delete the object, which invalidates the versions in Redis only, like another process would."""
+        get_references(type(instance), [instance.name])
+        versions = dict(local_versions)
+        instance.delete()
+        local_versions.update(versions)
+        self.assertIn(instance.name, get_references(type(instance), [instance.name]))
+
+    def create_job(self):
+        return self.client.post(reverse('job_search:job-list'), {
+            'title': 'Backend Engineer',
+            'degree': 'Bachelor',
+            'organization': 'GitHub',
+            'locations': ['Kyiv'],
+            'minimum_qualifications': ['Python'],
+            'preferred_qualifications': ['Django'],
+            'description': ['Develop software'],
+            'job_type': 'Full-time',
+        }, format='json')
+
+    def test_deleted_location_is_created_again(self):
+        self.delete_in_other_process(self.location)
+
+        response = self.create_job()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        location = Location.objects.get(name='Kyiv')
+        self.assertNotEqual(location.pk, self.location.pk)
+        self.assertEqual(list(Job.objects.get().locations.all()), [location])
+
+    def test_deleted_degree_is_not_found(self):
+        self.delete_in_other_process(self.degree)
+
+        response = self.create_job()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('degree', response.json())
+        self.assertFalse(Job.objects.exists())
@@ -0,0 +1,87 @@
+import datetime
+import decimal
+import uuid
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer
+from rest_framework.exceptions import ErrorDetail
+
+from job_search.api import renderers
+from job_search.api.renderers import CamelCaseJSONRenderer
+from job_search.api.serializers import JobDetailSerializer
+from job_search.models import Location
+from job_search.tests.base import JobTestCase
+
+PAYLOADS = {
+    'empty': {},
+    'none': None,
+    'nested': {
+        'job_type': 'Full-time',
+        'minimum_qualifications': ['Python', 'SQL'],
+        'nested_dict': {'date_added': '2024-01-01', 'ids': (1, 2, True, None)},
+        'snake_case_2': [{'inner_key': []}],
+        'camelCase': 'unchanged',
+        'already__double': 1,
+    },
+    'errors': {'non_field_errors': [ErrorDetail('Invalid data.', code='invalid')]},
+    'unicode': {'job_title': 'Київ     "quoted" \\ \n\t \x00 \x7f 😀'},
+    'floats': {'min_salary': 1e16, 'ratio': 0.1},
+    'types': {
+        'date_added': datetime.date(2024, 1, 1),
+        'updated_at': datetime.datetime(2024, 1, 1, 12, 30, 15, 123456),
+        'salary': decimal.Decimal('10.50'),
+        'job_uuid': uuid.UUID(int=1),
+        'lazy_text': gettext_lazy('job title'),
+        gettext_lazy('lazy_key'): 1,
+    },
+    'big_integer': {'big_number': 2 ** 70},
+    'non_string_keys': {1: 'one', None: 'none', 2.5: 'float'},
+    'bool_key': {True: 'true'},
+    'list': [{'job_type': 'Full-time'}, 'text', 1],
+}
+
+
+class CamelCaseJSONRendererTestCase(SimpleTestCase):
+    def assertRendersLikeLibrary(self, data, accepted_media_type=None):
+        self.assertEqual(
+            CamelCaseJSONRenderer().render(data, accepted_media_type),
+            LibraryCamelCaseJSONRenderer().render(data, accepted_media_type),
+        )
+
+    def test_renders_like_library(self):
+        for name, data in PAYLOADS.items():
+            with self.subTest(name):
+                self.assertRendersLikeLibrary(data)
+                self.assertRendersLikeLibrary(data, 'application/json; indent=4')
+
+    def test_renders_like_library_without_orjson(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            for name, data in PAYLOADS.items():
+                with self.subTest(name):
+                    self.assertRendersLikeLibrary(data)
+
+    def test_uses_orjson_for_exact_types(self):
+        self.assertIsNotNone(renderers.orjson)
+        with mock.patch.object(renderers.orjson, 'dumps', wraps=renderers.orjson.dumps) as dumps:
+            CamelCaseJSONRenderer().render(PAYLOADS['nested'])
+            CamelCaseJSONRenderer().render(PAYLOADS['floats'])
+        self.assertEqual(dumps.call_count, 1)
+
+
+class JobDetailRendererTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.job = self.create_job(
+            locations=[Location.objects.create(name='Kyiv')], minimum_qualifications=['Python', 'SQL'],
+        )
+
+    def test_job_detail_renders_like_library(self):
+        data = JobDetailSerializer(self.job).data
+        self.assertEqual(CamelCaseJSONRenderer().render(data), LibraryCamelCaseJSONRenderer().render(data))
+
+    def test_benchmark_command(self):
+        with mock.patch('sys.stdout'):
+            call_command('benchmark_renderers', jobs=1, repeat=1)
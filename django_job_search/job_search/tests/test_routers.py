@@ -0,0 +1,100 @@
+"""
+Tests of the primary/replica database routing.
+
+The API tests need a replica which is a separate database. Run them against
+two local Postgres databases, without replication, with e.g.:
+
+    POSTGRES_REPLICA_HOSTS=localhost POSTGRES_REPLICA_NAME=replica python manage.py test job_search.tests.test_routers
+"""
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from django_job_search.routers import (
+    PrimaryReplicaRouter,
+    get_replica,
+    is_pinned_to_primary,
+    pin_to_primary,
+    use_replica_reads,
+)
+from job_search.models import Degree
+
+REPLICA = settings.DATABASE_REPLICAS[0] if settings.DATABASE_REPLICAS else None
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1', 'replica_2'])
+class PrimaryReplicaRouterTestCase(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_use_primary_by_default(self):
+        self.assertIsNone(self.router.db_for_read(Degree))
+        self.assertEqual(self.router.db_for_write(Degree), 'default')
+
+    def test_replica_reads(self):
+        with use_replica_reads():
+            replica = self.router.db_for_read(Degree)
+            self.assertIn(replica, ['replica_1', 'replica_2'])
+            self.assertEqual(self.router.db_for_read(Degree), replica)
+
+        self.assertIsNone(get_replica())
+
+    def test_write_switches_reads_to_primary(self):
+        with use_replica_reads():
+            self.assertEqual(self.router.db_for_write(Degree), 'default')
+            self.assertIsNone(self.router.db_for_read(Degree))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_replica_reads_without_replicas(self):
+        with use_replica_reads():
+            self.assertIsNone(self.router.db_for_read(Degree))
+
+    def test_pin_to_primary(self):
+        user = get_user_model()(pk=1)
+        cache.clear()
+
+        self.assertFalse(is_pinned_to_primary(user))
+        pin_to_primary(user)
+        self.assertTrue(is_pinned_to_primary(user))
+
+
+@skipUnless(REPLICA, 'Requires a replica configured as a separate database.')
+class ReplicaReadsTestCase(TestCase):
+    databases = '__all__'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_superuser(email='test@example.com', password='Hkfsfkdj!23')
+        Degree.objects.create(name='Primary Degree')
+        Degree.objects.using(REPLICA).create(name='Replica Degree')
+        self.url = reverse('job_search:degree-list')
+
+    def get_degree_names(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [degree['name'] for degree in response.json()['results']]
+
+    def test_safe_requests_read_from_replica(self):
+        self.assertEqual(self.get_degree_names(), ['Replica Degree'])
+
+    def test_user_reads_own_writes_from_primary(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(self.url, data={'name': 'New Degree'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(Degree.objects.using(REPLICA).filter(name='New Degree').exists())
+
+        self.assertEqual(sorted(self.get_degree_names()), ['New Degree', 'Primary Degree'])
+
+        # Other users read from the replica, once the cached response is gone.
+        self.client.force_authenticate(user=None)
+        cache.delete_pattern('api-response:*')
+        self.assertEqual(self.get_degree_names(), ['Replica Degree'])
+        # The replica may lag behind the write, so its response isn't cached.
+        self.assertEqual(cache.keys('api-response:*'), [])
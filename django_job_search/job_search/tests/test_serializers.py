@@ -1,4 +1,7 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework.exceptions import ValidationError
 
@@ -9,7 +12,9 @@ from job_search.api.serializers import (
     DegreeSerializer,
     SpotlightSerializer,
 )
+from job_search.cache import get_tag, get_tag_versions
 from job_search.models import Organization, Location, Degree
+from job_search.references import local_cache, local_versions
 
 
 class SerializerTests(TestCase):
@@ -104,3 +109,32 @@ class SerializerTests(TestCase):
         with self.assertRaises(ValidationError) as context:
             serializer.is_valid(raise_exception=True)
             self.assertIn('Object with name=NonExistentDegree does not exist.', str(context.exception))
+
+    def test_job_serializer_locations(self):
+        kyiv = Location.objects.create(name='Kyiv')
+        field = JobSerializer().fields['locations']
+
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks() as callbacks:
+            locations = field.to_internal_value(['Lviv', 'Kyiv', 'Odesa', 'Lviv'])
+        # Silk explains the queries of profiled requests in DEBUG mode.
+        self.assertEqual(len([query for query in queries if not query['sql'].startswith('EXPLAIN')]), 3)
+        self.assertEqual([location.name for location in locations], ['Lviv', 'Kyiv', 'Odesa', 'Lviv'])
+        self.assertEqual(locations[1], kyiv)
+        self.assertEqual(Location.objects.count(), 3)
+
+        # Lists of the created locations are invalidated.
+        cache.clear()
+        local_versions.clear()
+        self.addCleanup(local_cache.clear)
+        self.addCleanup(local_versions.clear)
+        versions = get_tag_versions([get_tag(Location)])
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_tag_versions([get_tag(Location)]), versions)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(field.to_internal_value(['Kyiv', 'Odesa']), [kyiv, locations[2]])
+        self.assertEqual(len([query for query in queries if not query['sql'].startswith('EXPLAIN')]), 1)
+
+        with self.assertRaises(ValidationError):
+            field.run_validation('Kyiv')
@@ -0,0 +1,93 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django_redis import get_redis_connection
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework.throttling import SimpleRateThrottle
+
+from job_search.api import throttling
+
+RATES = {
+    'anon_sustained': '3/day',
+    'anon_burst': '2/minute',
+    'user_sustained': '10/day',
+    'user_burst': '3/minute',
+}
+
+
+@mock.patch.object(SimpleRateThrottle, 'THROTTLE_RATES', RATES)
+class GCRARateThrottleTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('job_search:degree-list')
+        # The throttle state of these rates would throttle the requests of other tests.
+        self.addCleanup(cache.clear)
+
+    def get(self, client=None):
+        return (client or self.client).get(self.url)
+
+    def test_burst(self):
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+
+        response = self.get()
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        # One request of the burst scope is allowed every 30 seconds.
+        self.assertEqual(response['Retry-After'], '30')
+
+    def test_refused_requests_are_not_counted(self):
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get().status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        # Once the burst scope allows requests again, the sustained scope has counted two requests.
+        get_redis_connection('default').delete(cache.make_key('throttle_anon_burst_127.0.0.1'))
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+
+        get_redis_connection('default').delete(cache.make_key('throttle_anon_burst_127.0.0.1'))
+        response = self.get()
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreater(int(response['Retry-After']), 60 * 60)
+
+    def test_clients_are_throttled_separately(self):
+        self.get()
+        self.get()
+        self.assertEqual(self.get().status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(self.get(APIClient(REMOTE_ADDR='10.0.0.1')).status_code, status.HTTP_200_OK)
+
+        # Users are throttled by the user scopes only.
+        user_client = APIClient()
+        user_client.force_authenticate(get_user_model().objects.create_user(email='test@example.com', password='Hjsajk141'))
+        for _ in range(3):
+            self.assertEqual(self.get(user_client).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get(user_client).status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_all_scopes_are_checked_in_one_round_trip(self):
+        with mock.patch.object(
+            throttling, 'get_redis_connection', wraps=throttling.get_redis_connection,
+        ) as get_connection:
+            self.get()
+            self.get(APIClient(REMOTE_ADDR='10.0.0.1'))
+        self.assertEqual(get_connection.call_count, 2)
+
+    def test_script_is_registered_once_per_client(self):
+        connection = get_redis_connection('default')
+        self.get()
+        with mock.patch.object(connection, 'register_script', wraps=connection.register_script) as register_script:
+            self.get(APIClient(REMOTE_ADDR='10.0.0.1'))
+            self.get(APIClient(REMOTE_ADDR='10.0.0.2'))
+        register_script.assert_not_called()
+
+    def test_async_views(self):
+        url = reverse('job_search:async-location-list')
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '30')
@@ -0,0 +1,96 @@
+"""
+This module contains the async search endpoint, served by the ASGI server.
+
+It queries Elasticsearch with the async client, which shares one connection
+pool per event loop, instead of blocking a thread for the duration of the search.
+"""
+import asyncio
+import weakref
+
+from django.conf import settings
+from elasticsearch import AsyncElasticsearch
+from django_elasticsearch_dsl_drf.filter_backends import DefaultOrderingFilterBackend, OrderingFilterBackend
+from elasticsearch_dsl import Q
+from elasticsearch_dsl.response import Response
+
+from job_search.api.async_views import AsyncListAPIView
+from search.documents import JobDocument
+from search.serializers import JobDocumentSerializer
+from search.views import JobDocumentViewSet
+
+# Async clients are bound to the event loop which created their connections.
+_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """Return the async Elasticsearch client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _clients:
+        _clients[loop] = AsyncElasticsearch(
+            **settings.ELASTICSEARCH_DSL['default'],
+            connections_per_node=settings.ELASTICSEARCH_ASYNC_CONNECTIONS,
+        )
+    return _clients[loop]
+
+
+async def close_async_client():
+    """Close the connections of the async Elasticsearch client of the running event loop."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+class AsyncJobSearchView(AsyncListAPIView):
+    """
+    Search the Jobs, like the list action of JobDocumentViewSet, with the `search`
+    query parameter and term filters on its filter fields, in the `ordering`
+    requested by the client or its default ordering.
+    """
+    document = JobDocument
+    serializer_class = JobDocumentSerializer
+    pagination_class = JobDocumentViewSet.pagination_class
+    search_fields = JobDocumentViewSet.search_fields
+    filter_fields = JobDocumentViewSet.filter_fields
+    nested_filter_fields = JobDocumentViewSet.nested_filter_fields
+    filter_backends = [OrderingFilterBackend, DefaultOrderingFilterBackend]
+    ordering_fields = JobDocumentViewSet.ordering_fields
+    ordering = JobDocumentViewSet.ordering
+
+    def get_queryset(self):
+        return self.document.search()
+
+    async def filter_queryset(self, request, search):
+        query = request.query_params.get('search')
+        if query:
+            search = search.query('bool', should=[
+                Q('match', **{field: {'query': query, **(options or {})}})
+                for field, options in self.search_fields.items()
+            ])
+
+        for param, field in self.filter_fields.items():
+            # The filter backend of JobDocumentViewSet expands the fields in place into dicts.
+            if isinstance(field, dict):
+                field = field['field']
+            values = request.query_params.getlist(param)
+            if values:
+                search = search.filter('terms', **{field: values})
+
+        for param, options in self.nested_filter_fields.items():
+            values = request.query_params.getlist(param)
+            if values:
+                search = search.filter('nested', path=options['path'], query=Q('terms', **{options['field']: values}))
+
+        return await super().filter_queryset(request, search)
+
+    async def paginate_queryset(self, request, search):
+        client = get_async_client()
+        index = self.document._index._name
+
+        count = (await client.count(index=index, body=search.to_dict(count=True)))['count']
+        page = self.get_page(request, count)
+        start = (page.number - 1) * page.size
+        search = search[start:start + page.size]
+
+        raw_response = await client.search(index=index, body=search.to_dict())
+        page.results = Response(search, raw_response.body)
+        return count, page
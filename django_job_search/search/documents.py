@@ -3,29 +3,47 @@ from django_elasticsearch_dsl.registries import registry
 
 from job_search.models import Job
 
+# Category contexts of the job title completions. A query matches the suggestions
+# of any of its contexts, so the job types are combined with the locations in one
+# context instead of being filtered separately.
+JOB_TYPE_CONTEXT = 'job_type'
+JOB_TYPE_LOCATION_CONTEXT = 'job_type_location'
+
+
+def get_job_type_location_context(job_type, location_id):
+    """Return the job_type_location context of a job type and a location id."""
+    return f'{job_type}:{location_id}'
+
 
 @registry.register_document
 class JobDocument(Document):
     id = fields.IntegerField(attr='id')
+    # Term filters and sorting use the `raw` keyword subfields: keywords aren't analyzed,
+    # and like dates they are sorted on doc_values instead of fielddata.
     job_title = fields.TextField(
         attr='title',
         fields={
-            'raw': fields.TextField(),
-            'suggest': fields.Completion(),
+            'raw': fields.KeywordField(),
         }
     )
+    job_title_suggest = fields.CompletionField(
+        contexts=[
+            {'name': JOB_TYPE_CONTEXT, 'type': 'category'},
+            {'name': JOB_TYPE_LOCATION_CONTEXT, 'type': 'category'},
+        ],
+    )
     degree = fields.ObjectField(
         attr='degree',
         properties={
             'id': fields.IntegerField(),
-            'name': fields.TextField(),
+            'name': fields.TextField(fields={'raw': fields.KeywordField()}),
         }
     )
     organization = fields.ObjectField(
         attr='organization',
         properties={
             'id': fields.IntegerField(),
-            'name': fields.TextField(),
+            'name': fields.TextField(fields={'raw': fields.KeywordField()}),
         }
     )
 
@@ -33,7 +51,7 @@ class JobDocument(Document):
         attr='locations',
         properties={
             'id': fields.IntegerField(),
-            'name': fields.TextField(),
+            'name': fields.TextField(fields={'raw': fields.KeywordField()}),
         }
     )
 
@@ -41,9 +59,9 @@ class JobDocument(Document):
     minimum_qualifications = fields.ListField(fields.TextField())
     description = fields.ListField(fields.TextField())
 
-    job_type = fields.TextField(attr='job_type')
+    job_type = fields.KeywordField(attr='job_type')
 
-    date_added = fields.DateField(attr='date_added')
+    date_added = fields.DateField(attr='date_added', doc_values=True)
     date_updated = fields.DateField(attr='date_updated')
 
     class Index:
@@ -54,3 +72,24 @@ class JobDocument(Document):
         fields = [
             'title',
         ]
+        # Prefetching requires iterating the indexing queryset in chunks.
+        queryset_pagination = 1000
+
+    def prepare_job_title_suggest(self, instance):
+        """
+        Weigh the title completions by the day the job was added, so the newest jobs are suggested first
+        without reweighing the older ones.
+        """
+        contexts = {JOB_TYPE_CONTEXT: [instance.job_type]}
+        locations = instance.locations.all()
+        if locations:
+            contexts[JOB_TYPE_LOCATION_CONTEXT] = [
+                get_job_type_location_context(instance.job_type, location.pk) for location in locations
+            ]
+        return {'input': [instance.title], 'weight': instance.date_added.toordinal(), 'contexts': contexts}
+
+    def get_queryset(self):
+        """Fetch the related objects of the indexed jobs in bulk instead of per document."""
+        return super().get_queryset().select_related(
+            'degree', 'organization',
+        ).prefetch_related('locations')
@@ -0,0 +1,170 @@
+"""
+This module implements bulk indexing of jobs into Elasticsearch.
+
+Jobs are streamed from the database in primary key order, one chunk at a time,
+with their degree, organization and locations fetched in bulk (two queries per
+chunk instead of one per document), and are sent to Elasticsearch with the bulk
+helpers by a pool of parallel workers.
+
+Documents are prepared in the calling thread, which owns the database connection,
+and only the bulk requests run in the worker threads.
+
+The JobDocument index name may be an alias in front of versioned physical indices
+(e.g. `jobs` -> `jobs_20240101120000000000`), so that a new index can be built in the
+background and swapped in atomically.
+"""
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from django.utils import timezone
+from elasticsearch.helpers import bulk
+
+from search.documents import JobDocument
+
+
+def iter_job_chunks(chunk_size):
+    """
+    Yield lists of at most `chunk_size` jobs with their related objects.
+    Uses keyset pagination on the primary key, so each chunk costs the same.
+    """
+    queryset = JobDocument().get_queryset().order_by('pk')
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+
+        yield chunk
+        last_pk = chunk[-1].pk
+
+
+def get_index(name=None):
+    """Return the JobDocument index, or a copy of it with another name."""
+    if name is None:
+        return JobDocument._index
+    return JobDocument._index.clone(name=name)
+
+
+def bulk_index_jobs(index=None, chunk_size=500, workers=4, refresh=False, progress=None):
+    """
+    Index all jobs into the given index (the JobDocument index by default),
+    creating it with the JobDocument mappings if it doesn't exist.
+
+    `progress` is called with (indexed, failed, elapsed seconds) after every chunk.
+    Returns a tuple of the numbers of indexed and failed documents.
+    """
+    document = JobDocument()
+    client = document._get_connection()
+    es_index = get_index(index)
+    if not es_index.exists():
+        es_index.create()
+
+    indexed = failed = 0
+    started_at = time.monotonic()
+
+    def collect(futures):
+        nonlocal indexed, failed
+        for future in futures:
+            chunk_indexed, chunk_failed = future.result()
+            indexed += chunk_indexed
+            failed += chunk_failed
+
+        if progress is not None:
+            progress(indexed, failed, time.monotonic() - started_at)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk in iter_job_chunks(chunk_size):
+            actions = [document._prepare_action(job, 'index') for job in chunk]
+            for action in actions:
+                action['_index'] = es_index._name
+
+            pending.add(executor.submit(
+                bulk, client, actions, chunk_size=chunk_size, stats_only=True, raise_on_error=False,
+            ))
+
+            # Keep a bounded number of chunks in memory while the workers are busy.
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        collect(pending)
+
+    if refresh:
+        es_index.refresh()
+
+    return indexed, failed
+
+
+def get_versioned_index_name(alias):
+    """Return a new name of a physical index behind the alias."""
+    return f'{alias}_{timezone.now():%Y%m%d%H%M%S%f}'
+
+
+def get_versioned_indices(alias):
+    """Return the names of the physical indices of the alias, from the oldest to the newest."""
+    client = JobDocument._get_connection()
+    indices = client.indices.get(index=f'{alias}_*', allow_no_indices=True, ignore_unavailable=True)
+    pattern = re.compile(rf'{re.escape(alias)}_\d{{20}}')
+    return sorted(index for index in indices if pattern.fullmatch(index))
+
+
+def get_alias_indices(alias):
+    """Return the names of the indices the alias currently points to."""
+    client = JobDocument._get_connection()
+    response = client.options(ignore_status=404).indices.get_alias(name=alias)
+    if response.meta.status == 404:
+        return []
+    return sorted(index for index, data in response.body.items() if alias in data.get('aliases', {}))
+
+
+def create_versioned_index(alias):
+    """
+    Create an empty physical index for the alias with the JobDocument mappings.
+    Refreshes are disabled until the index is filled to speed up bulk indexing.
+    """
+    es_index = get_index(get_versioned_index_name(alias))
+    es_index.settings(refresh_interval='-1')
+    es_index.create()
+    return es_index._name
+
+
+def finish_versioned_index(index):
+    """Restore the default refresh interval of a filled index and refresh it."""
+    es_index = get_index(index)
+    es_index.put_settings(body={'index': {'refresh_interval': None}})
+    es_index.refresh()
+
+
+def switch_alias(alias, index):
+    """
+    Atomically point the alias to the index, detaching it from all other indices.
+    A legacy physical index with the name of the alias is removed in the same request.
+    """
+    client = JobDocument._get_connection()
+    actions = [
+        {'remove': {'index': old_index, 'alias': alias}}
+        for old_index in get_alias_indices(alias) if old_index != index
+    ]
+    if client.indices.exists(index=alias) and not client.indices.exists_alias(name=alias):
+        actions.append({'remove_index': {'index': alias}})
+    actions.append({'add': {'index': index, 'alias': alias}})
+
+    client.indices.update_aliases(actions=actions)
+
+
+def prune_versioned_indices(alias, keep):
+    """
+    Delete old physical indices of the alias, keeping the `keep` newest ones
+    and every index the alias points to. Returns the names of the deleted indices.
+    """
+    client = JobDocument._get_connection()
+    in_use = set(get_alias_indices(alias))
+    candidates = [index for index in get_versioned_indices(alias) if index not in in_use]
+    to_delete = candidates[:max(len(candidates) - max(keep - len(in_use), 0), 0)]
+
+    for index in to_delete:
+        client.indices.delete(index=index)
+    return to_delete
@@ -0,0 +1,117 @@
+"""
+This module defines a Django management command that rebuilds the jobs search index without downtime.
+
+The JobDocument index name is used as an alias in front of versioned physical indices.
+The command builds a new `<alias>_<timestamp>` index in the background while searches
+are still served by the current one, verifies that it contains every job from Postgres,
+atomically points the alias to it, and deletes old versions.
+
+Jobs which change while the index is built are synced into the index behind the alias,
+so they are also recorded for the new index (see search.sync.start_rebuild) and replayed
+into it before the alias is switched, and once more after, for the changes recorded
+in the meantime. Changes which fail to replay before the switch abort the rebuild,
+those which fail after it are left to the sync queue of the alias.
+
+The 'handle' method is the entry point for the command.
+"""
+import time
+
+from django.core.management import BaseCommand, CommandError
+
+from job_search.models import Job
+from search import sync
+from search.documents import JobDocument
+from search.indexing import (
+    bulk_index_jobs,
+    create_versioned_index,
+    finish_versioned_index,
+    get_index,
+    prune_versioned_indices,
+    switch_alias,
+)
+
+
+class Command(BaseCommand):
+    """
+    Django management command to build a new jobs index and swap it in atomically.
+    """
+    help = 'Build a new versioned jobs index, verify it and atomically switch the alias to it.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--alias',
+            default=JobDocument._index._name,
+            help='Alias used for searching. Defaults to the index name of JobDocument.',
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=2,
+            help='Number of newest versioned indices to keep, including the live one.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of jobs fetched per query and sent per bulk request.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of parallel bulk requests.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        Builds and verifies the new index, switches the alias and prunes old indices.
+        """
+        alias = options['alias']
+        if options['keep'] < 1:
+            raise CommandError('--keep must be a positive integer.')
+
+        started_at = time.monotonic()
+        index = create_versioned_index(alias)
+        self.stdout.write(f'Building {index}...')
+
+        try:
+            sync.start_rebuild(index)
+            # Every job created or deleted from now on is replayed, which bounds the difference.
+            expected = Job.objects.count()
+            indexed, failed = bulk_index_jobs(
+                index=index,
+                chunk_size=options['chunk_size'],
+                workers=options['workers'],
+            )
+            replayed = sum(sync.replay(index, batch_size=options['chunk_size']))
+            finish_versioned_index(index)
+
+            actual = get_index(index).search().count()
+            if failed or abs(actual - expected) > replayed:
+                raise CommandError(
+                    f'{index} contains {actual} of {expected} jobs ({failed} failed to index, '
+                    f'{replayed} changed during the build), {alias} was not switched.'
+                )
+
+            switch_alias(alias, index)
+            sync.finish_rebuild(index)
+        except Exception:
+            sync.abort_rebuild(index)
+            get_index(index).delete(ignore_unavailable=True)
+            raise
+
+        # The changes recorded until the switch may have been synced into the old index only.
+        try:
+            replayed += sum(sync.replay(index, batch_size=options['chunk_size'], requeue_key=sync.PENDING_KEY))
+        except Exception as error:
+            self.stderr.write(f'Failed to replay changes into {index}, they were queued for sync: {error}')
+        elapsed = time.monotonic() - started_at
+        self.stdout.write(self.style.SUCCESS(
+            f'{alias} now points to {index} with {indexed} jobs and {replayed} changes replayed, '
+            f'built in {elapsed:.1f}s.'
+        ))
+
+        for old_index in prune_versioned_indices(alias, options['keep']):
+            self.stdout.write(f'Deleted {old_index}.')
@@ -0,0 +1,75 @@
+"""
+This module defines a Django management command that indexes all jobs into Elasticsearch.
+
+Unlike `search_index --rebuild`, the jobs are streamed from the database in chunks
+with their related objects prefetched, and are sent to Elasticsearch by a pool
+of parallel bulk workers. Progress and throughput are reported while indexing.
+
+The 'handle' method is the entry point for the command.
+"""
+import time
+
+from django.core.management import BaseCommand, CommandError
+
+from search.indexing import bulk_index_jobs
+
+
+class Command(BaseCommand):
+    """
+    Django management command to index all jobs into Elasticsearch in bulk.
+    """
+    help = 'Index all jobs into Elasticsearch with parallel bulk requests.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--index',
+            help='Name of the index to fill. Defaults to the index of JobDocument.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of jobs fetched per query and sent per bulk request.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of parallel bulk requests.',
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Refresh the index when indexing is finished.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        Indexes all jobs and reports the number of indexed documents per second.
+        """
+        if options['chunk_size'] < 1 or options['workers'] < 1:
+            raise CommandError('--chunk-size and --workers must be positive integers.')
+
+        def report_progress(indexed, failed, elapsed):
+            if options['verbosity'] >= 2:
+                self.stdout.write(f'{indexed} jobs indexed, {failed} failed ({indexed / max(elapsed, 1e-6):.0f} docs/s)')
+
+        started_at = time.monotonic()
+        indexed, failed = bulk_index_jobs(
+            index=options['index'],
+            chunk_size=options['chunk_size'],
+            workers=options['workers'],
+            refresh=options['refresh'],
+            progress=report_progress,
+        )
+
+        elapsed = time.monotonic() - started_at
+
+        if failed:
+            raise CommandError(f'{failed} jobs failed to index ({indexed} indexed).')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {indexed} jobs in {elapsed:.1f}s ({indexed / max(elapsed, 1e-6):.0f} docs/s).'
+        ))
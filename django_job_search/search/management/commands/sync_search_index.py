@@ -0,0 +1,66 @@
+"""
+This module defines a Django management command that syncs recorded job changes with Elasticsearch.
+
+Saving jobs, organizations, degrees and locations only records the changed objects
+in the sync queue. This command runs as a background worker which periodically
+flushes the queue, indexing or deleting the changed jobs with bulk requests.
+
+The 'handle' method is the entry point for the command.
+"""
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from search.sync import flush
+
+
+class Command(BaseCommand):
+    """
+    Django management command to flush the search sync queue to Elasticsearch.
+    """
+    help = 'Sync recorded job changes with Elasticsearch in bulk, once or continuously.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=settings.ELASTICSEARCH_SYNC_INTERVAL,
+            help='Seconds to wait between flushes of the queue.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.ELASTICSEARCH_SYNC_BATCH_SIZE,
+            help='Number of jobs fetched per query and sent per bulk request.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Flush the queue once and exit.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        Flushes the queue every `--interval` seconds until interrupted.
+        A failed flush is logged and retried, as the changes are put back into the queue.
+        """
+        if options['batch_size'] < 1 or options['interval'] <= 0:
+            raise CommandError('--batch-size and --interval must be positive.')
+
+        while True:
+            try:
+                indexed, deleted = flush(batch_size=options['batch_size'])
+            except Exception as error:
+                if options['once']:
+                    raise CommandError(f'Failed to sync jobs with Elasticsearch: {error}')
+                self.stderr.write(f'Failed to sync jobs with Elasticsearch: {error}')
+            else:
+                if indexed or deleted or options['once']:
+                    self.stdout.write(f'Synced jobs with Elasticsearch: {indexed} indexed, {deleted} deleted.')
+
+            if options['once']:
+                return
+            time.sleep(options['interval'])
@@ -28,3 +28,11 @@ class JobDocumentSerializer(DocumentSerializer):
             'date_added',
             'date_updated',
         )
+
+
+class JobTitleSuggestQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of the suggest action of JobDocumentViewSet."""
+    q = serializers.CharField(required=False, allow_blank=True, default='')
+    job_type = serializers.ListField(child=serializers.CharField(), required=False)
+    location = serializers.ListField(child=serializers.IntegerField(), required=False)
+    size = serializers.IntegerField(min_value=1, max_value=50, default=10)
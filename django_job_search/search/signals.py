@@ -1,28 +1,75 @@
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
+"""
+This module defines the signal processor which keeps the jobs index in sync.
 
-from django_elasticsearch_dsl.registries import registry
+Instead of sending a request to Elasticsearch on every save, changes of jobs
+and of the organizations, degrees and locations they embed are recorded
+in the sync queue (see search.sync) after the transaction commits.
+The queue is flushed in bulk by the sync_search_index command.
+"""
+from functools import partial
 
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django_elasticsearch_dsl.signals import BaseSignalProcessor
 
-@receiver(post_save)
-def update_document(sender, **kwargs):
-    app_label = sender._meta.app_label
-    model_name = sender._meta.model_name
-    instance = kwargs['instance']
+from job_search.models import Job, Organization, Degree, Location
+from job_search.signals import jobs_bulk_created
+from search import sync
 
-    if app_label == 'job_search' and model_name == 'job':
-        instances = instance.article.all()
-        for _instance in instances:
-            registry.update(_instance)
+SYNCED_MODELS = (Job, Organization, Degree, Location)
 
 
-@receiver(post_delete)
-def delete_document(sender, **kwargs):
-    app_label = sender._meta.app_label
-    model_name = sender._meta.model_name
-    instance = kwargs['instance']
+class DeferredSignalProcessor(BaseSignalProcessor):
+    """Record changes of the indexed models in the sync queue once they are committed."""
 
-    if app_label == 'job_search' and model_name == 'job':
-        instances = instance.article.all()
-        for _instance in instances:
-            registry.update(_instance)
+    @staticmethod
+    def enqueue(model, pks, action=sync.INDEX):
+        transaction.on_commit(partial(sync.enqueue, model, list(pks), action))
+
+    def setup(self):
+        for model in SYNCED_MODELS:
+            post_save.connect(self.handle_save, sender=model)
+        post_delete.connect(self.handle_delete, sender=Job)
+        pre_delete.connect(self.handle_pre_delete, sender=Location)
+        m2m_changed.connect(self.handle_m2m_changed, sender=Job.locations.through)
+        jobs_bulk_created.connect(self.handle_bulk_create, sender=Job)
+
+    def teardown(self):
+        for model in SYNCED_MODELS:
+            post_save.disconnect(self.handle_save, sender=model)
+        post_delete.disconnect(self.handle_delete, sender=Job)
+        pre_delete.disconnect(self.handle_pre_delete, sender=Location)
+        m2m_changed.disconnect(self.handle_m2m_changed, sender=Job.locations.through)
+        jobs_bulk_created.disconnect(self.handle_bulk_create, sender=Job)
+
+    def handle_save(self, sender, instance, **kwargs):
+        """Reindex the job, or the jobs which embed the saved object."""
+        self.enqueue(sender, [instance.pk])
+
+    def handle_delete(self, sender, instance, **kwargs):
+        """Delete the job from the index."""
+        self.enqueue(sender, [instance.pk], sync.DELETE)
+
+    def handle_pre_delete(self, sender, instance, **kwargs):
+        """
+        Reindex the jobs of a deleted location.
+        They have to be looked up before the location links are deleted.
+        """
+        self.enqueue(Job, instance.jobs.values_list('pk', flat=True))
+
+    def handle_m2m_changed(self, sender, instance, action, reverse, pk_set, **kwargs):
+        """Reindex the jobs whose locations were changed."""
+        if not reverse:
+            if action in ('post_add', 'post_remove', 'post_clear'):
+                self.enqueue(Job, [instance.pk])
+        elif action == 'pre_clear':
+            # The cleared jobs are unknown once the links are deleted.
+            instance._search_sync_cleared_job_ids = list(instance.jobs.values_list('pk', flat=True))
+        elif action == 'post_clear':
+            self.enqueue(Job, instance.__dict__.pop('_search_sync_cleared_job_ids', []))
+        elif action in ('post_add', 'post_remove'):
+            self.enqueue(Job, pk_set)
+
+    def handle_bulk_create(self, sender, instances, **kwargs):
+        """Index jobs created with bulk_create()."""
+        self.enqueue(Job, [instance.pk for instance in instances])
@@ -0,0 +1,49 @@
+"""
+This module builds the job title suggestions of the search API.
+
+Titles are suggested by the completion suggester of Elasticsearch from the
+job_title_suggest field of JobDocument, an in-memory prefix index (FST) which
+answers without scoring any document. Suggestions are ranked by the weight of
+their job, the day it was added, and duplicate titles are collapsed into the
+suggestion of the newest job.
+
+A context enabled completion field must be queried with contexts, so a query
+without job types asks for all of them.
+"""
+from itertools import product
+
+from job_search.models import JOB_TYPE_CHOICES
+from search.documents import JOB_TYPE_CONTEXT, JOB_TYPE_LOCATION_CONTEXT, get_job_type_location_context
+
+SUGGESTION_NAME = 'job_title'
+
+
+def suggest_job_titles(search, prefix, job_types=(), location_ids=(), size=10):
+    """
+    Return the search of the `size` newest distinct job titles starting with the prefix,
+    of the given job types and in any of the given locations, without search hits.
+    """
+    job_types = list(job_types) or [value for value, _ in JOB_TYPE_CHOICES]
+    if location_ids:
+        contexts = {
+            JOB_TYPE_LOCATION_CONTEXT: [
+                get_job_type_location_context(job_type, location_id)
+                for job_type, location_id in product(job_types, location_ids)
+            ],
+        }
+    else:
+        contexts = {JOB_TYPE_CONTEXT: job_types}
+
+    return search.extra(size=0).source(False).suggest(
+        SUGGESTION_NAME, prefix,
+        completion={'field': 'job_title_suggest', 'size': size, 'skip_duplicates': True, 'contexts': contexts},
+    )
+
+
+def get_job_title_suggestions(response):
+    """Return the id and the title of the job of each suggestion of the response."""
+    suggestions = response.suggest[SUGGESTION_NAME] if 'suggest' in response else []
+    return [
+        {'id': int(option['_id']), 'title': option['text']}
+        for suggestion in suggestions for option in suggestion['options']
+    ]
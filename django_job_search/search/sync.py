@@ -0,0 +1,224 @@
+"""
+This module implements the incremental synchronization of jobs with Elasticsearch.
+
+Changes of the indexed models are recorded in a Redis hash which maps a model label
+and primary key (e.g. `job_search.job:42` or `job_search.organization:3`) to the
+pending action. Recording the same object again overwrites its entry, so a burst
+of edits collapses into a single update per job.
+
+The queue is drained by the sync_search_index command: the pending entries are taken
+atomically, changes of organizations, degrees and locations are expanded to their
+jobs, and the jobs are reindexed or deleted with bulk requests.
+
+While a new versioned index is built by the rebuild_jobs_index command, the queue
+flushes into the index behind the alias, which the new index doesn't see. So every
+change is also recorded in a replay hash of each index being built, registered with
+start_rebuild(), and the rebuild replays them into its index with replay() before
+and after it switches the alias.
+"""
+import logging
+from itertools import islice
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from elasticsearch.helpers import bulk
+
+from job_search.models import Job, Organization, Degree, Location
+from search.documents import JobDocument
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = 'search-sync:pending'
+REBUILDS_KEY = 'search-sync:rebuilds'
+REPLAY_KEY_PREFIX = 'search-sync:replay:'
+
+# KEYS are the pending hash and the set of the indices being built, ARGV the fields and actions
+# of the entries. The entries are also recorded in the replay hash of every index being built.
+ENQUEUE_SCRIPT = f"""
+local indices = redis.call('SMEMBERS', KEYS[2])
+for index = 1, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[index], ARGV[index + 1])
+    for _, rebuild in ipairs(indices) do
+        redis.call('HSET', '{REPLAY_KEY_PREFIX}' .. rebuild, ARGV[index], ARGV[index + 1])
+    end
+end
+"""
+
+INDEX = 'index'
+DELETE = 'delete'
+
+
+class SyncError(Exception):
+    """Elasticsearch rejected the actions of some jobs, given as a {job id: action} dict."""
+
+    def __init__(self, failed, errors):
+        self.failed = failed
+        super().__init__(f'Failed to sync {len(failed)} jobs with Elasticsearch: {errors[:5]}')
+
+
+def get_key(model, pk):
+    return f'{model._meta.label_lower}:{pk}'
+
+
+def get_replay_key(index):
+    return f'{REPLAY_KEY_PREFIX}{index}'
+
+
+def enqueue(model, pks, action=INDEX):
+    """
+    Record that the objects of the model with the given primary keys need to be synced,
+    in the queue and in the replay hashes of the indices being built, in one round trip.
+    """
+    args = [value for pk in pks for value in (get_key(model, pk), action)]
+    if args:
+        connection = get_redis_connection()
+        connection.register_script(ENQUEUE_SCRIPT)(keys=[PENDING_KEY, REBUILDS_KEY], args=args)
+
+
+def start_rebuild(index):
+    """
+    Record the changes which are committed from now on for a replay into the index being built.
+    Must be called before the jobs are read for the index.
+    """
+    get_redis_connection().sadd(REBUILDS_KEY, index)
+
+
+def finish_rebuild(index):
+    """Stop recording changes for the index, whose recorded changes are still to be replayed."""
+    get_redis_connection().srem(REBUILDS_KEY, index)
+
+
+def abort_rebuild(index):
+    """Stop recording changes for the index and drop its recorded changes."""
+    pipeline = get_redis_connection().pipeline(transaction=True)
+    pipeline.srem(REBUILDS_KEY, index)
+    pipeline.delete(get_replay_key(index))
+    pipeline.execute()
+
+
+def take_pending(key=PENDING_KEY):
+    """Atomically remove and return all pending entries as a {(label, pk): action} dict."""
+    pipeline = get_redis_connection().pipeline(transaction=True)
+    pipeline.hgetall(key)
+    pipeline.delete(key)
+    entries, _ = pipeline.execute()
+
+    pending = {}
+    for key, action in entries.items():
+        label, pk = key.decode().rsplit(':', 1)
+        pending[label, int(pk)] = action.decode()
+    return pending
+
+
+def requeue(pending, key=PENDING_KEY):
+    """Put entries back into the queue unless they were recorded again in the meantime."""
+    if not pending:
+        return
+
+    pipeline = get_redis_connection().pipeline(transaction=False)
+    for (label, pk), action in pending.items():
+        pipeline.hsetnx(key, f'{label}:{pk}', action)
+    pipeline.execute()
+
+
+def get_job_actions(pending):
+    """Expand the pending entries to a {job id: action} dict."""
+    job_actions = {}
+    related_ids = {}
+    for (label, pk), action in pending.items():
+        if label == Job._meta.label_lower:
+            job_actions[pk] = action
+        else:
+            related_ids.setdefault(label, set()).add(pk)
+
+    lookups = {
+        Organization._meta.label_lower: 'organization_id__in',
+        Degree._meta.label_lower: 'degree_id__in',
+        Location._meta.label_lower: 'locations__in',
+    }
+    for label, pks in related_ids.items():
+        if label not in lookups:
+            logger.warning('Ignoring pending search sync entries of unknown model %s', label)
+            continue
+
+        job_ids = Job.objects.filter(**{lookups[label]: pks}).values_list('pk', flat=True).distinct()
+        for job_id in job_ids.iterator():
+            job_actions.setdefault(job_id, INDEX)
+
+    return job_actions
+
+
+def sync_jobs(job_actions, index=None, batch_size=None):
+    """
+    Send the pending actions of the jobs to Elasticsearch in bulk requests.
+
+    Jobs to index which no longer exist are deleted from the index.
+    Returns a tuple of the numbers of indexed and deleted documents. Raises SyncError
+    after all the batches were sent if Elasticsearch rejected some of the actions.
+    """
+    batch_size = batch_size or settings.ELASTICSEARCH_SYNC_BATCH_SIZE
+    document = JobDocument()
+    client = document._get_connection()
+    index = index or JobDocument._index._name
+
+    indexed = deleted = 0
+    failed, all_errors = {}, []
+    job_ids = iter(sorted(job_actions))
+    while batch := list(islice(job_ids, batch_size)):
+        to_index = [pk for pk in batch if job_actions[pk] == INDEX]
+        jobs = list(document.get_queryset().filter(pk__in=to_index)) if to_index else []
+        found = {job.pk for job in jobs}
+        to_delete = [pk for pk in batch if pk not in found]
+
+        actions = [document._prepare_action(job, INDEX) for job in jobs]
+        actions += [{'_op_type': DELETE, '_id': pk} for pk in to_delete]
+        for action in actions:
+            action['_index'] = index
+
+        _, errors = bulk(client, actions, raise_on_error=False, raise_on_exception=True)
+        # Deleting a document which was never indexed is not an error.
+        errors = [error for error in errors if error.get(DELETE, {}).get('status') != 404]
+        for error in errors:
+            (op_type, item), = error.items()
+            failed[int(item['_id'])] = DELETE if op_type == DELETE else INDEX
+        all_errors += errors
+
+        indexed += len([job for job in jobs if job.pk not in failed])
+        deleted += len([pk for pk in to_delete if pk not in failed])
+
+    if failed:
+        raise SyncError(failed, all_errors)
+    return indexed, deleted
+
+
+def flush(index=None, batch_size=None, key=PENDING_KEY, requeue_key=None):
+    """
+    Sync all pending changes with Elasticsearch.
+
+    If Elasticsearch can't be reached, the changes are put back into the queue, or into
+    `requeue_key`, and if it rejects some of the jobs, the changes of those jobs are.
+    Returns a tuple of the numbers of indexed and deleted documents.
+    """
+    requeue_key = requeue_key or key
+    pending = take_pending(key)
+    if not pending:
+        return 0, 0
+
+    try:
+        return sync_jobs(get_job_actions(pending), index=index, batch_size=batch_size)
+    except SyncError as error:
+        logger.error('%s', error)
+        requeue({(Job._meta.label_lower, pk): action for pk, action in error.failed.items()}, requeue_key)
+        raise
+    except Exception:
+        requeue(pending, requeue_key)
+        raise
+
+
+def replay(index, batch_size=None, requeue_key=None):
+    """
+    Sync the changes recorded for the index being built with it, see start_rebuild().
+    Changes which fail are kept for the next replay, or put into `requeue_key`.
+    Returns a tuple of the numbers of indexed and deleted documents.
+    """
+    return flush(index=index, batch_size=batch_size, key=get_replay_key(index), requeue_key=requeue_key)
@@ -2,15 +2,36 @@ from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 
+from job_search.performance import _event_loop_cleanups
+from job_search.tests.base import requires_elasticsearch
+from search.async_views import close_async_client
+
 
 class JobSearchURLsTestCase(TestCase):
     def setUp(self):
         self.client = APIClient()
 
+    @requires_elasticsearch
     def test_urls_are_correctly_configured(self):
         response = self.client.get(reverse('job_search:search:job-list'))
         self.assertEqual(response.status_code, 200)
 
     def test_urls_handle_nonexistent_endpoints(self):
         response = self.client.get('/search/nonexistent/')
-        self.assertEqual(response.status_code, 404)
\ No newline at end of file
+        self.assertEqual(response.status_code, 404)
+
+class AsyncJobSearchTestCase(TestCase):
+    @requires_elasticsearch
+    async def test_search(self):
+        try:
+            response = await self.async_client.get(
+                reverse('job_search:search:async-job-list'), {'search': 'engineer', 'jobType': 'Full-time'},
+            )
+        finally:
+            await close_async_client()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {'count', 'next', 'previous', 'results'})
+
+    def test_client_is_closed_by_the_performance_budget_suite(self):
+        self.assertIn(close_async_client, _event_loop_cleanups)
@@ -0,0 +1,117 @@
+import io
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from job_search.models import Location, Job
+from job_search.tests.base import JobTestCase, requires_elasticsearch
+from search.indexing import bulk_index_jobs, get_index, get_alias_indices, get_versioned_indices, iter_job_chunks
+
+
+@requires_elasticsearch
+class ReindexJobsCommandTestCase(JobTestCase):
+    index_name = 'test_reindex_jobs'
+
+    def setUp(self):
+        super().setUp()
+        locations = [Location.objects.create(name=f'Location {i}') for i in range(3)]
+        for i in range(7):
+            self.create_job(f'Software Engineer {i}', locations=locations[:i % 3 + 1])
+
+        self.addCleanup(get_index(self.index_name).delete, ignore_unavailable=True)
+
+    def test_iter_jobs_fetches_related_objects_per_chunk(self):
+        with CaptureQueriesContext(connection) as context:
+            chunks = list(iter_job_chunks(chunk_size=2))
+
+        # 4 chunks of jobs with their locations, and the empty chunk which ends the iteration.
+        # Queries which silk runs to profile requests in DEBUG mode are not counted.
+        queries = [
+            query for query in context.captured_queries
+            if 'silk_' not in query['sql'] and not query['sql'].startswith('EXPLAIN')
+        ]
+        self.assertEqual(len(queries), 9)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 2, 1])
+        jobs = [job for chunk in chunks for job in chunk]
+        self.assertEqual([job.pk for job in jobs], sorted(Job.objects.values_list('pk', flat=True)))
+        with CaptureQueriesContext(connection) as context:
+            for job in jobs:
+                job.degree.name, job.organization.name, list(job.locations.all())
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_reindex_jobs(self):
+        stdout = io.StringIO()
+        call_command(
+            'reindex_jobs', '--index', self.index_name, '--chunk-size', '3', '--workers', '2', '--refresh',
+            stdout=stdout,
+        )
+
+        self.assertIn('Indexed 7 jobs', stdout.getvalue())
+        index = get_index(self.index_name)
+        self.assertEqual(index.search().count(), 7)
+
+
+@requires_elasticsearch
+class RebuildJobsIndexCommandTestCase(JobTestCase):
+    alias = 'test_rebuild_jobs'
+
+    def setUp(self):
+        super().setUp()
+        for i in range(3):
+            self.create_job(f'Software Engineer {i}')
+
+        self.addCleanup(self.delete_indices)
+
+    def delete_indices(self):
+        for index in [*get_versioned_indices(self.alias), self.alias]:
+            get_index(index).delete(ignore_unavailable=True)
+
+    def rebuild(self, *args):
+        call_command('rebuild_jobs_index', '--alias', self.alias, *args, stdout=io.StringIO())
+
+    def test_rebuild_switches_alias_and_prunes_old_indices(self):
+        self.rebuild()
+        first_indices = get_alias_indices(self.alias)
+        self.assertEqual(len(first_indices), 1)
+
+        self.rebuild()
+        self.rebuild('--keep', '2')
+        alias_indices = get_alias_indices(self.alias)
+        versioned_indices = get_versioned_indices(self.alias)
+
+        self.assertEqual(len(alias_indices), 1)
+        self.assertEqual(versioned_indices[-1], alias_indices[0])
+        self.assertEqual(len(versioned_indices), 2)
+        self.assertNotIn(first_indices[0], versioned_indices)
+        self.assertEqual(get_index(self.alias).search().count(), 3)
+
+    def test_changes_during_the_build_are_replayed(self):
+        job, deleted_job = Job.objects.all()[:2]
+
+        def bulk_index_and_change_jobs(*args, **kwargs):
+            result = bulk_index_jobs(*args, **kwargs)
+            with self.captureOnCommitCallbacks(execute=True):
+                job.title = 'Backend Engineer'
+                job.save()
+                deleted_job.delete()
+            return result
+
+        with mock.patch(
+            'search.management.commands.rebuild_jobs_index.bulk_index_jobs', side_effect=bulk_index_and_change_jobs,
+        ):
+            self.rebuild()
+
+        self.assertEqual(get_index(self.alias).search().count(), 2)
+        client = get_index(self.alias)._get_connection()
+        self.assertEqual(client.get(index=self.alias, id=job.pk)['_source']['job_title'], 'Backend Engineer')
+
+    def test_rebuild_replaces_legacy_physical_index(self):
+        get_index(self.alias).create()
+
+        self.rebuild()
+
+        self.assertEqual(len(get_alias_indices(self.alias)), 1)
+        self.assertEqual(get_index(self.alias).search().count(), 3)
@@ -0,0 +1,64 @@
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from search.async_views import AsyncJobSearchView
+from search.documents import JobDocument
+from search.views import JobDocumentViewSet
+
+
+class JobDocumentMappingTestCase(TestCase):
+    def test_filter_and_sort_fields_are_keywords(self):
+        properties = JobDocument._doc_type.mapping.to_dict()['properties']
+        self.assertEqual(properties['job_title']['fields']['raw'], {'type': 'keyword'})
+        self.assertEqual(properties['job_type'], {'type': 'keyword'})
+        for field in ('degree', 'organization', 'locations'):
+            with self.subTest(field=field):
+                self.assertEqual(properties[field]['properties']['name']['fields']['raw'], {'type': 'keyword'})
+        self.assertEqual(properties['locations']['type'], 'nested')
+        self.assertEqual(properties['date_added'], {'type': 'date', 'doc_values': True})
+
+
+class JobDocumentFilterTestCase(TestCase):
+    params = {
+        'job_type': 'Full-time',
+        'degree': "Bachelor's Degree",
+        'organization': 'GitHub',
+        'locations': 'Kyiv',
+    }
+
+    def get_request(self, params):
+        return Request(APIRequestFactory().get('/', params))
+
+    def get_search(self, params):
+        view = JobDocumentViewSet(action='list', request=self.get_request(params), format_kwarg=None)
+        return view.filter_queryset(view.get_queryset()).to_dict()
+
+    def assertFilterContext(self, query):
+        # Filter clauses don't score the jobs, and Elasticsearch caches their results.
+        self.assertEqual(set(query['bool']), {'filter'})
+        self.assertCountEqual(query['bool']['filter'], [
+            {'terms': {'job_type': ['Full-time']}},
+            {'terms': {'degree.name.raw': ["Bachelor's Degree"]}},
+            {'terms': {'organization.name.raw': ['GitHub']}},
+            {'nested': {'path': 'locations', 'query': {'terms': {'locations.name.raw': ['Kyiv']}}}},
+        ])
+
+    def test_filters_are_filter_clauses(self):
+        self.assertFilterContext(self.get_search(self.params)['query'])
+
+    async def test_async_filters_are_filter_clauses(self):
+        view = AsyncJobSearchView()
+        search = await view.filter_queryset(self.get_request(self.params), view.get_queryset())
+        self.assertFilterContext(search.to_dict()['query'])
+
+    def test_ordering(self):
+        self.assertEqual(self.get_search({})['sort'], ['_score', {'date_added': {'order': 'desc'}}, 'id'])
+        self.assertEqual(self.get_search({'ordering': 'date_added'})['sort'], [{'date_added': {'order': 'asc'}}])
+
+    async def test_async_ordering_matches_viewset(self):
+        view = AsyncJobSearchView()
+        for params in ({}, {'ordering': 'date_added'}, {'ordering': ['-id', 'date_added']}, {'ordering': 'title'}):
+            with self.subTest(params=params):
+                search = await view.filter_queryset(self.get_request(params), view.get_queryset())
+                self.assertEqual(search.to_dict()['sort'], self.get_search(params)['sort'])
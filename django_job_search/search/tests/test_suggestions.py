@@ -0,0 +1,74 @@
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from job_search.models import Location
+from job_search.tests.base import JobTestCase, requires_elasticsearch
+from search.documents import JobDocument
+from search.suggestions import suggest_job_titles
+
+
+class JobTitleSuggestionsTestCase(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.job = self.create_job()
+        self.kyiv = Location.objects.create(name='Kyiv')
+        self.lviv = Location.objects.create(name='Lviv')
+
+    def test_completions_are_weighed_by_recency(self):
+        self.job.locations.set([self.kyiv, self.lviv])
+        self.assertEqual(JobDocument().prepare_job_title_suggest(self.job), {
+            'input': ['Software Engineer'],
+            'weight': self.job.date_added.toordinal(),
+            'contexts': {
+                'job_type': ['Full-time'],
+                'job_type_location': [f'Full-time:{self.kyiv.pk}', f'Full-time:{self.lviv.pk}'],
+            },
+        })
+
+        # Newer jobs outweigh older ones.
+        weight = JobDocument().prepare_job_title_suggest(self.job)['weight']
+        self.job.date_added = self.job.date_added.replace(year=2020)
+        self.assertLess(JobDocument().prepare_job_title_suggest(self.job)['weight'], weight)
+
+    def test_job_without_locations(self):
+        self.assertEqual(JobDocument().prepare_job_title_suggest(self.job)['contexts'], {'job_type': ['Full-time']})
+
+    def test_suggest_query(self):
+        suggest = suggest_job_titles(JobDocument.search(), 'eng', size=5).to_dict()
+        self.assertEqual(suggest['size'], 0)
+        self.assertIs(suggest['_source'], False)
+        self.assertEqual(suggest['suggest']['job_title'], {
+            'text': 'eng',
+            'completion': {
+                'field': 'job_title_suggest',
+                'size': 5,
+                'skip_duplicates': True,
+                # Context enabled completions can't be queried without contexts.
+                'contexts': {'job_type': ['Full-time', 'Part-time', 'Intern', 'Temporary']},
+            },
+        })
+
+        # Job types and locations are matched together.
+        suggest = suggest_job_titles(JobDocument.search(), 'eng', ['Intern', 'Temporary'], [1, 2]).to_dict()
+        self.assertEqual(suggest['suggest']['job_title']['completion']['contexts'], {
+            'job_type_location': ['Intern:1', 'Intern:2', 'Temporary:1', 'Temporary:2'],
+        })
+
+    @requires_elasticsearch
+    def test_suggest_endpoint(self):
+        client = APIClient()
+        url = reverse('job_search:search:job-suggest')
+
+        response = client.get(url, {'q': 'eng', 'jobType': 'Full-time', 'location': self.kyiv.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.json()['results'], list)
+
+        self.assertEqual(client.get(url).json(), {'results': []})
+        for params in ({'size': 0}, {'size': 51}, {'size': 'ten'}, {'location': 'Kyiv'}):
+            self.assertEqual(client.get(url, {'q': 'eng', **params}).status_code, 400)
+
+        # Each invalid parameter gets its own error.
+        response = client.get(url, {'q': 'eng', 'size': 'ten', 'location': [self.kyiv.pk, 'Lviv']})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {'size', 'location'})
+        self.assertEqual(set(response.json()['location']), {'1'})
@@ -0,0 +1,168 @@
+from unittest import mock
+
+from django_redis import get_redis_connection
+
+from job_search.models import Location, Job
+from job_search.signals import jobs_bulk_created
+from job_search.tests.base import JobTestCase, requires_elasticsearch
+from search import sync
+from search.indexing import get_index
+from search.sync import bulk as sync_bulk
+
+
+@requires_elasticsearch
+class SearchSyncTestCase(JobTestCase):
+    index_name = 'test_search_sync'
+
+    def setUp(self):
+        super().setUp()
+        get_redis_connection().delete(sync.PENDING_KEY)
+        self.addCleanup(get_redis_connection().delete, sync.PENDING_KEY)
+
+        self.index = get_index(self.index_name)
+        self.index.create()
+        self.addCleanup(self.index.delete, ignore_unavailable=True)
+
+        self.location = Location.objects.create(name='Kyiv')
+        self.job = self.create_job()
+
+    def flush(self):
+        result = sync.flush(index=self.index_name)
+        self.index.refresh()
+        return result
+
+    def get_source(self, job):
+        client = self.index._get_connection()
+        return client.get(index=self.index_name, id=job.pk)['_source']
+
+    def test_changes_are_queued_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            job = self.create_job('Backend Engineer')
+            self.assertEqual(sync.take_pending(), {})
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(sync.take_pending(), {('job_search.job', job.pk): sync.INDEX})
+
+    def test_changes_are_recorded_for_rebuilds(self):
+        sync.start_rebuild(self.index_name)
+        self.addCleanup(sync.abort_rebuild, self.index_name)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.title = 'Backend Engineer'
+            self.job.save()
+
+        # The queue syncs the index behind the alias, the replay the index being built.
+        self.assertEqual(sync.take_pending(), {('job_search.job', self.job.pk): sync.INDEX})
+        self.assertEqual(sync.replay(self.index_name), (1, 0))
+        self.index.refresh()
+        self.assertEqual(self.get_source(self.job)['job_title'], 'Backend Engineer')
+
+        sync.finish_rebuild(self.index_name)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+        self.assertEqual(sync.replay(self.index_name), (0, 0))
+
+    def test_burst_of_edits_is_coalesced(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                self.job.title = f'Software Engineer {i}'
+                self.job.save()
+            self.job.locations.add(self.location)
+
+        self.assertEqual(sync.take_pending(), {('job_search.job', self.job.pk): sync.INDEX})
+
+    def test_flush_indexes_and_deletes_jobs(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = self.create_job('Backend Engineer')
+            self.job.locations.add(self.location)
+
+        self.assertEqual(self.flush(), (2, 0))
+        self.assertEqual(self.index.search().count(), 2)
+        self.assertEqual(self.get_source(self.job)['locations'], [{'id': self.location.pk, 'name': 'Kyiv'}])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.delete()
+
+        self.assertEqual(self.flush(), (0, 1))
+        self.assertEqual(self.index.search().count(), 1)
+        self.assertEqual(sync.take_pending(), {})
+
+    def test_related_change_reindexes_its_jobs(self):
+        self.job.locations.add(self.location)
+        self.flush()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.organization.name = 'GitLab'
+            self.organization.save()
+            self.location.name = 'Lviv'
+            self.location.save()
+
+        self.assertEqual(self.flush(), (1, 0))
+        source = self.get_source(self.job)
+        self.assertEqual(source['organization']['name'], 'GitLab')
+        self.assertEqual(source['locations'][0]['name'], 'Lviv')
+
+    def test_deleted_location_reindexes_its_jobs(self):
+        self.job.locations.add(self.location)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.location.delete()
+
+        self.assertEqual(sync.take_pending(), {('job_search.job', self.job.pk): sync.INDEX})
+
+    def test_cleared_location_reindexes_its_jobs(self):
+        self.job.locations.add(self.location)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.location.jobs.clear()
+
+        self.assertEqual(sync.take_pending(), {('job_search.job', self.job.pk): sync.INDEX})
+
+    def test_bulk_created_jobs_are_queued(self):
+        jobs = Job.objects.bulk_create([self.build_job(f'Engineer {i}') for i in range(3)])
+        with self.captureOnCommitCallbacks(execute=True):
+            jobs_bulk_created.send(sender=Job, instances=jobs)
+
+        self.assertEqual(set(sync.take_pending()), {('job_search.job', job.pk) for job in jobs})
+
+    def test_failed_flush_requeues_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+
+        with mock.patch('search.sync.bulk', side_effect=ConnectionError), self.assertRaises(ConnectionError):
+            sync.flush(index=self.index_name)
+
+        self.assertEqual(sync.take_pending(), {('job_search.job', self.job.pk): sync.INDEX})
+
+    def test_rejected_jobs_are_requeued(self):
+        other_job = self.create_job('Backend Engineer')
+        deleted_job = self.create_job('Data Engineer')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+            other_job.save()
+            deleted_job.delete()
+
+        def reject_other_job(client, actions, **kwargs):
+            actions = list(actions)
+            accepted = [action for action in actions if action['_id'] != other_job.pk]
+            sync_bulk(client, accepted, **kwargs)
+            return len(accepted), [
+                {sync.INDEX: {'_id': str(other_job.pk), 'status': 429, 'error': 'es_rejected_execution_exception'}},
+                # Deleting a document which was never indexed is not an error.
+                {sync.DELETE: {'_id': str(deleted_job.pk), 'status': 404}},
+            ]
+
+        with mock.patch('search.sync.bulk', side_effect=reject_other_job), self.assertRaises(sync.SyncError):
+            self.flush()
+        self.assertEqual(self.get_source(self.job)['job_title'], 'Software Engineer')
+        self.assertEqual(sync.take_pending(), {('job_search.job', other_job.pk): sync.INDEX})
+
+        # Rejected replays are kept for the next replay.
+        sync.start_rebuild(self.index_name)
+        self.addCleanup(sync.abort_rebuild, self.index_name)
+        with self.captureOnCommitCallbacks(execute=True):
+            other_job.save()
+        sync.take_pending()
+        with mock.patch('search.sync.bulk', side_effect=reject_other_job), self.assertRaises(sync.SyncError):
+            sync.replay(self.index_name)
+        self.assertEqual(sync.replay(self.index_name), (1, 0))
@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import SimpleRouter
 
+from search.async_views import AsyncJobSearchView
 from search.views import JobDocumentViewSet
 
 router = SimpleRouter()
@@ -8,5 +9,6 @@ router.register('jobs', JobDocumentViewSet, basename='job')
 
 app_name = 'search'
 urlpatterns = [
+    path('async/jobs/', AsyncJobSearchView.as_view(), name='async-job-list'),
     path('', include(router.urls)),
 ]
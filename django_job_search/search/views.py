@@ -1,18 +1,33 @@
-from django_elasticsearch_dsl_drf.viewsets import DocumentViewSet
+from django_elasticsearch_dsl_drf.viewsets import BaseDocumentViewSet
 from django_elasticsearch_dsl_drf.filter_backends import (
     SearchFilterBackend,
     MultiMatchSearchFilterBackend,
     FilteringFilterBackend,
-    SuggesterFilterBackend,
-    FunctionalSuggesterFilterBackend,
+    NestedFilteringFilterBackend,
+    OrderingFilterBackend,
     DefaultOrderingFilterBackend,
 )
+from elasticsearch_dsl import Q
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
 from search.documents import JobDocument
-from search.serializers import JobDocumentSerializer
+from search.serializers import JobDocumentSerializer, JobTitleSuggestQuerySerializer
+from search.suggestions import get_job_title_suggestions, suggest_job_titles
 
 
-class JobDocumentViewSet(DocumentViewSet):
+class NestedFilterContextFilteringBackend(NestedFilteringFilterBackend):
+    """
+    NestedFilteringFilterBackend which adds its nested queries to the filter context,
+    like FilteringFilterBackend, instead of scoring them.
+    """
+
+    @classmethod
+    def apply_filter(cls, queryset, options=None, args=None, kwargs=None):
+        return queryset.filter('nested', path=options['path'], query=Q(*(args or []), **(kwargs or {})))
+
+
+class JobDocumentViewSet(BaseDocumentViewSet):
     document = JobDocument
     serializer_class = JobDocumentSerializer
 
@@ -20,8 +35,8 @@ class JobDocumentViewSet(DocumentViewSet):
         SearchFilterBackend,
         MultiMatchSearchFilterBackend,
         FilteringFilterBackend,
-        SuggesterFilterBackend,
-        FunctionalSuggesterFilterBackend,
+        NestedFilterContextFilteringBackend,
+        OrderingFilterBackend,
         DefaultOrderingFilterBackend,
     ]
 
@@ -47,32 +62,44 @@ class JobDocumentViewSet(DocumentViewSet):
         'job_type': None,
     }
 
+    # Filters match the exact values of the keyword fields, in the filter context:
+    # they don't score the jobs and their results are cached by Elasticsearch.
     filter_fields = {
-        'job_title': 'job_title',
-        'degree': 'job_degree.name',
-        'organization': 'job_organization.name',
-        'locations': 'locations.name',
+        'job_title': 'job_title.raw',
+        'degree': 'degree.name.raw',
+        'organization': 'organization.name.raw',
         'job_type': 'job_type',
-
     }
 
-    suggester_fields = {
-        'job_title_suggest': {
-            'field': 'job_title.suggest',
-            'suggesters': [
-                'job_title_suggest',
-                'job_title_suggest_context',
-            ],
-            'default_suggester': 'job_title_suggest',
+    nested_filter_fields = {
+        'locations': {
+            'field': 'locations.name.raw',
+            'path': 'locations',
         },
     }
 
-    functional_suggester_fields = {
-        'job_title_suggest': {
-            'suggesters': [
-                'job_title_suggest',
-                'job_title_suggest_context',
-            ],
-            'default_suggester': 'job_title_suggest',
-        },
+    ordering_fields = {
+        'date_added': 'date_added',
+        'id': 'id',
     }
+    # The most relevant jobs first, then the newest.
+    ordering = ('_score', '-date_added', 'id')
+
+    @action(detail=False, methods=['get'], url_path='suggest', url_name='suggest')
+    def suggest(self, request):
+        """
+        Suggest the Job titles starting with the `q` parameter, the most recently added Jobs first.
+        The `job_type` and `location` (id) parameters, which may be repeated, narrow down the suggestions.
+        The `size` parameter sets the number of suggestions.
+        """
+        params = JobTitleSuggestQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+
+        if not params['q']:
+            return Response({'results': []})
+
+        search = suggest_job_titles(
+            self.get_queryset(), params['q'], params.get('job_type', []), params.get('location', []), params['size'],
+        )
+        return Response({'results': get_job_title_suggestions(search.execute())})